@@ -1,6 +1,7 @@
 """
 ETL script for loading Netflix / Prime / Hulu / Disney+ CSV catalogs
-into the normalized MySQL schema.
+into the normalized MySQL schema (or, with DB_BACKEND=sqlite, a local
+SQLite file created from documents/database/sqlite_DDL.sql).
 
 Tables expected (already created via your DDL):
 - rating
@@ -22,15 +23,33 @@ import pymysql
 from pymysql import err as pymysql_err
 import pandas as pd
 import re
+import sqlite3
 import argparse
+import functools
+import json
 import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 import os
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Load environment variables from /.env/
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '../', '.env'))
 
+# Reuse the dashboard's rating/genre buckets so catalog_cube matches streamlit/queries.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'streamlit'))
+from buckets import CUBE_ALL_GENRES, GENRE_GROUPS, RATING_G, RATING_PG, RATING_PG13, RATING_R  # noqa: E402
+
 # ===============================
 # 1. DB CONNECTION CONFIG
 # ===============================
@@ -43,6 +62,21 @@ DB_CONFIG = {
     "database": os.getenv("DB_NAME", "streaming_media_db")  # Default to 'streaming_media_db' if not set
 }
 
+# "mysql" (default) or "sqlite": a local database file, created on first connect
+DB_BACKEND = os.getenv("DB_BACKEND", "mysql").strip().lower()
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+# Relative paths are resolved against the project root, as in streamlit/config.py
+SQLITE_PATH = os.path.join(PROJECT_ROOT, os.getenv("DB_SQLITE_PATH", "streaming_media_db.sqlite3"))
+SQLITE_DDL_PATH = os.path.join(PROJECT_ROOT, "documents", "database", "sqlite_DDL.sql")
+
+
+def use_backend(backend, sqlite_path=None):
+    """Switch the backend (and SQLite file) for this run, e.g. from --backend / --sqlite-path."""
+    global DB_BACKEND, SQLITE_PATH
+    DB_BACKEND = backend
+    if sqlite_path:
+        SQLITE_PATH = os.path.abspath(sqlite_path)
+
 # ===============================
 # 1b. LENGTH CONSTRAINTS (from DDL)
 # ===============================
@@ -64,6 +98,123 @@ MAX_LENGTHS = {
 }
 
 BATCH_SIZE = int(os.getenv("ETL_BATCH_SIZE", "500"))
+# Parallel transform: worker processes, and rows per CSV chunk handed to a worker
+WORKERS = int(os.getenv("ETL_WORKERS", "1"))
+CHUNK_ROWS = int(os.getenv("ETL_CHUNK_ROWS", "5000"))
+# Checkpointed loads: commit (and record progress) every N chunks; 0 keeps one transaction
+COMMIT_EVERY = int(os.getenv("ETL_COMMIT_EVERY", "0"))
+
+# ===============================
+# 1c. SQLITE BACKEND
+# ===============================
+# The ETL's SQL is written for MySQL. For SQLite, SQLiteConnection hands out
+# pymysql-style cursors that rewrite the few MySQL-only spellings the ETL
+# uses; statements that need a different shape (joined UPDATE/DELETE, date
+# math, table listing) branch on DB_BACKEND where they are built.
+
+# Errors a statement can raise on either backend
+DB_ERRORS = (pymysql_err.MySQLError, sqlite3.Error)
+
+_SQLITE_REWRITES = [
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.IGNORECASE), "INSERT OR IGNORE"),
+    (re.compile(r"\bCREATE\s+TEMPORARY\s+TABLE\s+(\w+)\s+SELECT\b", re.IGNORECASE), r"CREATE TEMP TABLE \1 AS SELECT"),
+    (re.compile(r"\bDROP\s+TEMPORARY\s+TABLE\b", re.IGNORECASE), "DROP TABLE"),
+    (re.compile(r"\bNOW\(\)", re.IGNORECASE), "datetime('now', 'localtime')"),
+]
+_ON_DUPLICATE_KEY_UPDATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.IGNORECASE)
+_VALUES_REFERENCE = re.compile(r"\bVALUES\((\w+)\)", re.IGNORECASE)
+# A quoted string literal, or a pymysql %s placeholder outside one
+_PLACEHOLDER_OR_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|%s")
+SQLITE_MAX_INT = 2 ** 63 - 1
+
+
+@functools.lru_cache(maxsize=256)
+def to_sqlite_sql(sql):
+    """
+    Rewrite one of the ETL's MySQL statements for SQLite.
+
+    Only %s placeholders outside quoted literals become ?. pymysql formats
+    every %s in a statement it is given parameters for, so the ETL's SQL must
+    never contain a literal %s anyway; pass such text as a parameter instead.
+    """
+    for pattern, replacement in _SQLITE_REWRITES:
+        sql = pattern.sub(replacement, sql)
+
+    upsert = _ON_DUPLICATE_KEY_UPDATE.search(sql)
+    if upsert:
+        # Without a conflict target SQLite (3.35+) applies the update to any unique key, like MySQL.
+        # VALUES(col) only means "the inserted value" in the UPDATE list, so only that part is rewritten.
+        sql = (sql[:upsert.start()] + "ON CONFLICT DO UPDATE SET"
+               + _VALUES_REFERENCE.sub(r"excluded.\1", sql[upsert.end():]))
+
+    return _PLACEHOLDER_OR_LITERAL.sub(lambda m: "?" if m.group() == "%s" else m.group(), sql)
+
+
+def _sqlite_value(value):
+    if hasattr(value, "item"):  # numpy scalars from pandas frames
+        value = value.item()
+    if isinstance(value, int) and value > SQLITE_MAX_INT:
+        # BIGINT UNSIGNED values (row_hash) are stored as their signed 64-bit equivalent
+        return value - 2 ** 64
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _sqlite_params(args):
+    if args is None:
+        return ()
+    return [_sqlite_value(v) for v in args]
+
+
+class SQLiteCursor:
+    """sqlite3 cursor behind the pymysql cursor interface the ETL uses."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, args=None):
+        self._cursor.execute(to_sqlite_sql(sql), _sqlite_params(args))
+        return self._cursor.rowcount
+
+    def executemany(self, sql, args):
+        self._cursor.executemany(to_sqlite_sql(sql), (_sqlite_params(a) for a in args))
+        return self._cursor.rowcount
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class SQLiteConnection:
+    """sqlite3 connection behind the pymysql connection interface; creates the schema if needed."""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        # WAL lets the dashboard keep reading while a load is writing
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with open(SQLITE_DDL_PATH, encoding="utf-8") as handle:
+            self._conn.executescript(handle.read())
+
+    def cursor(self):
+        return SQLiteCursor(self._conn.cursor())
+
+    def autocommit(self, enabled):
+        # None: every statement commits; "": sqlite3 opens a transaction before each write
+        self._conn.isolation_level = None if enabled else ""
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
 
 def safe_truncate(s, max_len):
     if s is None:
@@ -95,17 +246,199 @@ CSV_FILES = [
     }
 ]
 
+
+def use_source_dir(directory):
+    """Read the same-named CSVs from `directory` instead (e.g. generate_synthetic_catalog.py output)."""
+    for cfg in CSV_FILES:
+        cfg["path"] = os.path.join(directory, os.path.basename(cfg["path"]))
+
+
+# ===============================
+# 2b. RUN PROFILING
+# ===============================
+
+# First table named by a statement: INSERT INTO t, UPDATE t, FROM t, [LOAD DATA ... INTO] TABLE t
+SQL_TABLE_RE = re.compile(
+    r"\b(?:INTO|UPDATE|FROM|TABLE)\s+(?:TABLE\s+)?(?:IF\s+(?:NOT\s+)?EXISTS\s+)?`?(\w+)", re.IGNORECASE
+)
+
+
+class RunProfile:
+    """
+    Wall time per ETL stage, SQL statements/round-trips per table and source
+    row counts for one run. Stages nest; each stage is charged only for the
+    time not spent in a nested stage, so the stage times add up to the run.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, options=None):
+        self.options = dict(options or {})
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        self.rows_read = 0
+        self.stages = {}  # stage -> [seconds, calls]
+        self.sql = {}     # table -> [statements, round_trips, seconds]
+        self._stack = []  # [stage, resumed_at]
+
+    def _charge_current(self):
+        if self._stack:
+            now = time.perf_counter()
+            top = self._stack[-1]
+            self.stages.setdefault(top[0], [0.0, 0])[0] += now - top[1]
+            top[1] = now
+
+    @contextmanager
+    def stage(self, name):
+        self._charge_current()
+        self.stages.setdefault(name, [0.0, 0])[1] += 1
+        self._stack.append([name, time.perf_counter()])
+        try:
+            yield
+        finally:
+            self._charge_current()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = time.perf_counter()
+
+    def timed_iter(self, name, iterable):
+        """Charge the time spent producing each item (e.g. reading a CSV chunk) to `name`."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                item = next(iterator, StopIteration)
+            if item is StopIteration:
+                return
+            yield item
+
+    def record_sql(self, sql, round_trips, seconds):
+        match = SQL_TABLE_RE.search(sql)
+        entry = self.sql.setdefault(match.group(1).lower() if match else "(other)", [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += round_trips
+        entry[2] += seconds
+
+    def report(self, status="SUCCESS", workers=1):
+        """The run as a JSON-serializable dict."""
+        wall = time.perf_counter() - self.started
+        staged = sum(seconds for seconds, _ in self.stages.values())
+        stages = {
+            name: {"seconds": round(seconds, 4), "calls": calls, "share": round(seconds / wall, 4) if wall else 0.0}
+            for name, (seconds, calls) in sorted(self.stages.items(), key=lambda kv: -kv[1][0])
+        }
+        stages["other"] = {"seconds": round(max(wall - staged, 0.0), 4), "calls": 0,
+                           "share": round(max(wall - staged, 0.0) / wall, 4) if wall else 0.0}
+        sql = {
+            table: {"statements": statements, "round_trips": round_trips, "seconds": round(seconds, 4)}
+            for table, (statements, round_trips, seconds) in sorted(self.sql.items())
+        }
+        worker_peak = peak_memory_mb(resource.RUSAGE_CHILDREN) if workers > 1 and resource else None
+        return {
+            "status": status,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "options": self.options,
+            "wall_seconds": round(wall, 3),
+            "rows_read": self.rows_read,
+            "rows_per_second": round(self.rows_read / wall, 1) if wall else None,
+            "stages": stages,
+            "sql": sql,
+            "sql_totals": {
+                "statements": sum(v["statements"] for v in sql.values()),
+                "round_trips": sum(v["round_trips"] for v in sql.values()),
+            },
+            "caches": {name: cache.stats() for name, cache in LOOKUP_CACHES.items()},
+            "table_writes": table_writer.stats_report(),
+            "peak_memory_mb": round(peak_memory_mb(), 1) if resource else None,
+            "worker_peak_memory_mb": round(worker_peak, 1) if worker_peak else None,
+        }
+
+
+run_profile = RunProfile()
+
+
+def profiled(stage_name):
+    """Decorator charging every call of the function to `stage_name`."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with run_profile.stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class ProfiledCursor:
+    """Wraps a pymysql cursor and records each statement in run_profile."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, args=None):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(sql, args)
+        finally:
+            run_profile.record_sql(sql, 1, time.perf_counter() - started)
+
+    def executemany(self, sql, args):
+        args = list(args)
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(sql, args)
+        finally:
+            # pymysql folds INSERT ... VALUES batches into multi-row statements; anything else is a loop
+            round_trips = 1 if pymysql.cursors.RE_INSERT_VALUES.match(sql) else len(args)
+            run_profile.record_sql(sql, round_trips, time.perf_counter() - started)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class LookupCache(dict):
+    """dict that counts membership tests, i.e. cache hits and misses."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        found = super().__contains__(key)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None}
+
+
 # ===============================
 # 3. CACHES TO REDUCE QUERIES
 # ===============================
 
-rating_cache = {}
-service_cache = {}
-genre_cache = {}
-country_cache = {}
-role_type_cache = {}
-person_cache = {}
-title_cache = {}  # key: (global_title_name, release_year) -> title_id
+rating_cache = LookupCache()
+service_cache = LookupCache()
+genre_cache = LookupCache()
+country_cache = LookupCache()
+role_type_cache = LookupCache()
+person_cache = LookupCache()
+title_cache = LookupCache()  # key: (global_title_name, release_year) -> title_id
+
+LOOKUP_CACHES = {
+    "rating_cache": rating_cache,
+    "service_cache": service_cache,
+    "genre_cache": genre_cache,
+    "country_cache": country_cache,
+    "role_type_cache": role_type_cache,
+    "person_cache": person_cache,
+    "title_cache": title_cache,
+}
 
 
 def preload_reference_data(cursor):
@@ -119,7 +452,7 @@ def preload_reference_data(cursor):
             if code:
                 rating_cache[code] = True
         summary.append(f"rating={len(rows)}")
-    except pymysql_err.MySQLError:
+    except DB_ERRORS:
         pass
 
     try:
@@ -130,7 +463,7 @@ def preload_reference_data(cursor):
             if norm:
                 service_cache[norm] = sid
         summary.append(f"service={len(rows)}")
-    except pymysql_err.MySQLError:
+    except DB_ERRORS:
         pass
 
     try:
@@ -141,7 +474,7 @@ def preload_reference_data(cursor):
             if norm:
                 genre_cache[norm] = gid
         summary.append(f"genre={len(rows)}")
-    except pymysql_err.MySQLError:
+    except DB_ERRORS:
         pass
 
     try:
@@ -152,7 +485,7 @@ def preload_reference_data(cursor):
             if norm:
                 country_cache[norm] = cid
         summary.append(f"country={len(rows)}")
-    except pymysql_err.MySQLError:
+    except DB_ERRORS:
         pass
 
     try:
@@ -163,20 +496,33 @@ def preload_reference_data(cursor):
             if norm:
                 role_type_cache[norm] = rid
         summary.append(f"role_type={len(rows)}")
-    except pymysql_err.MySQLError:
+    except DB_ERRORS:
         pass
 
     if summary:
         print("Cache warmup:", ", ".join(summary))
 
 
-def update_title_description_if_empty(cursor, title_id, description):
-    if not description:
+@profiled("title_upsert")
+def flush_title_description_batch(cursor, batch):
+    """Fill still-NULL descriptions from a {title_id: description} batch with one joined UPDATE."""
+    if not batch:
         return
-    cursor.execute(
-        "UPDATE title SET description = %s WHERE title_id = %s AND description IS NULL",
-        (description, title_id)
-    )
+    fill_null_column(cursor, "title", "title_id", "description", batch.items())
+    batch.clear()
+
+
+@profiled("title_upsert")
+def flush_subtype_batches(cursor, movie_batch, tv_show_batch):
+    insert_rows(cursor, "movie", ["title_id", "movie_runtime_minutes"], movie_batch)
+    insert_rows(cursor, "tv_show", ["title_id", "total_seasons"], tv_show_batch)
+    movie_batch.clear()
+    tv_show_batch.clear()
+
+
+# Column order of build_streaming_availability_row tuples
+AVAILABILITY_COLUMNS = ["streaming_service_id", "title_id", "platform_show_id", "date_added", "duration_raw",
+                        "is_exclusive", "availability_status"]
 
 
 def build_streaming_availability_row(streaming_service_id, title_id, platform_show_id,
@@ -195,18 +541,9 @@ def build_streaming_availability_row(streaming_service_id, title_id, platform_sh
     )
 
 
+@profiled("availability_flush")
 def flush_streaming_availability_batch(cursor, batch):
-    if not batch:
-        return
-    cursor.executemany(
-        """
-        INSERT IGNORE INTO streaming_availability
-            (streaming_service_id, title_id, platform_show_id,
-             date_added, duration_raw, is_exclusive, availability_status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """,
-        batch
-    )
+    insert_rows(cursor, "streaming_availability", AVAILABILITY_COLUMNS, batch)
     batch.clear()
 
 
@@ -214,55 +551,43 @@ def flush_streaming_availability_batch(cursor, batch):
 # 4. HELPER FUNCTIONS
 # ===============================
 
-def get_connection():
-    return pymysql.connect(charset="utf8mb4", cursorclass=pymysql.cursors.Cursor, **DB_CONFIG)
-
-
-def normalize_string(s):
-    if pd.isna(s):
-        return None
-    s = str(s).strip()
-    return s if s else None
+def get_connection(local_infile=False):
+    if DB_BACKEND == "sqlite":
+        return SQLiteConnection(SQLITE_PATH)
+    return pymysql.connect(charset="utf8mb4", cursorclass=pymysql.cursors.Cursor,
+                           local_infile=local_infile, **DB_CONFIG)
 
 
-def parse_date(date_str):
-    """Parse date_added like 'September 9, 2019' into YYYY-MM-DD or None."""
-    if pd.isna(date_str) or not str(date_str).strip():
-        return None
-    try:
-        dt = pd.to_datetime(date_str, errors="coerce")
-        if pd.isna(dt):
-            return None
-        return dt.date()
-    except Exception:
+def peak_memory_mb(who=None):
+    """Peak resident set size in MB (this process, or its largest child), or None where unavailable."""
+    if resource is None:
         return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is kilobytes on Linux but bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
 
 
-def parse_duration_for_title(content_type, duration_raw):
-    """
-    duration_raw examples:
-        '90 min'            -> (runtime_minutes=90, num_seasons=None)
-        '2 Seasons'         -> (runtime_minutes=None, num_seasons=2)
-    """
-    if pd.isna(duration_raw) or not str(duration_raw).strip():
-        return (None, None)
+def report_peak_memory(workers=1):
+    peak = peak_memory_mb()
+    if peak is None:
+        print("Peak memory: not available on this platform.")
+        return
+    print(f"Peak memory (RSS): {peak:.1f} MB")
+    if workers > 1:
+        worker_peak = peak_memory_mb(resource.RUSAGE_CHILDREN)
+        print(f"Peak memory of largest worker process (RSS): {worker_peak:.1f} MB")
 
-    text = str(duration_raw).strip()
-    # Extract first integer
-    match = re.search(r"(\d+)", text)
-    if not match:
-        return (None, None)
 
-    value = int(match.group(1))
-    if content_type.upper() == "MOVIE":
-        return (value, None)
-    else:
-        # For TV Shows, assume it's seasons
-        return (None, value)
+def normalize_string(s):
+    if pd.isna(s):
+        return None
+    s = str(s).strip()
+    return s if s else None
 
 
 # ---------- DB lookups / inserts with caching ----------
 
+@profiled("dimension_upsert")
 def get_or_create_streaming_service(cursor, service_name):
     service_name_norm = safe_truncate(normalize_string(service_name), MAX_LENGTHS["service_name"])
     if service_name_norm in service_cache:
@@ -289,6 +614,7 @@ def get_or_create_streaming_service(cursor, service_name):
     return service_id
 
 
+@profiled("dimension_upsert")
 def get_or_create_rating(cursor, rating_code):
     code = safe_truncate(normalize_string(rating_code), MAX_LENGTHS["rating_code"])
     if not code:
@@ -311,6 +637,7 @@ def get_or_create_rating(cursor, rating_code):
     return code
 
 
+@profiled("dimension_upsert")
 def get_or_create_genre(cursor, genre_name):
     if genre_name is None:
         return None
@@ -340,6 +667,7 @@ def get_or_create_genre(cursor, genre_name):
     return gid
 
 
+@profiled("dimension_upsert")
 def get_or_create_country(cursor, country_name):
     if country_name is None:
         return None
@@ -369,6 +697,7 @@ def get_or_create_country(cursor, country_name):
     return cid
 
 
+@profiled("dimension_upsert")
 def get_or_create_role_type(cursor, role_name):
     name = safe_truncate(normalize_string(role_name), MAX_LENGTHS["role_name"])
     if not name:
@@ -396,6 +725,7 @@ def get_or_create_role_type(cursor, role_name):
     return rid
 
 
+@profiled("dimension_upsert")
 def get_or_create_person(cursor, full_name, primary_role=None):
     if full_name is None:
         return None
@@ -425,6 +755,7 @@ def get_or_create_person(cursor, full_name, primary_role=None):
     return pid
 
 
+@profiled("title_upsert")
 def get_or_create_title(cursor, global_title_name, original_title, release_year,
                         age_rating_code, content_type, runtime_minutes, num_seasons):
     global_title_name = safe_truncate(normalize_string(global_title_name), MAX_LENGTHS["global_title_name"])
@@ -462,209 +793,1277 @@ def get_or_create_title(cursor, global_title_name, original_title, release_year,
     return tid
 
 
-def insert_movie_subtype(cursor, title_id, movie_runtime_minutes):
-    cursor.execute(
-        "INSERT IGNORE INTO movie (title_id, movie_runtime_minutes) VALUES (%s, %s)",
-        (title_id, movie_runtime_minutes)
+# ===============================
+# 4b. COLUMN-WISE TRANSFORM
+# ===============================
+
+EXPECTED_COLUMNS = [
+    "show_id", "type", "title", "director", "cast", "country",
+    "date_added", "release_year", "rating", "duration", "listed_in",
+    "description"
+]
+
+# date_added appears as '25-Sep-21' and 'September 25, 2021' in the source CSVs
+DATE_FORMATS = ("%d-%b-%y", "%B %d, %Y")
+
+TITLE_KEY = ["global_title_name", "release_year"]
+
+TITLE_INSERT_COLUMNS = [
+    "global_title_name", "original_title", "description", "release_year",
+    "age_rating_code", "content_type", "runtime_minutes", "num_seasons"
+]
+
+TITLE_UPSERT_COLUMNS = ["original_title", "age_rating_code", "content_type", "runtime_minutes", "num_seasons"]
+
+# Link tables rebuilt from the source rows of a title on incremental runs
+TITLE_LINK_TABLES = ["title_genre", "title_country", "title_person_role"]
+
+TITLE_COLUMNS = [
+    "service_name", "platform_show_id", "global_title_name", "original_title",
+    "release_year", "age_rating_code", "content_type", "runtime_minutes",
+    "num_seasons", "description", "date_added", "duration_raw"
+]
+
+
+@dataclass
+class TransformedBatch:
+    """Load-ready frames for one CSV (or chunk): one titles row per kept source row plus link rows."""
+    titles: pd.DataFrame
+    genre_links: pd.DataFrame     # global_title_name, release_year, genre_name
+    country_links: pd.DataFrame   # global_title_name, release_year, country_name
+    person_links: pd.DataFrame    # global_title_name, release_year, full_name, role_name, billing_order
+
+
+def _check_columns(df, file_path):
+    missing = [c for c in EXPECTED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing expected columns in {file_path}: {missing}")
+
+
+def read_catalog_csv(file_path):
+    with run_profile.stage("read"):
+        df = pd.read_csv(file_path)
+    _check_columns(df, file_path)
+    run_profile.rows_read += len(df)
+    return df
+
+
+def iter_catalog_chunks(file_path, chunk_rows, skip_rows=0):
+    """
+    Yield DataFrame chunks of `file_path`, dropping the first `skip_rows` data
+    rows. Rows are skipped after parsing: descriptions contain quoted newlines,
+    so a record offset is not a line offset.
+    """
+    for chunk in run_profile.timed_iter("read", pd.read_csv(file_path, chunksize=chunk_rows)):
+        _check_columns(chunk, file_path)
+        if skip_rows:
+            if len(chunk) <= skip_rows:
+                skip_rows -= len(chunk)
+                continue
+            chunk = chunk.iloc[skip_rows:]
+            skip_rows = 0
+        run_profile.rows_read += len(chunk)
+        yield chunk
+
+
+def _clean_strings(series, max_len=None):
+    """Column-wise normalize_string (+ safe_truncate): stripped strings, blanks become NA."""
+    cleaned = series.astype("string").str.strip()
+    cleaned = cleaned.mask(cleaned == "")
+    if max_len is not None:
+        cleaned = cleaned.str.slice(0, max_len)
+    return cleaned
+
+
+def _parse_dates(series):
+    parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    remaining = series.notna()
+    for fmt in DATE_FORMATS:
+        if not remaining.any():
+            break
+        attempt = pd.to_datetime(series[remaining], format=fmt, errors="coerce")
+        parsed[remaining] = attempt
+        remaining &= parsed.isna()
+    if remaining.any():
+        # Anything in an unexpected format falls back to inference, one value at a time
+        parsed[remaining] = series[remaining].map(lambda v: pd.to_datetime(v, errors="coerce"))
+    return parsed.dt.date.where(parsed.notna(), None)
+
+
+def _explode_list(titles, column, value_name, max_len):
+    """Split a comma-separated column into (title key, value, position) rows."""
+    values = titles[column].str.split(",").explode()
+    values = _clean_strings(values, max_len)
+    links = titles.loc[values.index, TITLE_KEY].assign(**{value_name: values.to_numpy()})
+    links = links[links[value_name].notna()]
+    # 1-based position among the non-blank entries, used as cast billing order
+    links["position"] = links.groupby(level=0).cumcount() + 1
+    return links.reset_index(drop=True)
+
+
+@profiled("transform")
+def transform_catalog_frame(df, service_name):
+    """Vectorized equivalent of the per-row parsing in process_csv_file."""
+    titles = pd.DataFrame(index=df.index)
+    titles["service_name"] = service_name
+    titles["platform_show_id"] = _clean_strings(df["show_id"], MAX_LENGTHS["platform_show_id"])
+    titles["global_title_name"] = _clean_strings(df["title"], MAX_LENGTHS["global_title_name"])
+    titles["original_title"] = _clean_strings(df["title"], MAX_LENGTHS["original_title"])
+    titles["release_year"] = pd.to_numeric(df["release_year"], errors="coerce").astype("Int64")
+
+    # Skip weird/incomplete rows
+    keep = titles["global_title_name"].notna() & titles["release_year"].fillna(0).ne(0)
+    titles = titles[keep]
+    source = df[keep]
+
+    titles["age_rating_code"] = _clean_strings(source["rating"], MAX_LENGTHS["rating_code"]).fillna("UNRATED")
+    is_movie = _clean_strings(source["type"]).str.upper().str.startswith("MOVIE").fillna(False).astype(bool)
+    titles["content_type"] = is_movie.map({True: "MOVIE", False: "TV_SHOW"})
+
+    duration = _clean_strings(source["duration"])
+    duration_value = pd.to_numeric(duration.str.extract(r"(\d+)", expand=False), errors="coerce").astype("Int64")
+    titles["runtime_minutes"] = duration_value.where(is_movie)
+    titles["num_seasons"] = duration_value.where(~is_movie)
+    titles["description"] = _clean_strings(source["description"])
+    titles["date_added"] = _parse_dates(_clean_strings(source["date_added"]))
+    titles["duration_raw"] = duration.str.slice(0, MAX_LENGTHS["duration_raw"])
+
+    link_source = titles[TITLE_KEY].assign(
+        listed_in=_clean_strings(source["listed_in"]),
+        country=_clean_strings(source["country"]),
+        cast=_clean_strings(source["cast"]),
+        # Only the first director, reduced to its first two name tokens
+        director=_clean_strings(source["director"]).str.split(",").str[0].str.split().str[:2].str.join(" "),
     )
 
+    genre_links = _explode_list(link_source, "listed_in", "genre_name", MAX_LENGTHS["genre_name"])
+    country_links = _explode_list(link_source, "country", "country_name", MAX_LENGTHS["country_name"])
 
-def insert_tv_show_subtype(cursor, title_id, total_seasons, episode_count=None):
-    cursor.execute(
-        "INSERT IGNORE INTO tv_show (title_id, total_seasons, episode_count) VALUES (%s, %s, %s)",
-        (title_id, total_seasons, episode_count)
+    directors = link_source[TITLE_KEY].assign(
+        full_name=_clean_strings(link_source["director"], MAX_LENGTHS["person_full_name"]),
+        role_name="Director",
+        billing_order=pd.NA,
+    )
+    directors = directors[directors["full_name"].notna()]
+    actors = _explode_list(link_source, "cast", "full_name", MAX_LENGTHS["person_full_name"])
+    actors = actors.rename(columns={"position": "billing_order"}).assign(role_name="Actor")
+    person_links = pd.concat([directors.reset_index(drop=True), actors], ignore_index=True)
+
+    return TransformedBatch(
+        titles=titles[TITLE_COLUMNS].reset_index(drop=True),
+        genre_links=genre_links[TITLE_KEY + ["genre_name"]].drop_duplicates(ignore_index=True),
+        country_links=country_links[TITLE_KEY + ["country_name"]].drop_duplicates(ignore_index=True),
+        person_links=person_links[TITLE_KEY + ["full_name", "role_name", "billing_order"]]
+        .drop_duplicates(subset=TITLE_KEY + ["full_name", "role_name"], ignore_index=True),
     )
 
 
-def link_title_genres(cursor, title_id, genres_str):
-    if pd.isna(genres_str) or not str(genres_str).strip():
-        return
-    genres = [g.strip() for g in str(genres_str).split(",") if g.strip()]
-    rows = []
-    for g in genres:
-        gid = get_or_create_genre(cursor, g)
-        if gid is None:
-            continue
-        rows.append((title_id, gid))
-    if rows:
-        cursor.executemany(
-            "INSERT IGNORE INTO title_genre (title_id, genre_id) VALUES (%s, %s)",
-            rows
-        )
+def frame_records(frame, columns=None):
+    """Yield plain tuples with None for missing values, ready for cursor.executemany."""
+    frame = frame if columns is None else frame[columns]
+    return frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
 
 
-def link_title_countries(cursor, title_id, countries_str):
-    if pd.isna(countries_str) or not str(countries_str).strip():
-        return
-    countries = [c.strip() for c in str(countries_str).split(",") if c.strip()]
-    rows = []
-    for c in countries:
-        cid = get_or_create_country(cursor, c)
-        if cid is None:
-            continue
-        rows.append((title_id, cid))
-    if rows:
-        cursor.executemany(
-            "INSERT IGNORE INTO title_country (title_id, country_id) VALUES (%s, %s)",
-            rows
-        )
+# ===============================
+# 4c. TABLE WRITER (BATCHED INSERT / LOAD DATA LOCAL INFILE)
+# ===============================
 
+# Server/client refusals of LOAD DATA LOCAL: not allowed, disabled, or no file access
+LOAD_DATA_REFUSED = {1148, 2068, 3948}
 
-def link_title_persons(cursor, title_id, director_str, cast_str):
-    # Make sure basic role types exist
-    director_role_id = get_or_create_role_type(cursor, "Director")
-    actor_role_id = get_or_create_role_type(cursor, "Actor")
-    insert_rows = []
 
-    # Directors (sanity: only first director; keep first + last tokens; truncate)
-    if director_str and not pd.isna(director_str):
-        first_segment = str(director_str).split(",")[0].strip()
-        tokens = [t for t in first_segment.split() if t]
-        if len(tokens) >= 2:
-            cleaned_director = f"{tokens[0]} {tokens[1]}"
-        else:
-            cleaned_director = tokens[0] if tokens else first_segment
-        cleaned_director = safe_truncate(cleaned_director, MAX_LENGTHS["person_full_name"])
-        pid = get_or_create_person(cursor, cleaned_director, primary_role="Director")
-        if pid and director_role_id:
-            insert_rows.append((title_id, pid, director_role_id, None))
-
-    # Cast
-    if cast_str and not pd.isna(cast_str):
-        # billing_order = index in the cast list
-        actors = [a.strip() for a in str(cast_str).split(",") if a.strip()]
-        for order, a in enumerate(actors, start=1):
-            actor_name = safe_truncate(a, MAX_LENGTHS["person_full_name"])  # ensure fits
-            pid = get_or_create_person(cursor, actor_name, primary_role="Actor")
-            if pid and actor_role_id:
-                insert_rows.append((title_id, pid, actor_role_id, order))
-
-    if insert_rows:
-        cursor.executemany(
-            """
-            INSERT IGNORE INTO title_person_role
-                (title_id, person_id, role_type_id, billing_order)
-            VALUES (%s, %s, %s, %s)
-            """,
-            insert_rows
-        )
+def _tsv_value(value):
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    text = str(value)
+    return (text.replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r").replace("\0", "\\0"))
 
 
+class TableWriter:
+    """
+    Writes row tuples to a table with batched multi-row INSERTs or, when
+    enabled, by staging them in a TSV loaded with LOAD DATA LOCAL INFILE.
+    Falls back to INSERT for the rest of the run if the server refuses.
+    """
+
+    def __init__(self):
+        self.use_load_data = False
+        self.stats = {}  # table -> [rows, seconds, method]
+
+    def insert(self, cursor, table, columns, rows, ignore=True, update_columns=None):
+        rows = list(rows)
+        if not rows:
+            return 0
+        started = time.perf_counter()
+        method = "INSERT"
+        # LOAD DATA can only ignore or replace duplicates, so upserts always use INSERT
+        if self.use_load_data and not update_columns:
+            try:
+                self._load_data(cursor, table, columns, rows, ignore)
+                method = "LOAD DATA"
+            except pymysql_err.MySQLError as e:
+                if e.args[0] not in LOAD_DATA_REFUSED:
+                    raise
+                print(f"WARNING: LOAD DATA LOCAL INFILE unavailable ({e}); using batched INSERT.")
+                self.use_load_data = False
+        if method == "INSERT":
+            self._insert(cursor, table, columns, rows, ignore, update_columns)
+
+        entry = self.stats.setdefault(table, [0, 0.0, method])
+        entry[0] += len(rows)
+        entry[1] += time.perf_counter() - started
+        entry[2] = method
+        return len(rows)
+
+    @staticmethod
+    def _insert(cursor, table, columns, rows, ignore, update_columns=None):
+        sql = (f"INSERT {'IGNORE ' if ignore and not update_columns else ''}INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join(['%s'] * len(columns))})")
+        if update_columns:
+            sql += " ON DUPLICATE KEY UPDATE " + ", ".join(f"{c} = VALUES({c})" for c in update_columns)
+        for start in range(0, len(rows), BATCH_SIZE):
+            cursor.executemany(sql, rows[start:start + BATCH_SIZE])
+
+    @staticmethod
+    def _load_data(cursor, table, columns, rows, ignore):
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="\n",
+                                         suffix=f"_{table}.tsv", delete=False) as handle:
+            for row in rows:
+                handle.write("\t".join(_tsv_value(v) for v in row))
+                handle.write("\n")
+        try:
+            cursor.execute(
+                f"""
+                LOAD DATA LOCAL INFILE %s {'IGNORE' if ignore else ''}
+                INTO TABLE {table} CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(columns)})
+                """,
+                (handle.name,)
+            )
+        finally:
+            os.unlink(handle.name)
+
+    def stats_report(self):
+        return {
+            table: {"rows": rows, "seconds": round(seconds, 4),
+                    "rows_per_second": round(rows / seconds, 1) if seconds else None, "method": method}
+            for table, (rows, seconds, method) in sorted(self.stats.items())
+        }
+
+    def report(self):
+        if not self.stats:
+            return
+        print("\nTable write throughput:")
+        for table, (rows, seconds, method) in sorted(self.stats.items()):
+            rate = rows / seconds if seconds else float("inf")
+            print(f"  {table}: {rows} rows in {seconds:.2f}s ({rate:,.0f} rows/s, {method})")
+
+
+table_writer = TableWriter()
+
+
+def insert_rows(cursor, table, columns, rows, ignore=True, update_columns=None):
+    return table_writer.insert(cursor, table, columns, rows, ignore=ignore, update_columns=update_columns)
+
+
+# ===============================
+# 4d. LOAD SINKS
+# ===============================
+# The set-based loader writes through a sink: DatabaseSink for live runs, or
+# MemorySink / NullSink so the dry run drives the same transform and load code
+# without a database.
+
+# Unique keys per table as the ETL writes them (first key is the one resolve_ids looks up).
+# person.full_name is not unique in the DDL, so person rows are never skipped.
+SINK_UNIQUE_KEYS = {
+    "rating": [["rating_code"]],
+    "streaming_service": [["service_name"]],
+    "title": [TITLE_KEY],
+    "movie": [["title_id"]],
+    "tv_show": [["title_id"]],
+    "genre": [["genre_name"]],
+    "title_genre": [["title_id", "genre_id"]],
+    "country": [["country_name"]],
+    "title_country": [["title_id", "country_id"]],
+    "person": [],
+    "role_type": [["role_name"]],
+    "title_person_role": [["title_id", "person_id", "role_type_id"]],
+    "streaming_availability": [["streaming_service_id", "platform_show_id"], ["streaming_service_id", "title_id"]],
+}
+# Tables whose rows get a surrogate id, and the columns it is looked up by
+SINK_ID_KEYS = {
+    "streaming_service": ["service_name"],
+    "title": TITLE_KEY,
+    "genre": ["genre_name"],
+    "country": ["country_name"],
+    "person": ["full_name"],
+    "role_type": ["role_name"],
+}
+SINK_TABLE_ORDER = ["rating", "streaming_service", "title", "movie", "tv_show", "genre", "title_genre",
+                    "country", "title_country", "person", "role_type", "title_person_role",
+                    "streaming_availability"]
+
+
+def _fold(value):
+    # Approximates the case-insensitive utf8mb4 collation of the name columns
+    return value.casefold() if isinstance(value, str) else value
+
+
+class DatabaseSink:
+    """Writes through table_writer and resolves ids with joined SELECTs."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def insert(self, table, columns, rows, ignore=True, update_columns=None):
+        return table_writer.insert(self.cursor, table, columns, rows, ignore, update_columns)
+
+    def resolve_ids(self, table, id_column, key_columns, keys):
+        return resolve_ids(self.cursor, table, id_column, key_columns, keys)
+
+    def fill_null(self, table, id_column, column, rows):
+        return fill_null_column(self.cursor, table, id_column, column, rows)
+
+    def delete(self, table, key_columns, keys):
+        return delete_rows(self.cursor, table, key_columns, keys)
+
+    def availability_keys(self, title_ids):
+        return availability_keys_for_titles(self.cursor, title_ids)
+
+
+class MemorySink:
+    """
+    Stands in for the database: hands out surrogate ids, applies the unique
+    keys above the way INSERT IGNORE would, and keeps per-table row counts
+    plus the first `sample_size` rows of each table.
+    """
+
+    cursor = None
+
+    def __init__(self, sample_size=5, enforce_link_keys=True):
+        self.sample_size = sample_size
+        self.enforce_link_keys = enforce_link_keys
+        self.rows = {}     # table -> rows accepted
+        self.samples = {}  # table -> first rows accepted
+        self.ids = {}      # table -> {folded key: id}
+        self.seen = {}     # (table, key columns) -> {folded key}
+
+    def _unique_keys(self, table):
+        keys = SINK_UNIQUE_KEYS.get(table, [])
+        if self.enforce_link_keys:
+            return keys
+        # Without link keys only the id-bearing dimension tables are de-duplicated
+        return keys if table in SINK_ID_KEYS else []
+
+    def insert(self, table, columns, rows, ignore=True, update_columns=None):
+        unique_keys = [(tuple(key), [columns.index(c) for c in key]) for key in self._unique_keys(table)]
+        id_key = SINK_ID_KEYS.get(table)
+        id_positions = [columns.index(c) for c in id_key] if id_key else None
+        ids = self.ids.setdefault(table, {})
+        samples = self.samples.setdefault(table, [])
+        accepted = 0
+        for row in rows:
+            folded = [tuple(_fold(row[i]) for i in positions) for _, positions in unique_keys]
+            if any(f in self.seen.get((table, key), ()) for (key, _), f in zip(unique_keys, folded)):
+                continue  # ignored (or, for upserts, updated in place)
+            for (key, _), f in zip(unique_keys, folded):
+                self.seen.setdefault((table, key), set()).add(f)
+            if id_positions is not None:
+                ids.setdefault(tuple(_fold(row[i]) for i in id_positions), len(ids) + 1)
+            if len(samples) < self.sample_size:
+                samples.append(tuple(row))
+            accepted += 1
+        self.rows[table] = self.rows.get(table, 0) + accepted
+        return accepted
+
+    def resolve_ids(self, table, id_column, key_columns, keys):
+        ids = self.ids.get(table, {})
+        resolved = {}
+        for key in keys:
+            found = ids.get(tuple(_fold(v) for v in key))
+            if found is not None:
+                resolved.setdefault(key[0] if len(key_columns) == 1 else tuple(key), found)
+        return resolved
+
+    def fill_null(self, table, id_column, column, rows):
+        # An empty database has nothing to backfill; new rows were inserted with their values
+        return 0
+
+    def delete(self, table, key_columns, keys):
+        # Only incremental runs delete, and those always write to the database
+        return 0
+
+    def availability_keys(self, title_ids):
+        return []
+
+    def stats(self, seconds):
+        return {
+            table: {"rows": self.rows.get(table, 0),
+                    "rows_per_second": round(self.rows.get(table, 0) / seconds, 1) if seconds else None}
+            for table in SINK_TABLE_ORDER
+        }
+
+    def print_summary(self, seconds):
+        print("\n=== DRY RUN SUMMARY (simulated inserts) ===")
+        for table, entry in self.stats(seconds).items():
+            rate = f" ({entry['rows_per_second']:,.0f} rows/s)" if entry["rows_per_second"] is not None else ""
+            print(f"{table}: {entry['rows']} rows{rate}")
+            for r in self.samples.get(table, []):
+                print("  ", r)
+
+
+class NullSink(MemorySink):
+    """
+    Cheapest sink for benchmarking: no samples and no link-table keys, so link
+    rows are only counted. Dimension ids are still assigned because the loader
+    needs them to build the link rows.
+    """
+
+    def __init__(self):
+        super().__init__(sample_size=0, enforce_link_keys=False)
+
 
 # ===============================
 # 5. MAIN ETL LOGIC
 # ===============================
 
+def load_transformed_batch(cursor, batch, service_id):
+    """Write one TransformedBatch using the cached get_or_create_* lookups."""
+    title_ids = {}
+    availability_batch = []
+    movie_batch = []
+    tv_show_batch = []
+    description_batch = {}  # title_id -> first non-empty description seen
+    row_count = 0
+
+    def flush_batches():
+        flush_title_description_batch(cursor, description_batch)
+        flush_subtype_batches(cursor, movie_batch, tv_show_batch)
+        flush_streaming_availability_batch(cursor, availability_batch)
+
+    with run_profile.stage("title_upsert"):
+        for (service_name, platform_show_id, global_title_name, original_title, release_year,
+             age_rating_code, content_type, runtime_minutes, num_seasons, description,
+             date_added, duration_raw) in frame_records(batch.titles, TITLE_COLUMNS):
+            row_count += 1
+
+            # Ensure rating row exists
+            rating_code = get_or_create_rating(cursor, age_rating_code)
+
+            title_id = get_or_create_title(
+                cursor,
+                global_title_name=global_title_name,
+                original_title=original_title,
+                release_year=release_year,
+                age_rating_code=rating_code,
+                content_type=content_type,
+                runtime_minutes=runtime_minutes,
+                num_seasons=num_seasons
+            )
+            title_ids[(global_title_name, release_year)] = title_id
+
+            # Queue a description fill (applied only where the DB value is still NULL)
+            if description:
+                description_batch.setdefault(title_id, description)
+
+            # Queue subtype rows
+            if content_type == "MOVIE":
+                movie_batch.append((title_id, runtime_minutes))
+            else:
+                tv_show_batch.append((title_id, num_seasons))
+
+            if platform_show_id is None:
+                # Use a fallback if show_id missing (rare)
+                platform_show_id = f"{service_name[:3].upper()}_{title_id}"
+
+            availability_batch.append(
+                build_streaming_availability_row(
+                    streaming_service_id=service_id,
+                    title_id=title_id,
+                    platform_show_id=platform_show_id,
+                    date_added=date_added,
+                    duration_raw=duration_raw,
+                    is_exclusive=False,
+                    availability_status="ACTIVE"
+                )
+            )
+
+            if len(availability_batch) >= BATCH_SIZE:
+                flush_batches()
+
+            if row_count % 500 == 0:
+                print(f"  Loaded {row_count} titles...")
+
+        flush_batches()
+
+    with run_profile.stage("link_insert"):
+        genre_rows = []
+        for name, year, genre_name in frame_records(batch.genre_links):
+            gid = get_or_create_genre(cursor, genre_name)
+            if gid is not None:
+                genre_rows.append((title_ids[(name, year)], gid))
+        insert_rows(
+            cursor,
+            "title_genre",
+            ["title_id", "genre_id"],
+            genre_rows
+        )
+
+        country_rows = []
+        for name, year, country_name in frame_records(batch.country_links):
+            cid = get_or_create_country(cursor, country_name)
+            if cid is not None:
+                country_rows.append((title_ids[(name, year)], cid))
+        insert_rows(
+            cursor,
+            "title_country",
+            ["title_id", "country_id"],
+            country_rows
+        )
+
+        person_rows = []
+        for name, year, full_name, role_name, billing_order in frame_records(batch.person_links):
+            role_type_id = get_or_create_role_type(cursor, role_name)
+            pid = get_or_create_person(cursor, full_name, primary_role=role_name)
+            if pid and role_type_id:
+                person_rows.append((title_ids[(name, year)], pid, role_type_id, billing_order))
+        insert_rows(
+            cursor,
+            "title_person_role",
+            ["title_id", "person_id", "role_type_id", "billing_order"],
+            person_rows
+        )
+    return row_count
+
+
 def process_csv_file(cursor, file_path, service_name):
     print(f"\nProcessing file: {file_path} for service: {service_name}")
-    df = pd.read_csv(file_path)
-
-    # Optional: clean up columns we care about
-    expected_cols = [
-        "show_id", "type", "title", "director", "cast", "country",
-        "date_added", "release_year", "rating", "duration", "listed_in",
-        "description"
-    ]
-    missing = [c for c in expected_cols if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing expected columns in {file_path}: {missing}")
+    df = read_catalog_csv(file_path)
 
     # Get or create streaming service id
     service_id = get_or_create_streaming_service(cursor, service_name)
 
-    row_count = 0
-    availability_batch = []
+    batch = transform_catalog_frame(df, service_name)
+    print(f"  Transformed {len(df)} rows into {len(batch.titles)} titles, "
+          f"{len(batch.genre_links)} genre / {len(batch.country_links)} country / "
+          f"{len(batch.person_links)} person links.")
+    load_transformed_batch(cursor, batch, service_id)
+    print(f"Finished {file_path}: processed {len(df)} rows.")
+
+
+# ===============================
+# 5a. SET-BASED DIMENSION UPSERT
+# ===============================
+
+def combine_batches(batches):
+    """Concatenate per-file TransformedBatch objects into one."""
+    return TransformedBatch(
+        titles=pd.concat([b.titles for b in batches], ignore_index=True),
+        genre_links=pd.concat([b.genre_links for b in batches], ignore_index=True).drop_duplicates(ignore_index=True),
+        country_links=pd.concat([b.country_links for b in batches], ignore_index=True).drop_duplicates(ignore_index=True),
+        person_links=pd.concat([b.person_links for b in batches], ignore_index=True)
+        .drop_duplicates(subset=TITLE_KEY + ["full_name", "role_name"], ignore_index=True),
+    )
 
-    for _, row in df.iterrows():
-        row_count += 1
-
-        platform_show_id = normalize_string(row["show_id"])
-        raw_type = normalize_string(row["type"])  # 'Movie' or 'TV Show'
-        title_str = normalize_string(row["title"])
-        director_str = normalize_string(row["director"])
-        cast_str = normalize_string(row["cast"])
-        country_str = normalize_string(row["country"])
-        date_added = parse_date(row["date_added"])
-        release_year = int(row["release_year"]) if not pd.isna(row["release_year"]) else None
-        rating_code = normalize_string(row["rating"])
-        duration_raw = normalize_string(row["duration"])
-        listed_in = normalize_string(row["listed_in"])
-        description = normalize_string(row["description"])
-
-        if not title_str or not release_year:
-            # Skip weird/incomplete rows
+
+def stage_rows(cursor, table, columns, rows):
+    """Copy rows into a TEMPORARY table with the same column types (and collation) as `table`."""
+    staging = f"etl_stage_{table}"
+    column_sql = ", ".join(columns)
+    cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {staging}")
+    cursor.execute(f"CREATE TEMPORARY TABLE {staging} SELECT {column_sql} FROM {table} WHERE 1 = 0")
+    insert_rows(cursor, staging, columns, rows, ignore=False)
+    return staging
+
+
+def update_from_staging(cursor, table, staging, key_columns, assignments, where):
+    """
+    UPDATE `table` t from the `staging` s rows matching on key_columns.
+    assignments maps t's columns to expressions; `where` may use t. and s.
+    """
+    # t on the left, so SQLite compares with t's NOCASE collation
+    match_sql = " AND ".join(f"t.{c} = s.{c}" for c in key_columns)
+    if DB_BACKEND == "sqlite":
+        set_sql = ", ".join(f"{c} = {e}" for c, e in assignments.items())
+        cursor.execute(f"UPDATE {table} AS t SET {set_sql} FROM {staging} AS s WHERE {match_sql} AND {where}")
+    else:
+        set_sql = ", ".join(f"t.{c} = {e}" for c, e in assignments.items())
+        cursor.execute(f"UPDATE {table} t JOIN {staging} s ON {match_sql} SET {set_sql} WHERE {where}")
+    return cursor.rowcount
+
+
+def delete_from_staging(cursor, table, staging, key_columns):
+    """DELETE the `table` rows matching a `staging` row on key_columns."""
+    match_sql = " AND ".join(f"t.{c} = s.{c}" for c in key_columns)
+    if DB_BACKEND == "sqlite":
+        cursor.execute(f"DELETE FROM {table} AS t WHERE EXISTS (SELECT 1 FROM {staging} s WHERE {match_sql})")
+    else:
+        cursor.execute(f"DELETE t FROM {table} t JOIN {staging} s ON {match_sql}")
+    return cursor.rowcount
+
+
+def delete_rows(cursor, table, key_columns, keys):
+    """DELETE the `table` rows matching any of the key tuples, with one joined DELETE."""
+    keys = list(keys)
+    if not keys:
+        return 0
+    staging = stage_rows(cursor, table, key_columns, keys)
+    deleted = delete_from_staging(cursor, table, staging, key_columns)
+    cursor.execute(f"DROP TEMPORARY TABLE {staging}")
+    return deleted
+
+
+def availability_keys_for_titles(cursor, title_ids):
+    """(title_id, streaming_service_id, platform_show_id) of every availability row for the given titles."""
+    title_ids = [(title_id,) for title_id in title_ids]
+    if not title_ids:
+        return []
+    staging = stage_rows(cursor, "streaming_availability", ["title_id"], title_ids)
+    cursor.execute(
+        f"SELECT t.title_id, t.streaming_service_id, t.platform_show_id "
+        f"FROM {staging} s JOIN streaming_availability t ON t.title_id = s.title_id"
+    )
+    rows = cursor.fetchall()
+    cursor.execute(f"DROP TEMPORARY TABLE {staging}")
+    return rows
+
+
+def fill_null_column(cursor, table, id_column, column, rows):
+    """Set `column` from (id, value) rows wherever it is still NULL, with one joined UPDATE."""
+    rows = list(rows)
+    if not rows:
+        return 0
+    staging = stage_rows(cursor, table, [id_column, column], rows)
+    updated = update_from_staging(cursor, table, staging, [id_column], {column: f"s.{column}"},
+                                  f"t.{column} IS NULL")
+    cursor.execute(f"DROP TEMPORARY TABLE {staging}")
+    return updated
+
+
+def resolve_ids(cursor, table, id_column, key_columns, keys):
+    """
+    Map every key tuple to its surrogate id with one joined SELECT.
+
+    Matching happens in MySQL, so keys that differ only in case/accents resolve
+    the same way the per-row SELECTs in get_or_create_* would.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    staging = stage_rows(cursor, table, key_columns, keys)
+    key_sql = ", ".join(f"s.{c}" for c in key_columns)
+    join_sql = " AND ".join(f"t.{c} = s.{c}" for c in key_columns)
+    # No GROUP BY: it would fold keys that differ only in case into one output row
+    cursor.execute(
+        f"SELECT {key_sql}, t.{id_column} FROM {staging} s "
+        f"JOIN {table} t ON {join_sql} ORDER BY t.{id_column}"
+    )
+    rows = cursor.fetchall()
+    cursor.execute(f"DROP TEMPORARY TABLE {staging}")
+    ids = {}
+    for row in rows:
+        key = row[0] if len(key_columns) == 1 else tuple(row[:-1])
+        ids.setdefault(key, row[-1])
+    return ids
+
+
+def upsert_named_dimension(sink, table, id_column, name_column, names, cache):
+    """INSERT IGNORE the distinct names in one pass, then resolve all ids at once."""
+    names = sorted(n for n in set(names) if n not in cache)
+    if names:
+        sink.insert(table, [name_column], [(n,) for n in names])
+        cache.update(sink.resolve_ids(table, id_column, [name_column], [(n,) for n in names]))
+    return cache
+
+
+def upsert_persons(sink, person_links):
+    """person.full_name is not unique, so resolve existing names first and insert only the rest."""
+    first_roles = person_links.drop_duplicates(subset=["full_name"])
+    names = [n for n in first_roles["full_name"] if n not in person_cache]
+    person_cache.update(sink.resolve_ids("person", "person_id", ["full_name"], [(n,) for n in names]))
+
+    seen = set()
+    missing = []
+    for name, role in frame_records(first_roles, ["full_name", "role_name"]):
+        # The column collation is case-insensitive; avoid inserting 'X' and 'x' twice
+        folded = name.casefold()
+        if name in person_cache or folded in seen:
             continue
+        seen.add(folded)
+        missing.append((name, role))
+    if missing:
+        sink.insert(
+            "person",
+            ["full_name", "primary_role"],
+            missing,
+            ignore=False
+        )
+        # Resolve every unresolved spelling, not just the inserted one, so 'X' and 'x' share an id
+        unresolved = [(n,) for n in names if n not in person_cache]
+        person_cache.update(sink.resolve_ids("person", "person_id", ["full_name"], unresolved))
+    return person_cache
 
-        # Ensure rating row exists
-        rating_code = get_or_create_rating(cursor, rating_code)
 
-        # Content type mapping to enum
-        if raw_type and raw_type.upper().startswith("MOVIE"):
-            content_type = "MOVIE"
-        else:
-            content_type = "TV_SHOW"
+def clear_reloaded_links(sink, titles, availability_rows):
+    """
+    Delete the genre, country and credit links of the titles in an incremental
+    batch, so re-inserting them drops links that left the source. A title that
+    also has an availability row outside the batch keeps its links, since that
+    unchanged source row contributed some of them and is not being re-read.
+    """
+    batch_keys = {(row[0], row[2]) for row in availability_rows}
+    title_ids = {title_cache[key] for key in frame_records(titles.drop_duplicates(subset=TITLE_KEY), TITLE_KEY)}
+    shared = {title_id for title_id, service_id, show_id in sink.availability_keys(sorted(title_ids))
+              if (service_id, show_id) not in batch_keys}
+    reloaded = [(title_id,) for title_id in sorted(title_ids - shared)]
+    for table in TITLE_LINK_TABLES:
+        sink.delete(table, ["title_id"], reloaded)
+    print(f"  Cleared links of {len(reloaded)} changed titles ({len(shared)} shared with unchanged rows kept).")
+
+
+def load_batch_set_based(sink, batch, upsert=False):
+    """
+    Write a TransformedBatch with a fixed number of statements per dimension
+    instead of a SELECT + INSERT per cache miss. Link rows are built purely
+    from the resolved in-memory id maps.
+
+    With upsert=True (incremental runs, where every row is new or changed)
+    existing titles and availability rows are updated instead of skipped.
+    """
+    titles = batch.titles
+    with run_profile.stage("dimension_upsert"):
+        service_ids = upsert_named_dimension(sink, "streaming_service", "streaming_service_id", "service_name",
+                                             titles["service_name"], service_cache)
+
+        ratings = sorted(code for code in set(titles["age_rating_code"]) if code not in rating_cache)
+        sink.insert(
+            "rating",
+            ["rating_code"],
+            [(code,) for code in ratings]
+        )
+        rating_cache.update(dict.fromkeys(ratings, True))
+
+    with run_profile.stage("title_upsert"):
+        # The first source row for each (name, year) defines a new title
+        title_rows = titles.drop_duplicates(subset=TITLE_KEY)
+        sink.insert(
+            "title",
+            TITLE_INSERT_COLUMNS,
+            frame_records(title_rows, TITLE_INSERT_COLUMNS),
+            update_columns=TITLE_UPSERT_COLUMNS if upsert else None
+        )
+        title_keys = [k for k in frame_records(title_rows, TITLE_KEY) if k not in title_cache]
+        title_cache.update(sink.resolve_ids("title", "title_id", TITLE_KEY, title_keys))
+        print(f"  Resolved {len(title_rows)} titles ({len(title_keys)} not previously cached).")
+
+        # Existing titles (and new ones whose first row had none) take the first description in the input
+        described = titles.dropna(subset=["description"]).drop_duplicates(subset=TITLE_KEY)
+        sink.fill_null(
+            "title",
+            "title_id",
+            "description",
+            [(title_cache[(n, y)], d) for n, y, d in frame_records(described, TITLE_KEY + ["description"])]
+        )
+
+        # Like row mode, every source row adds its own subtype, so a title listed as a
+        # movie on one service and a show on another gets both rows.
+        subtype_rows = titles.drop_duplicates(subset=TITLE_KEY + ["content_type"])
+        movies = subtype_rows[subtype_rows["content_type"] == "MOVIE"]
+        sink.insert(
+            "movie",
+            ["title_id", "movie_runtime_minutes"],
+            [(title_cache[(n, y)], m) for n, y, m in frame_records(movies, TITLE_KEY + ["runtime_minutes"])]
+        )
+        shows = subtype_rows[subtype_rows["content_type"] != "MOVIE"]
+        sink.insert(
+            "tv_show",
+            ["title_id", "total_seasons"],
+            [(title_cache[(n, y)], s) for n, y, s in frame_records(shows, TITLE_KEY + ["num_seasons"])]
+        )
+
+    with run_profile.stage("dimension_upsert"):
+        upsert_named_dimension(sink, "genre", "genre_id", "genre_name", batch.genre_links["genre_name"], genre_cache)
+        upsert_named_dimension(sink, "country", "country_id", "country_name", batch.country_links["country_name"], country_cache)
+        role_ids = upsert_named_dimension(sink, "role_type", "role_type_id", "role_name",
+                                          batch.person_links["role_name"], role_type_cache)
+        upsert_persons(sink, batch.person_links)
+
+    with run_profile.stage("availability_flush"):
+        availability_rows = []
+        for service_name, platform_show_id, name, year, date_added, duration_raw in frame_records(
+                titles, ["service_name", "platform_show_id", "global_title_name", "release_year", "date_added", "duration_raw"]):
+            title_id = title_cache[(name, year)]
+            availability_rows.append(
+                build_streaming_availability_row(
+                    streaming_service_id=service_ids[service_name],
+                    title_id=title_id,
+                    platform_show_id=platform_show_id or f"{service_name[:3].upper()}_{title_id}",
+                    date_added=date_added,
+                    duration_raw=duration_raw,
+                )
+            )
+
+    with run_profile.stage("link_insert"):
+        if upsert:
+            clear_reloaded_links(sink, titles, availability_rows)
+        sink.insert(
+            "title_genre",
+            ["title_id", "genre_id"],
+            [(title_cache[(n, y)], genre_cache[g]) for n, y, g in frame_records(batch.genre_links)]
+        )
+        sink.insert(
+            "title_country",
+            ["title_id", "country_id"],
+            [(title_cache[(n, y)], country_cache[c]) for n, y, c in frame_records(batch.country_links)]
+        )
+        sink.insert(
+            "title_person_role",
+            ["title_id", "person_id", "role_type_id", "billing_order"],
+            [(title_cache[(n, y)], person_cache[p], role_ids[r], order)
+             for n, y, p, r, order in frame_records(batch.person_links)]
+        )
+
+    with run_profile.stage("availability_flush"):
+        sink.insert(
+            "streaming_availability",
+            AVAILABILITY_COLUMNS,
+            availability_rows,
+            # Also re-activates rows that were expired and are back in the feed
+            update_columns=["title_id", "date_added", "duration_raw", "availability_status"] if upsert else None
+        )
+    print(f"  Loaded {len(titles)} availability rows, {len(batch.genre_links)} genre / "
+          f"{len(batch.country_links)} country / {len(batch.person_links)} person links.")
+
+
+def iter_source_chunks(chunk_rows=CHUNK_ROWS, incremental=None, csv_files=None):
+    """Yield (chunk, service_name) for every CSV; incremental runs drop unchanged rows first."""
+    for cfg in CSV_FILES if csv_files is None else csv_files:
+        print(f"\nReading file: {cfg['path']} for service: {cfg['service_name']}")
+        for chunk in iter_catalog_chunks(cfg["path"], chunk_rows):
+            if incremental is not None:
+                chunk = incremental.filter_changed(chunk, cfg["service_name"])
+            yield chunk, cfg["service_name"]
+
+
+def iter_transformed_batches(chunks, workers=1):
+    """
+    Transform (chunk, service_name) pairs in source order, so the first row for
+    a title still defines it. With workers > 1 chunks fan out to a process pool,
+    keeping at most two chunks per worker in flight so a slow consumer never
+    makes the whole input pile up in memory.
+    """
+    if workers <= 1:
+        for chunk, service_name in chunks:
+            yield transform_catalog_frame(chunk, service_name)
+        return
+    print(f"  Transforming chunks on {workers} worker processes...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk, service_name in chunks:
+            pending.append(pool.submit(transform_catalog_frame, chunk, service_name))
+            if len(pending) >= workers * 2:
+                with run_profile.stage("transform"):
+                    batch = pending.popleft().result()
+                yield batch
+        while pending:
+            with run_profile.stage("transform"):
+                batch = pending.popleft().result()
+            yield batch
+
+
+def release_chunk_caches():
+    """
+    Drop the caches that grow with the input. Streaming loads resolve titles and
+    people per chunk, so only the small reference caches need to outlive one.
+    """
+    title_cache.clear()
+    person_cache.clear()
+
+
+def load_all_files_set_based(sink, chunk_rows=CHUNK_ROWS, workers=1, incremental=False):
+    """
+    Transform every CSV first so each dimension is upserted once for the whole
+    input. With workers > 1 the transform runs in a process pool and this
+    process is the coordinator that merges the frames and does all writes.
+
+    Returns False when an incremental run found nothing to change.
+    """
+    state = IncrementalState.load(sink.cursor) if incremental else None
+    chunks = iter_source_chunks(chunk_rows=chunk_rows, incremental=state)
+    batches = list(iter_transformed_batches(chunks, workers))
+    load_batch_set_based(sink, combine_batches(batches), upsert=incremental)
+    if state is None:
+        return True
+    state.finish(sink.cursor)
+    return state.has_changes
+
+
+def load_all_files_streaming(sink, chunk_rows=CHUNK_ROWS, workers=1, incremental=False, csv_files=None):
+    """
+    Like load_all_files_set_based, but each chunk is transformed, loaded and
+    released before the next is read, so memory stays flat as the input grows.
+    Dimensions are upserted once per chunk instead of once per run.
+
+    Returns False when an incremental run found nothing to change.
+    """
+    state = IncrementalState.load(sink.cursor) if incremental else None
+    chunks = iter_source_chunks(chunk_rows=chunk_rows, incremental=state, csv_files=csv_files)
+    for n, batch in enumerate(iter_transformed_batches(chunks, workers), start=1):
+        print(f" Chunk {n}: {len(batch.titles)} rows")
+        load_batch_set_based(sink, batch, upsert=incremental)
+        release_chunk_caches()
+    if state is None:
+        return True
+    state.finish(sink.cursor)
+    return state.has_changes
+
+
+# ===============================
+# 5b. INCREMENTAL (DELTA) LOADS
+# ===============================
 
-        # Parse duration into runtime_minutes / num_seasons
-        runtime_minutes, num_seasons = parse_duration_for_title(content_type, duration_raw)
+# hash_pandas_object needs a 16-byte key; keep it fixed so fingerprints survive across runs
+FINGERPRINT_HASH_KEY = "etl_fingerprints"
 
-        # Create or get Title
-        global_title_name = title_str  # You can normalize more if desired
-        original_title = title_str
 
-        title_id = get_or_create_title(
+def fingerprint_rows(df):
+    """64-bit hash of each source row's expected columns (as text, so chunk dtypes don't matter)."""
+    return pd.util.hash_pandas_object(
+        df[EXPECTED_COLUMNS].astype("string"), index=False, hash_key=FINGERPRINT_HASH_KEY
+    )
+
+
+class IncrementalState:
+    """
+    Source-row fingerprints keyed by (service, show_id). Rows whose fingerprint
+    is unchanged are dropped before the transform; keys that vanish from a
+    service's feed are expired.
+    """
+
+    def __init__(self, known):
+        self.known = known            # service_name -> {show_id: row_hash}
+        self.seen = {}                # service_name -> set(show_id) present in this run's feed
+        self.fingerprints = []        # (service_name, show_id, row_hash) for new/changed rows
+        self.source_rows = 0
+        self.changed_rows = 0
+        self.expired_rows = 0
+
+    @classmethod
+    @profiled("change_detection")
+    def load(cls, cursor):
+        known = {}
+        try:
+            cursor.execute(
+                """
+                SELECT ss.service_name, f.platform_show_id, f.row_hash
+                FROM etl_source_fingerprint f
+                JOIN streaming_service ss ON ss.streaming_service_id = f.streaming_service_id
+                """
+            )
+            for service_name, show_id, row_hash in cursor.fetchall():
+                # SQLite hands back the signed form of the unsigned hash
+                known.setdefault(service_name, {})[show_id] = int(row_hash) % 2 ** 64
+        except (pymysql_err.ProgrammingError, sqlite3.OperationalError) as e:
+            print(f"WARNING: no stored fingerprints ({e}); every row counts as new.")
+        print(f"Loaded {sum(len(v) for v in known.values())} stored source fingerprints.")
+        return cls(known)
+
+    @profiled("change_detection")
+    def filter_changed(self, chunk, service_name):
+        show_ids = _clean_strings(chunk["show_id"], MAX_LENGTHS["platform_show_id"])
+        show_ids = show_ids.astype(object).where(show_ids.notna(), None).tolist()
+        hashes = [int(h) for h in fingerprint_rows(chunk)]
+        stored = self.known.get(service_name, {})
+        seen = self.seen.setdefault(service_name, set())
+
+        changed = []
+        for show_id, row_hash in zip(show_ids, hashes):
+            if show_id is None:
+                # Rows without a show_id can't be tracked, so they are always reprocessed
+                changed.append(True)
+                continue
+            seen.add(show_id)
+            is_changed = stored.get(show_id) != row_hash
+            if is_changed:
+                self.fingerprints.append((service_name, show_id, row_hash))
+            changed.append(is_changed)
+
+        self.source_rows += len(chunk)
+        self.changed_rows += sum(changed)
+        return chunk[changed]
+
+    @profiled("change_detection")
+    def finish(self, cursor):
+        """Expire vanished rows and store the new fingerprints (same transaction as the load)."""
+        now = datetime.now()
+        for service_name, stored in self.known.items():
+            if service_name not in self.seen:
+                # This run did not read that service's feed at all
+                continue
+            missing = sorted(stored.keys() - self.seen[service_name])
+            if not missing:
+                continue
+            service_id = get_or_create_streaming_service(cursor, service_name)
+            keys = [(service_id, show_id) for show_id in missing]
+            key_columns = ["streaming_service_id", "platform_show_id"]
+            staging = stage_rows(cursor, "streaming_availability", key_columns, keys)
+            self.expired_rows += update_from_staging(
+                cursor, "streaming_availability", staging, key_columns,
+                {"availability_status": "'EXPIRED'"}, "t.availability_status <> 'EXPIRED'"
+            )
+            # Forget them, so a row that comes back is treated as new and re-activated
+            delete_from_staging(cursor, "etl_source_fingerprint", staging, key_columns)
+            cursor.execute(f"DROP TEMPORARY TABLE {staging}")
+
+        insert_rows(
             cursor,
-            global_title_name=global_title_name,
-            original_title=original_title,
-            release_year=release_year,
-            age_rating_code=rating_code,
-            content_type=content_type,
-            runtime_minutes=runtime_minutes,
-            num_seasons=num_seasons
+            "etl_source_fingerprint",
+            ["streaming_service_id", "platform_show_id", "row_hash", "updated_at"],
+            [(get_or_create_streaming_service(cursor, service_name), show_id, row_hash, now)
+             for service_name, show_id, row_hash in self.fingerprints],
+            update_columns=["row_hash", "updated_at"]
         )
+        print(f"Incremental run: {self.changed_rows} of {self.source_rows} source rows new or changed, "
+              f"{self.expired_rows} availability rows expired.")
+
+    @property
+    def has_changes(self):
+        return bool(self.changed_rows or self.expired_rows)
+
+
+###############################
+# 5c. CATALOG CUBE (DASHBOARD SUMMARY)
+###############################
 
-        # Update description if still NULL in DB and we have one
-        update_title_description_if_empty(cursor, title_id, description)
+def _case_in(expression, groups, else_label):
+    """Build a CASE WHEN <expression> IN (...) fragment and its parameters."""
+    clauses = []
+    params = []
+    for label, values in groups:
+        clauses.append(f"WHEN {expression} IN ({', '.join(['%s'] * len(values))}) THEN %s")
+        params.extend(values)
+        params.append(label)
+    params.append(else_label)
+    return f"CASE {' '.join(clauses)} ELSE %s END", params
 
-        # Insert subtype rows
-        if content_type == "MOVIE":
-            insert_movie_subtype(cursor, title_id, runtime_minutes)
+
+@profiled("catalog_cube")
+def rebuild_catalog_cube(cursor):
+    """
+    Recompute catalog_cube from the loaded tables.
+
+    Dimensions: service x content_type x release_year x month(date_added)
+    x rating bucket x genre category. Rows with genre_category = '*' roll up
+    all genres so the dashboard can sum them as distinct title counts.
+    """
+    rating_sql, rating_params = _case_in(
+        "UPPER(t.age_rating_code)",
+        [("G", RATING_G), ("PG", RATING_PG), ("PG-13", RATING_PG13), ("R/TV-MA", RATING_R)],
+        "Unrated/Other"
+    )
+    genre_sql, genre_params = _case_in("g.genre_name", GENRE_GROUPS.items(), "Other")
+    if DB_BACKEND == "sqlite":
+        month_sql = "date(sa.date_added, 'start of month')"
+    else:
+        month_sql = "DATE_SUB(sa.date_added, INTERVAL DAYOFMONTH(sa.date_added) - 1 DAY)"
+
+    cursor.execute("DELETE FROM catalog_cube")
+    cursor.execute(
+        f"""
+        INSERT INTO catalog_cube
+            (service_name, content_type, release_year, month_added,
+             rating_bucket, genre_category, title_count)
+        SELECT ss.service_name, t.content_type, t.release_year, {month_sql} AS month_added,
+               {rating_sql} AS rating_bucket, %s, COUNT(DISTINCT t.title_id)
+        FROM title t
+        JOIN streaming_availability sa ON sa.title_id = t.title_id
+        JOIN streaming_service ss ON ss.streaming_service_id = sa.streaming_service_id
+        GROUP BY ss.service_name, t.content_type, t.release_year, month_added, rating_bucket
+        """,
+        rating_params + [CUBE_ALL_GENRES]
+    )
+    rollup_rows = cursor.rowcount
+    cursor.execute(
+        f"""
+        INSERT INTO catalog_cube
+            (service_name, content_type, release_year, month_added,
+             rating_bucket, genre_category, title_count)
+        SELECT ss.service_name, t.content_type, t.release_year, {month_sql} AS month_added,
+               {rating_sql} AS rating_bucket, {genre_sql} AS genre_category, COUNT(DISTINCT t.title_id)
+        FROM title t
+        JOIN streaming_availability sa ON sa.title_id = t.title_id
+        JOIN streaming_service ss ON ss.streaming_service_id = sa.streaming_service_id
+        JOIN title_genre tg ON tg.title_id = t.title_id
+        JOIN genre g ON g.genre_id = tg.genre_id
+        GROUP BY ss.service_name, t.content_type, t.release_year, month_added, rating_bucket, genre_category
+        """,
+        rating_params + genre_params
+    )
+    print(f"catalog_cube rebuilt: {rollup_rows} all-genre rows, {cursor.rowcount} genre rows.")
+
+
+def bump_data_version(cursor):
+    """Mark the loaded data as changed so dashboards refresh their cached filter metadata."""
+    cursor.execute(
+        """
+        INSERT INTO data_version (data_version_id, version, loaded_at)
+        VALUES (1, 1, NOW())
+        ON DUPLICATE KEY UPDATE version = version + 1, loaded_at = NOW()
+        """
+    )
+
+
+# ===============================
+# 5d. CHECKPOINTED (RESUMABLE) LOADS
+# ===============================
+
+def source_signature(path):
+    """Size and mtime of a source CSV; a checkpoint only applies to the file it was taken from."""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+
+class Checkpoints:
+    """
+    Per-file progress in etl_checkpoint. Each update is written in the same
+    transaction as the rows it covers, so rows_committed never runs ahead of
+    the data.
+    """
+
+    def __init__(self, cursor, resume=False):
+        self.cursor = cursor
+        self.progress = {}  # service_name -> (source_signature, rows_committed, completed)
+        if resume:
+            cursor.execute("SELECT service_name, source_signature, rows_committed, completed FROM etl_checkpoint")
+            for service_name, signature, rows_committed, completed in cursor.fetchall():
+                self.progress[service_name] = (signature, int(rows_committed), bool(completed))
         else:
-            insert_tv_show_subtype(cursor, title_id, num_seasons, episode_count=None)
-
-        # Link genres
-        link_title_genres(cursor, title_id, listed_in)
-
-        # Link countries
-        link_title_countries(cursor, title_id, country_str)
-
-        # Link people + roles
-        link_title_persons(cursor, title_id, director_str, cast_str)
-
-        # Insert streaming_availability
-        if platform_show_id is None:
-            # Use a fallback if show_id missing (rare)
-            platform_show_id = f"{service_name[:3].upper()}_{title_id}"
-
-        availability_batch.append(
-            build_streaming_availability_row(
-                streaming_service_id=service_id,
-                title_id=title_id,
-                platform_show_id=platform_show_id,
-                date_added=date_added,
-                duration_raw=duration_raw,
-                is_exclusive=False,
-                availability_status="ACTIVE"
-            )
+            cursor.execute("DELETE FROM etl_checkpoint")
+
+    def start_offset(self, cfg):
+        """Data rows of `cfg` already committed, or None when the file is fully loaded."""
+        saved = self.progress.get(cfg["service_name"])
+        if saved is None:
+            return 0
+        signature, rows_committed, completed = saved
+        if signature != source_signature(cfg["path"]):
+            print(f"  {cfg['path']} changed since its checkpoint; loading it from the start.")
+            return 0
+        return None if completed else rows_committed
+
+    def record(self, cfg, rows_committed, completed=False):
+        self.cursor.execute(
+            """
+            INSERT INTO etl_checkpoint
+                (service_name, source_path, source_signature, rows_committed, completed, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                source_path = VALUES(source_path),
+                source_signature = VALUES(source_signature),
+                rows_committed = VALUES(rows_committed),
+                completed = VALUES(completed),
+                updated_at = VALUES(updated_at)
+            """,
+            (cfg["service_name"], cfg["path"], source_signature(cfg["path"]), rows_committed,
+             int(completed), datetime.now())
         )
 
-        if len(availability_batch) >= BATCH_SIZE:
-            flush_streaming_availability_batch(cursor, availability_batch)
 
-        if row_count % 500 == 0:
-            print(f"  Processed {row_count} rows from {file_path}...")
+def load_all_files_checkpointed(conn, sink, chunk_rows=CHUNK_ROWS, workers=1, commit_every=1, resume=False):
+    """
+    Streaming load that commits every `commit_every` chunks and at the end of
+    each file, recording progress in etl_checkpoint. With resume=True finished
+    files are skipped and the others continue after their last committed row.
+
+    Returns False when there was nothing left to load.
+    """
+    checkpoints = Checkpoints(sink.cursor, resume=resume)
+    conn.commit()
+    loaded = 0
+    for cfg in CSV_FILES:
+        offset = checkpoints.start_offset(cfg)
+        if offset is None:
+            print(f"\nSkipping {cfg['path']}: already loaded.")
+            continue
+        print(f"\nReading file: {cfg['path']} for service: {cfg['service_name']}"
+              + (f" (resuming after row {offset})" if offset else ""))
+
+        # Source rows per chunk, in order, so the offset counts CSV rows, not transformed ones
+        sizes = deque()
+
+        def chunks():
+            for chunk in iter_catalog_chunks(cfg["path"], chunk_rows, skip_rows=offset):
+                sizes.append(len(chunk))
+                yield chunk, cfg["service_name"]
+
+        done = offset
+        for n, batch in enumerate(iter_transformed_batches(chunks(), workers), start=1):
+            load_batch_set_based(sink, batch)
+            release_chunk_caches()
+            done += sizes.popleft()
+            if n % commit_every == 0:
+                checkpoints.record(cfg, done)
+                with run_profile.stage("commit"):
+                    conn.commit()
+                print(f"  Committed through row {done}.")
+        checkpoints.record(cfg, done, completed=True)
+        with run_profile.stage("commit"):
+            conn.commit()
+        print(f"Finished {cfg['path']}: {done} rows committed.")
+        loaded += done - offset
+    return loaded > 0
+
+
+# ===============================
+# 5e. RUN REPORT
+# ===============================
 
-    flush_streaming_availability_batch(cursor, availability_batch)
-    print(f"Finished {file_path}: processed {row_count} rows.")
+def print_stage_summary(report):
+    print("\nStage timings:")
+    for name, stage in report["stages"].items():
+        print(f"  {name}: {stage['seconds']:.2f}s ({stage['share']:.0%})")
+    totals = report["sql_totals"]
+    print(f"SQL: {totals['statements']} statements, {totals['round_trips']} round-trips")
+    print(f"Source rows: {report['rows_read']} in {report['wall_seconds']:.2f}s "
+          f"({report['rows_per_second'] or 0:,.0f} rows/s)")
+
+
+def write_run_report(report, path):
+    """Write the JSON run report to `path` ('-' for stdout)."""
+    text = json.dumps(report, indent=2, default=str)
+    if path == "-":
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text + "\n")
+    print(f"Run report written to {path}")
+
+
+def record_run(conn, report):
+    """Persist the report to etl_run in its own transaction."""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO etl_run
+                    (started_at, finished_at, status, mode, rows_read, wall_seconds, peak_memory_mb, report)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (report["started_at"], report["finished_at"], report["status"], report["options"]["mode"],
+                 report["rows_read"], report["wall_seconds"], report["peak_memory_mb"],
+                 json.dumps(report, default=str))
+            )
+        conn.commit()
+        print("Run report recorded in etl_run.")
+    except DB_ERRORS as e:
+        print(f"WARNING: run report not recorded in etl_run ({e}).")
 
 
 ###############################
@@ -674,7 +2073,8 @@ def process_csv_file(cursor, file_path, service_name):
 REQUIRED_TABLES = {
     "rating", "streaming_service", "title", "movie", "tv_show", "genre",
     "title_genre", "country", "title_country", "person", "role_type",
-    "title_person_role", "streaming_availability"
+    "title_person_role", "streaming_availability", "catalog_cube", "data_version",
+    "etl_source_fingerprint", "etl_run", "etl_checkpoint"
 }
 
 
@@ -683,15 +2083,20 @@ def test_connection(verbose: bool = True) -> bool:
     try:
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT table_name FROM information_schema.tables WHERE table_schema = %s",
-            (DB_CONFIG["database"],)
-        )
+        if DB_BACKEND == "sqlite":
+            cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")
+            location = f"SQLite database '{SQLITE_PATH}'"
+        else:
+            cursor.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_schema = %s",
+                (DB_CONFIG["database"],)
+            )
+            location = f"database '{DB_CONFIG['database']}' at {DB_CONFIG['host']}:{DB_CONFIG['port']}"
         existing = {r[0] for r in cursor.fetchall()}
         missing = REQUIRED_TABLES - existing
         extra = existing - REQUIRED_TABLES
         if verbose:
-            print(f"Connected to database '{DB_CONFIG['database']}' at {DB_CONFIG['host']}:{DB_CONFIG['port']}")
+            print(f"Connected to {location}")
             print(f"Found {len(existing)} tables. Missing required: {len(missing)}")
             if missing:
                 print(" Missing:", ", ".join(sorted(missing)))
@@ -700,7 +2105,7 @@ def test_connection(verbose: bool = True) -> bool:
             if extra:
                 print(" Extra tables detected:", ", ".join(sorted(extra)))
         return not missing
-    except pymysql_err.MySQLError as e:
+    except DB_ERRORS as e:
         if verbose:
             print(f"Connection test failed: {e}")
         return False
@@ -715,174 +2120,47 @@ def test_connection(verbose: bool = True) -> bool:
 # 7. DRY RUN (SIMULATED INSERTS)
 ###############################
 
-def dry_run(sample_size: int = 5):
-    """Simulate processing CSV files and show sample rows per target table without inserting."""
-    print("Starting dry run (no data will be inserted)...")
+def dry_run(sample_size: int = 5, chunk_rows: int = CHUNK_ROWS, report_path=None, sink="memory", workers=1):
+    """
+    Run the streaming set-based pipeline (same read, transform and load code as
+    --stream) into an in-memory sink instead of MySQL, and report per-table row
+    counts, samples and rows/sec.
 
-    # Local caches (simulate empty DB)
-    rating_set = set()
-    service_set = set()
-    title_map = {}  # key -> dict row
-    movie_rows = []
-    tv_show_rows = []
-    genre_set = set()
-    title_genre_rows = []  # (title_key, genre_name)
-    country_set = set()
-    title_country_rows = []  # (title_key, country_name)
-    person_set = set()
-    role_type_set = set()
-    title_person_role_rows = []  # (title_key, person_name, role_name, billing_order)
-    streaming_availability_rows = []  # dict rows
+    sink="memory" applies the tables' unique keys and keeps samples;
+    sink="null" only counts rows, for benchmarking transform/load throughput.
+    """
+    print("Starting dry run (no data will be inserted)...")
+    run_profile.reset(options={"mode": "dry-run", "sink": sink, "workers": workers, "chunk_rows": chunk_rows})
+    target = MemorySink(sample_size) if sink == "memory" else NullSink()
+    # The dry run starts from an empty "database", not whatever a previous call cached
+    for cache in LOOKUP_CACHES.values():
+        cache.clear()
 
+    csv_files = []
     for cfg in CSV_FILES:
-        file_path = cfg["path"]
-        service_name = cfg["service_name"]
-        service_set.add(service_name)
-        print(f" Reading CSV: {file_path} (service={service_name})")
-        try:
-            df = pd.read_csv(file_path)
-        except FileNotFoundError:
-            print(f"  WARNING: File not found, skipping: {file_path}")
-            continue
-
-        expected_cols = [
-            "show_id", "type", "title", "director", "cast", "country",
-            "date_added", "release_year", "rating", "duration", "listed_in",
-            "description"
-        ]
-        missing = [c for c in expected_cols if c not in df.columns]
-        if missing:
-            print(f"  WARNING: Missing expected columns in {file_path}: {missing}")
-            continue
-
-        for _, row in df.iterrows():
-            title_str = normalize_string(row["title"])
-            release_year = int(row["release_year"]) if not pd.isna(row["release_year"]) else None
-            if not title_str or not release_year:
-                continue
-
-            rating_code_raw = normalize_string(row["rating"]) or "UNRATED"
-            rating_set.add(rating_code_raw)
-
-            raw_type = normalize_string(row["type"]) or "TV Show"
-            content_type = "MOVIE" if raw_type.upper().startswith("MOVIE") else "TV_SHOW"
-
-            duration_raw = normalize_string(row["duration"])
-            runtime_minutes, num_seasons = parse_duration_for_title(content_type, duration_raw)
-
-            key = (title_str, release_year)
-            if key not in title_map:
-                title_map[key] = {
-                    "global_title_name": title_str,
-                    "original_title": title_str,
-                    "description": normalize_string(row["description"]),
-                    "release_year": release_year,
-                    "age_rating_code": rating_code_raw,
-                    "content_type": content_type,
-                    "runtime_minutes": runtime_minutes,
-                    "num_seasons": num_seasons
-                }
-                if content_type == "MOVIE":
-                    movie_rows.append({"title_key": key, "movie_runtime_minutes": runtime_minutes})
-                else:
-                    tv_show_rows.append({"title_key": key, "total_seasons": num_seasons, "episode_count": None})
-
-            # Genres
-            listed_in = normalize_string(row["listed_in"]) or ""
-            genres = [g.strip() for g in listed_in.split(",") if g.strip()]
-            for g in genres:
-                genre_set.add(g)
-                title_genre_rows.append((key, g))
-
-            # Countries
-            country_str = normalize_string(row["country"]) or ""
-            countries = [c.strip() for c in country_str.split(",") if c.strip()]
-            for ctry in countries:
-                country_set.add(ctry)
-                title_country_rows.append((key, ctry))
-
-            # People / roles
-            director_str = normalize_string(row["director"]) or ""
-            if director_str:
-                directors = [d.strip() for d in director_str.split(",") if d.strip()]
-                if directors:
-                    role_type_set.add("Director")
-                for d in directors:
-                    person_set.add(d)
-                    title_person_role_rows.append((key, d, "Director", None))
-            cast_str = normalize_string(row["cast"]) or ""
-            if cast_str:
-                actors = [a.strip() for a in cast_str.split(",") if a.strip()]
-                if actors:
-                    role_type_set.add("Actor")
-                for order, a in enumerate(actors, start=1):
-                    person_set.add(a)
-                    title_person_role_rows.append((key, a, "Actor", order))
-
-            # Streaming availability simulated row
-            date_added = parse_date(row["date_added"])
-            streaming_availability_rows.append({
-                "service_name": service_name,
-                "title_key": key,
-                "platform_show_id": normalize_string(row["show_id"]) or f"{service_name[:3].upper()}_{title_str[:10]}_{release_year}",
-                "date_added": date_added,
-                "duration_raw": duration_raw,
-                "is_exclusive": 0,
-                "availability_status": "ACTIVE"
-            })
-
-    def sample(rows):
-        return rows[:sample_size]
-
-    print("\n=== DRY RUN SUMMARY (simulated inserts) ===")
-
-    print(f"rating: {len(rating_set)} codes")
-    print(" sample:", sample(sorted(rating_set)))
-
-    print(f"streaming_service: {len(service_set)} services")
-    print(" sample:", sample(sorted(service_set)))
-
-    print(f"title: {len(title_map)} titles")
-    print(" sample:")
-    for k, v in list(title_map.items())[:sample_size]:
-        print("  ", k, v)
-
-    print(f"movie: {len(movie_rows)} rows")
-    for r in sample(movie_rows):
-        print("  ", r)
-
-    print(f"tv_show: {len(tv_show_rows)} rows")
-    for r in sample(tv_show_rows):
-        print("  ", r)
-
-    print(f"genre: {len(genre_set)} unique")
-    print(" sample:", sample(sorted(genre_set)))
-
-    print(f"title_genre: {len(title_genre_rows)} links")
-    for r in sample(title_genre_rows):
-        print("  ", r)
-
-    print(f"country: {len(country_set)} unique")
-    print(" sample:", sample(sorted(country_set)))
-
-    print(f"title_country: {len(title_country_rows)} links")
-    for r in sample(title_country_rows):
-        print("  ", r)
-
-    print(f"person: {len(person_set)} unique")
-    print(" sample:", sample(sorted(person_set)))
-
-    print(f"role_type: {len(role_type_set)} unique")
-    print(" sample:", sample(sorted(role_type_set)))
-
-    print(f"title_person_role: {len(title_person_role_rows)} links")
-    for r in sample(title_person_role_rows):
-        print("  ", r)
-
-    print(f"streaming_availability: {len(streaming_availability_rows)} rows")
-    for r in sample(streaming_availability_rows):
-        print("  ", r)
+        if os.path.exists(cfg["path"]):
+            csv_files.append(cfg)
+        else:
+            print(f"  WARNING: File not found, skipping: {cfg['path']}")
+    if not csv_files:
+        print("\nNo input files could be read.")
+        return
 
+    started = time.perf_counter()
+    try:
+        load_all_files_streaming(target, chunk_rows=chunk_rows, workers=workers, csv_files=csv_files)
+    except ValueError as e:
+        print(f"  WARNING: {e}")
+        return
+    seconds = time.perf_counter() - started
+
+    target.print_summary(seconds)
+    report = run_profile.report(workers=workers)
+    report["sink"] = target.stats(seconds)
+    print_stage_summary(report)
+    report_peak_memory(workers)
+    if report_path:
+        write_run_report(report, report_path)
     print("\nDry run complete.")
 
 
@@ -890,25 +2168,78 @@ def dry_run(sample_size: int = 5):
 # 8. LIVE RUN (ACTUAL INSERTS)
 ###############################
 
-def live_run():
+def live_run(set_based=False, bulk_load=False, workers=1, incremental=False, stream=False,
+             chunk_rows=CHUNK_ROWS, report_path=None, record=False, commit_every=COMMIT_EVERY, resume=False):
     conn = None
     cursor = None
+    checkpointed = commit_every > 0 or resume
+    if checkpointed:
+        mode = "checkpointed"
+    elif stream:
+        mode = "stream"
+    elif set_based or workers > 1 or incremental:
+        mode = "set-based"
+    else:
+        mode = "row"
+    run_profile.reset(options={"mode": mode, "backend": DB_BACKEND, "bulk_load": bulk_load, "workers": workers,
+                               "incremental": incremental, "chunk_rows": chunk_rows,
+                               "commit_every": commit_every, "resume": resume})
+    status = "FAILED"
     try:
         if not test_connection(verbose=False):
             print("WARNING: Some required tables are missing. Proceeding anyway.")
-        conn = get_connection()
+        conn = get_connection(local_infile=bulk_load)
         conn.autocommit(False)
-        cursor = conn.cursor()
+        cursor = ProfiledCursor(conn.cursor())
+        if bulk_load and DB_BACKEND == "sqlite":
+            print("WARNING: SQLite has no LOAD DATA LOCAL INFILE; using batched INSERT.")
+        table_writer.use_load_data = bulk_load and DB_BACKEND == "mysql"
         preload_reference_data(cursor)
-        for cfg in CSV_FILES:
-            process_csv_file(cursor, cfg["path"], cfg["service_name"])
-        conn.commit()
+        changed = True
+        if mode == "checkpointed":
+            changed = load_all_files_checkpointed(conn, DatabaseSink(cursor), chunk_rows=chunk_rows,
+                                                  workers=workers, commit_every=max(commit_every, 1),
+                                                  resume=resume)
+        elif mode == "stream":
+            changed = load_all_files_streaming(DatabaseSink(cursor), chunk_rows=chunk_rows, workers=workers,
+                                               incremental=incremental)
+        elif mode == "set-based":
+            changed = load_all_files_set_based(DatabaseSink(cursor), chunk_rows=chunk_rows, workers=workers,
+                                               incremental=incremental)
+        else:
+            for cfg in CSV_FILES:
+                process_csv_file(cursor, cfg["path"], cfg["service_name"])
+        if changed:
+            try:
+                rebuild_catalog_cube(cursor)
+            except DB_ERRORS as e:
+                print(f"WARNING: catalog_cube not refreshed ({e}). Dashboard queries will use the raw tables.")
+            try:
+                bump_data_version(cursor)
+            except DB_ERRORS as e:
+                print(f"WARNING: data_version not bumped ({e}). Restart the dashboard to pick up new filter options.")
+        else:
+            print("No source changes; catalog_cube and data_version left as they are.")
+        with run_profile.stage("commit"):
+            conn.commit()
+        status = "SUCCESS"
+        table_writer.report()
+        report_peak_memory(workers)
         print("\nAll files processed successfully.")
-    except pymysql_err.MySQLError as e:
+    except DB_ERRORS as e:
         if conn:
             conn.rollback()
-        print(f"Error connecting to MySQL or executing queries: {e}")
+        print(f"Error connecting to the database or executing queries: {e}")
+        if checkpointed:
+            print("Committed chunks are kept; re-run with --resume to continue from the last checkpoint.")
     finally:
+        report = run_profile.report(status=status, workers=workers)
+        if status == "SUCCESS":
+            print_stage_summary(report)
+        if record and conn:
+            record_run(conn, report)
+        if report_path:
+            write_run_report(report, report_path)
         try:
             cursor.close(); conn.close()
         except Exception:
@@ -926,19 +2257,64 @@ def parse_args(argv=None):
     group.add_argument("--dry-run", action="store_true", help="Simulate inserts; show samples per table")
     group.add_argument("--live-run", action="store_true", help="Perform actual ETL inserts (default if none specified)")
     parser.add_argument("--sample-size", type=int, default=5, help="Sample size per table for dry run output")
+    parser.add_argument("--sink", choices=["memory", "null"], default="memory",
+                        help="Dry run: 'memory' applies unique keys and keeps samples; 'null' only counts rows")
+    parser.add_argument("--set-based", action="store_true",
+                        help="Live run: upsert each dimension in bulk for the whole input instead of per row")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="Live run: write bulk tables via LOAD DATA LOCAL INFILE (falls back to batched INSERT)")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="Transform CSV chunks in this many processes (live run: implies --set-based when > 1)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Live run: only load new/changed source rows and expire rows missing from a feed "
+                             "(implies --set-based)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Live run: load each CSV chunk as soon as it is transformed, keeping memory flat "
+                             "(implies --set-based)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help="Rows per CSV chunk for --stream, --workers and the dry run")
+    parser.add_argument("--commit-every", type=int, default=COMMIT_EVERY, metavar="N",
+                        help="Live run: commit every N chunks and at the end of each file, recording progress "
+                             "in etl_checkpoint (implies --stream)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Live run: skip files finished by a previous checkpointed run and continue the "
+                             "others after their last committed row")
+    parser.add_argument("--backend", choices=["mysql", "sqlite"], default=DB_BACKEND,
+                        help="Database to load: the MySQL server from .env, or a local SQLite file "
+                             "(default: DB_BACKEND, else mysql)")
+    parser.add_argument("--sqlite-path", metavar="PATH",
+                        help="SQLite database file for --backend sqlite (default: DB_SQLITE_PATH, "
+                             "else streaming_media_db.sqlite3 in the project root)")
+    parser.add_argument("--source-dir", metavar="DIR",
+                        help="Read the catalog CSVs (same file names) from DIR instead of ../raw_data")
+    parser.add_argument("--report", metavar="PATH",
+                        help="Write a JSON run report (stage timings, SQL per table, cache hit rates, "
+                             "rows/sec, peak memory) to PATH; '-' prints it")
+    parser.add_argument("--record-run", action="store_true",
+                        help="Live run: also store the run report in the etl_run table")
     return parser.parse_args(argv)
 
 
 def main(argv=None):
     args = parse_args(argv)
+    if args.incremental and (args.commit_every > 0 or args.resume):
+        # Expiry needs every key seen in one run, which a partial, resumed run cannot provide
+        sys.exit("--incremental cannot be combined with --commit-every or --resume.")
+    use_backend(args.backend, args.sqlite_path)
+    if args.source_dir:
+        use_source_dir(args.source_dir)
     if args.test_connection:
         ok = test_connection(verbose=True)
         sys.exit(0 if ok else 1)
     if args.dry_run:
-        dry_run(sample_size=args.sample_size)
+        dry_run(sample_size=args.sample_size, chunk_rows=args.chunk_rows, report_path=args.report,
+                sink=args.sink, workers=args.workers)
         return
     # Default to live run if neither flag specified or explicit --live-run
-    live_run()
+    live_run(set_based=args.set_based, bulk_load=args.bulk_load, workers=args.workers,
+             incremental=args.incremental, stream=args.stream, chunk_rows=args.chunk_rows,
+             report_path=args.report, record=args.record_run, commit_every=args.commit_every,
+             resume=args.resume)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+"""
+Synthetic catalog generator for scale benchmarking.
+
+Reads the real CSVs listed in etl_streaming_titles.CSV_FILES and writes
+statistically similar catalogs at larger scales (10x, 100x, 1000x by default)
+with the same columns, for loading with
+`etl_streaming_titles.py --source-dir <output>/x<scale>`.
+
+How rows are built, per service:
+- Output row i of replica r starts from real row i, keeping its type and
+  release_year. Replica 0 keeps the title; later replicas get "<title>: Part
+  <r + 1>". A title that is on two services is therefore on both in every
+  replica, and the cross-service overlap scales too.
+- director, cast, country, date_added, rating, duration, listed_in and
+  description each come from a real row of the same type, through an
+  independent shuffle per column and replica. This keeps the per-type distributions of genre/country/cast list
+  lengths and values, rating mix, duration formats and date_added spread,
+  while producing new combinations.
+- date_added is shifted by up to +/- DATE_JITTER_DAYS and written back in the
+  format the donor row used.
+- People are renamed per replica (first and last name drawn from the learned
+  name pools), so the person dimension grows with the scale while each
+  person's popularity within a replica matches the source.
+"""
+
+import argparse
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from etl_streaming_titles import CSV_FILES, DATE_FORMATS, EXPECTED_COLUMNS
+
+DEFAULT_SCALES = [10, 100, 1000]
+OUTPUT_DIR = os.path.join("..", "raw_data", "synthetic")
+# Replicas are generated (and appended to the CSV) in blocks of about this many rows
+BLOCK_ROWS = 50_000
+DATE_JITTER_DAYS = 30
+
+# Re-drawn per output row from a real row of the same type
+RESAMPLED_COLUMNS = ["director", "cast", "country", "date_added", "rating", "duration", "listed_in", "description"]
+PERSON_COLUMNS = ["director", "cast"]
+
+
+class CatalogProfile:
+    """What the generator learns from one real CSV."""
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self.types = self.df["type"].fillna("").to_numpy()
+        self.rows_by_type = {t: np.flatnonzero(self.types == t) for t in np.unique(self.types)}
+
+        names = pd.concat([_split_names(self.df[c]) for c in PERSON_COLUMNS])
+        tokens = names[names.str.contains(" ")].str.split()
+        self.first_names = np.array(sorted(set(tokens.str[0])))
+        self.last_names = np.array(sorted(set(tokens.str[-1])))
+
+
+def _split_names(series):
+    names = series.dropna().astype(str).str.split(",").explode().str.strip()
+    return names[names != ""]
+
+
+def synthetic_name(name, replica, first_names, last_names):
+    """Stable per (name, replica): first and last name drawn from the learned pools."""
+    if replica == 0 or not len(last_names):
+        return name
+    digest = zlib.crc32(f"{name}|{replica}".encode("utf-8"))
+    first = first_names[digest % len(first_names)]
+    last = last_names[(digest // len(first_names)) % len(last_names)]
+    return f"{first} {last}"
+
+
+def rename_people(series, replicas, first_names, last_names):
+    names = _split_names(series)
+    if names.empty:
+        return series
+    pairs = pd.DataFrame({"name": names.to_numpy(), "replica": replicas[names.index.to_numpy()]})
+    unique = pairs.drop_duplicates()
+    lookup = {
+        (name, replica): synthetic_name(name, replica, first_names, last_names)
+        for name, replica in unique.itertuples(index=False)
+    }
+    renamed = pd.Series(
+        [lookup[key] for key in zip(pairs["name"], pairs["replica"])], index=names.index
+    ).groupby(level=0).agg(", ".join)
+    result = series.copy()
+    result.loc[renamed.index] = renamed
+    return result
+
+
+def _format_dates(dates, fmt):
+    # strftime's %d zero-pads; the source writes '1-May-21' and 'May 1, 2021'
+    templates = dates.dt.strftime(fmt.replace("%d", "{}"))
+    return pd.Series([t.format(day) for t, day in zip(templates, dates.dt.day)], index=dates.index)
+
+
+def jitter_dates(series, rng):
+    result = series.copy()
+    pending = series.notna()
+    for fmt in DATE_FORMATS:
+        if not pending.any():
+            break
+        parsed = pd.to_datetime(series.where(pending), format=fmt, errors="coerce")
+        matched = parsed.notna()
+        shift = pd.to_timedelta(rng.integers(-DATE_JITTER_DAYS, DATE_JITTER_DAYS + 1, matched.sum()), unit="D")
+        result[matched] = _format_dates(parsed[matched] + shift, fmt)
+        pending &= ~matched
+    return result
+
+
+def generate_block(profile, replicas, rng):
+    """Rows for the given replica numbers, in source order within each replica."""
+    base = profile.df
+    source_rows = np.tile(np.arange(len(base)), len(replicas))
+    replica_of_row = np.repeat(replicas, len(base))
+    block = base.iloc[source_rows][["type", "title", "release_year"]].reset_index(drop=True)
+
+    types = profile.types[source_rows]
+    for column in RESAMPLED_COLUMNS:
+        donors = np.empty(len(block), dtype=np.int64)
+        for type_name, rows in profile.rows_by_type.items():
+            # A fresh permutation per replica: every real row donates once, so each
+            # replica reproduces the column's per-type distribution exactly
+            donors[types == type_name] = np.concatenate([rng.permutation(rows) for _ in replicas])
+        block[column] = base[column].to_numpy()[donors]
+
+    titles = block["title"].astype(str)
+    later = replica_of_row > 0
+    block["title"] = titles.where(~later, titles + ": Part " + pd.Series(replica_of_row + 1).astype(str))
+    for column in PERSON_COLUMNS:
+        block[column] = rename_people(block[column], replica_of_row, profile.first_names, profile.last_names)
+    block["date_added"] = jitter_dates(block["date_added"], rng)
+    return block
+
+
+def generate_catalog(cfg, scale, target_dir, seed):
+    real = pd.read_csv(cfg["path"])
+    profile = CatalogProfile(real)
+    rng = np.random.default_rng([seed, scale, zlib.crc32(cfg["service_name"].encode("utf-8"))])
+    path = os.path.join(target_dir, os.path.basename(cfg["path"]))
+    per_block = max(1, BLOCK_ROWS // max(len(real), 1))
+
+    written = 0
+    for first in range(0, scale, per_block):
+        block = generate_block(profile, np.arange(first, min(scale, first + per_block)), rng)
+        block["show_id"] = [f"s{written + i + 1}" for i in range(len(block))]
+        block[EXPECTED_COLUMNS].to_csv(path, mode="w" if first == 0 else "a", header=first == 0, index=False)
+        written += len(block)
+    return path, written
+
+
+def generate(scales, output_dir=OUTPUT_DIR, seed=0):
+    for scale in scales:
+        target_dir = os.path.join(output_dir, f"x{scale}")
+        os.makedirs(target_dir, exist_ok=True)
+        print(f"\nGenerating {scale}x catalogs in {target_dir}")
+        for cfg in CSV_FILES:
+            started = time.perf_counter()
+            try:
+                path, rows = generate_catalog(cfg, scale, target_dir, seed)
+            except FileNotFoundError:
+                print(f"  WARNING: File not found, skipping: {cfg['path']}")
+                continue
+            print(f"  {path}: {rows} rows ({time.perf_counter() - started:.1f}s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate scaled synthetic streaming catalogs from the real CSVs")
+    parser.add_argument("--scale", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Scale factors to generate (default: 10 100 1000)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR,
+                        help="Directory for the x<scale> sub-directories (default: ../raw_data/synthetic)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed reproduces the same files")
+    args = parser.parse_args(argv)
+    if any(scale < 1 for scale in args.scale):
+        parser.error("--scale values must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    generate(args.scale, output_dir=args.output_dir, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
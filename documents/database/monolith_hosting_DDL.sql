@@ -7,6 +7,11 @@ USE streaming_media_db;
 -- Safety: drop existing tables in dependency-safe order
 SET FOREIGN_KEY_CHECKS = 0;
 
+DROP TABLE IF EXISTS etl_checkpoint;
+DROP TABLE IF EXISTS etl_run;
+DROP TABLE IF EXISTS etl_source_fingerprint;
+DROP TABLE IF EXISTS data_version;
+DROP TABLE IF EXISTS catalog_cube;
 DROP TABLE IF EXISTS streaming_availability;
 DROP TABLE IF EXISTS title_person_role;
 DROP TABLE IF EXISTS title_country;
@@ -288,6 +293,100 @@ CREATE TABLE streaming_availability (
 
 CREATE INDEX idx_sa_title_id ON streaming_availability (title_id);
 CREATE INDEX idx_sa_service_id ON streaming_availability (streaming_service_id);
+CREATE INDEX idx_sa_date_added ON streaming_availability (date_added, availability_id);
+
+------------------------------------------------------------
+-- [A1] CatalogCube (pre-aggregated summary rebuilt by the ETL)
+------------------------------------------------------------
+-- One row per service x content_type x release_year x month(date_added)
+-- x rating bucket x genre category. Rows with genre_category = '*' roll up
+-- all genres, so each title is counted exactly once per service there.
+CREATE TABLE catalog_cube (
+    cube_id          BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    service_name     VARCHAR(100) NOT NULL,
+    content_type     ENUM('MOVIE','TV_SHOW') NOT NULL,
+    release_year     YEAR NOT NULL,
+    month_added      DATE NULL,                         -- first day of the date_added month
+    rating_bucket    VARCHAR(20) NOT NULL,              -- 'G', 'PG', 'PG-13', 'R/TV-MA', 'Unrated/Other'
+    genre_category   VARCHAR(50) NOT NULL,              -- dashboard genre bucket, '*' = all genres
+    title_count      INT UNSIGNED NOT NULL,             -- COUNT(DISTINCT title_id) in the cell
+
+    CONSTRAINT pk_catalog_cube PRIMARY KEY (cube_id)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+CREATE INDEX idx_cube_genre_service ON catalog_cube (genre_category, service_name);
+
+------------------------------------------------------------
+-- [A2] DataVersion (bumped by every ETL live run)
+------------------------------------------------------------
+-- Single row; the dashboard keeps filter metadata cached until this changes.
+CREATE TABLE data_version (
+    data_version_id  TINYINT UNSIGNED NOT NULL,        -- always 1
+    version          BIGINT UNSIGNED NOT NULL,
+    loaded_at        DATETIME NOT NULL,
+
+    CONSTRAINT pk_data_version PRIMARY KEY (data_version_id)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+------------------------------------------------------------
+-- [A3] EtlSourceFingerprint (incremental ETL change detection)
+------------------------------------------------------------
+-- One row per source CSV row, keyed like streaming_availability.
+-- row_hash is a 64-bit hash of the raw CSV columns from the last load.
+CREATE TABLE etl_source_fingerprint (
+    streaming_service_id INT UNSIGNED NOT NULL,
+    platform_show_id     VARCHAR(50) NOT NULL,
+    row_hash             BIGINT UNSIGNED NOT NULL,
+    updated_at           DATETIME NOT NULL,
+
+    CONSTRAINT pk_etl_source_fingerprint PRIMARY KEY (streaming_service_id, platform_show_id),
+
+    CONSTRAINT fk_fingerprint_streaming_service
+        FOREIGN KEY (streaming_service_id)
+        REFERENCES streaming_service (streaming_service_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+------------------------------------------------------------
+-- [A4] EtlRun (ETL run reports, written by --record-run)
+------------------------------------------------------------
+-- One row per recorded run; `report` holds the full JSON from --report.
+CREATE TABLE etl_run (
+    etl_run_id       INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    started_at       DATETIME NOT NULL,
+    finished_at      DATETIME NOT NULL,
+    status           VARCHAR(10) NOT NULL,             -- SUCCESS / FAILED
+    mode             VARCHAR(20) NOT NULL,             -- row / set-based / stream / checkpointed
+    rows_read        INT UNSIGNED NOT NULL,
+    wall_seconds     DECIMAL(10,3) NOT NULL,
+    peak_memory_mb   DECIMAL(10,1) NULL,
+    report           JSON NOT NULL,
+
+    CONSTRAINT pk_etl_run PRIMARY KEY (etl_run_id)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+CREATE INDEX idx_etl_run_started ON etl_run (started_at);
+
+------------------------------------------------------------
+-- [A5] EtlCheckpoint (progress of checkpointed ETL runs)
+------------------------------------------------------------
+-- One row per source CSV; updated in the same transaction as the rows it covers.
+CREATE TABLE etl_checkpoint (
+    service_name      VARCHAR(100) NOT NULL,
+    source_path       VARCHAR(255) NOT NULL,
+    source_signature  VARCHAR(64) NOT NULL,            -- CSV size:mtime the offset refers to
+    rows_committed    INT UNSIGNED NOT NULL,           -- source rows loaded and committed
+    completed         TINYINT(1) NOT NULL DEFAULT 0,
+    updated_at        DATETIME NOT NULL,
+
+    CONSTRAINT pk_etl_checkpoint PRIMARY KEY (service_name)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4;
 
 USE streaming_media_db;
 
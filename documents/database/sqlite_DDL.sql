@@ -0,0 +1,404 @@
+-- SQLite version of tv_movie_DDL.sql plus the view, app tables and trigger
+-- from users_views_triggers.sql, for DB_BACKEND=sqlite.
+--
+-- The ETL applies this file every time it opens the database file, so every
+-- statement must be safe to re-run (IF NOT EXISTS, INSERT OR IGNORE).
+--
+-- Differences from the MySQL schema:
+--   * AUTO_INCREMENT keys are INTEGER PRIMARY KEY (rowid) columns.
+--   * ENUM columns are TEXT with a CHECK; YEAR, TINYINT and UNSIGNED types are INTEGER.
+--   * Name columns use COLLATE NOCASE in place of utf8mb4_unicode_ci, so unique
+--     keys and lookups ignore case. NOCASE only folds ASCII letters and is not
+--     accent-insensitive.
+--   * sp_get_titles_for_dashboard has no SQLite equivalent; the dashboard runs
+--     its SELECT directly instead.
+
+PRAGMA foreign_keys = ON;
+
+------------------------------------------------------------
+-- [E7] Rating
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS rating (
+    rating_code      VARCHAR(10)  NOT NULL COLLATE NOCASE,
+    age_minimum      INTEGER NULL,
+
+    CONSTRAINT pk_rating PRIMARY KEY (rating_code)
+);
+
+------------------------------------------------------------
+-- [E1] StreamingService
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS streaming_service (
+    streaming_service_id   INTEGER PRIMARY KEY,
+    service_name           VARCHAR(100) NOT NULL COLLATE NOCASE,
+    country_of_operation   VARCHAR(100) NULL,
+    launch_year            INTEGER NULL,
+    url                    VARCHAR(255) NULL,
+
+    CONSTRAINT uq_streaming_service_name UNIQUE (service_name)
+);
+
+------------------------------------------------------------
+-- [E2] Title (supertype)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS title (
+    title_id         INTEGER PRIMARY KEY,
+    global_title_name VARCHAR(255) NOT NULL COLLATE NOCASE,
+    original_title   VARCHAR(255) NULL,
+    description      TEXT NULL,
+    release_year     INTEGER NOT NULL,
+    age_rating_code  VARCHAR(10) NOT NULL COLLATE NOCASE,
+    content_type     TEXT NOT NULL CHECK (content_type IN ('MOVIE', 'TV_SHOW')),
+    runtime_minutes  INTEGER NULL,
+    num_seasons      INTEGER NULL,
+
+    CONSTRAINT uq_title_name_year UNIQUE (global_title_name, release_year),
+
+    CONSTRAINT fk_title_rating
+        FOREIGN KEY (age_rating_code)
+        REFERENCES rating (rating_code)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_title_content_type ON title (content_type);
+CREATE INDEX IF NOT EXISTS idx_title_release_year ON title (release_year);
+
+------------------------------------------------------------
+-- [E3] Movie (subtype of Title)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS movie (
+    title_id              INTEGER NOT NULL,
+    movie_runtime_minutes INTEGER NULL,
+
+    CONSTRAINT pk_movie PRIMARY KEY (title_id),
+
+    CONSTRAINT fk_movie_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE
+);
+
+------------------------------------------------------------
+-- [E4] TVShow (subtype of Title)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS tv_show (
+    title_id       INTEGER NOT NULL,
+    total_seasons  INTEGER NULL,
+    episode_count  INTEGER NULL,
+
+    CONSTRAINT pk_tv_show PRIMARY KEY (title_id),
+
+    CONSTRAINT fk_tv_show_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE
+);
+
+------------------------------------------------------------
+-- [E5] Genre
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS genre (
+    genre_id    INTEGER PRIMARY KEY,
+    genre_name  VARCHAR(100) NOT NULL COLLATE NOCASE,
+
+    CONSTRAINT uq_genre_name UNIQUE (genre_name)
+);
+
+------------------------------------------------------------
+-- [E6] TitleGenre (associative: Title <-> Genre)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS title_genre (
+    title_id  INTEGER NOT NULL,
+    genre_id  INTEGER NOT NULL,
+
+    CONSTRAINT pk_title_genre PRIMARY KEY (title_id, genre_id),
+
+    CONSTRAINT fk_title_genre_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE,
+
+    CONSTRAINT fk_title_genre_genre
+        FOREIGN KEY (genre_id)
+        REFERENCES genre (genre_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_title_genre_genre_id ON title_genre (genre_id);
+
+------------------------------------------------------------
+-- [E8] Country
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS country (
+    country_id    INTEGER PRIMARY KEY,
+    country_name  VARCHAR(100) NOT NULL COLLATE NOCASE,
+
+    CONSTRAINT uq_country_name UNIQUE (country_name)
+);
+
+------------------------------------------------------------
+-- [E9] TitleCountry (associative: Title <-> Country)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS title_country (
+    title_id    INTEGER NOT NULL,
+    country_id  INTEGER NOT NULL,
+
+    CONSTRAINT pk_title_country PRIMARY KEY (title_id, country_id),
+
+    CONSTRAINT fk_title_country_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE,
+
+    CONSTRAINT fk_title_country_country
+        FOREIGN KEY (country_id)
+        REFERENCES country (country_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_title_country_country_id ON title_country (country_id);
+
+------------------------------------------------------------
+-- [E10] Person
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS person (
+    person_id     INTEGER PRIMARY KEY,
+    full_name     VARCHAR(200) NOT NULL COLLATE NOCASE,
+    date_of_birth DATE NULL,
+    primary_role  VARCHAR(50) NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_person_full_name ON person (full_name);
+
+------------------------------------------------------------
+-- [E11] RoleType
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS role_type (
+    role_type_id  INTEGER PRIMARY KEY,
+    role_name     VARCHAR(50) NOT NULL COLLATE NOCASE,
+
+    CONSTRAINT uq_role_name UNIQUE (role_name)
+);
+
+------------------------------------------------------------
+-- [E12] TitlePersonRole (associative: Title <-> Person <-> RoleType)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS title_person_role (
+    title_id      INTEGER NOT NULL,
+    person_id     INTEGER NOT NULL,
+    role_type_id  INTEGER NOT NULL,
+    billing_order INTEGER NULL,
+
+    CONSTRAINT pk_title_person_role PRIMARY KEY (title_id, person_id, role_type_id),
+
+    CONSTRAINT fk_tpr_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE,
+
+    CONSTRAINT fk_tpr_person
+        FOREIGN KEY (person_id)
+        REFERENCES person (person_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT,
+
+    CONSTRAINT fk_tpr_role_type
+        FOREIGN KEY (role_type_id)
+        REFERENCES role_type (role_type_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_tpr_person_id ON title_person_role (person_id);
+CREATE INDEX IF NOT EXISTS idx_tpr_role_type_id ON title_person_role (role_type_id);
+
+------------------------------------------------------------
+-- [E13] StreamingAvailability
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS streaming_availability (
+    availability_id      INTEGER PRIMARY KEY,
+    streaming_service_id INTEGER NOT NULL,
+    title_id             INTEGER NOT NULL,
+    platform_show_id     VARCHAR(50) NOT NULL COLLATE NOCASE,
+    date_added           DATE NULL,                     -- ISO 'YYYY-MM-DD' text
+    duration_raw         VARCHAR(50) NULL,
+    is_exclusive         INTEGER NOT NULL DEFAULT 0,
+    availability_status  TEXT NOT NULL DEFAULT 'ACTIVE' CHECK (availability_status IN ('ACTIVE', 'EXPIRED')),
+
+    CONSTRAINT uq_sa_service_platform_show
+        UNIQUE (streaming_service_id, platform_show_id),
+
+    CONSTRAINT uq_sa_service_title
+        UNIQUE (streaming_service_id, title_id),
+
+    CONSTRAINT fk_sa_streaming_service
+        FOREIGN KEY (streaming_service_id)
+        REFERENCES streaming_service (streaming_service_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT,
+
+    CONSTRAINT fk_sa_title
+        FOREIGN KEY (title_id)
+        REFERENCES title (title_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_sa_title_id ON streaming_availability (title_id);
+CREATE INDEX IF NOT EXISTS idx_sa_service_id ON streaming_availability (streaming_service_id);
+CREATE INDEX IF NOT EXISTS idx_sa_date_added ON streaming_availability (date_added, availability_id);
+
+------------------------------------------------------------
+-- [A1] CatalogCube (pre-aggregated summary rebuilt by the ETL)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS catalog_cube (
+    cube_id          INTEGER PRIMARY KEY,
+    service_name     VARCHAR(100) NOT NULL,
+    content_type     TEXT NOT NULL CHECK (content_type IN ('MOVIE', 'TV_SHOW')),
+    release_year     INTEGER NOT NULL,
+    month_added      DATE NULL,                         -- first day of the date_added month
+    rating_bucket    VARCHAR(20) NOT NULL,
+    genre_category   VARCHAR(50) NOT NULL,
+    title_count      INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cube_genre_service ON catalog_cube (genre_category, service_name);
+
+------------------------------------------------------------
+-- [A2] DataVersion (bumped by every ETL live run)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS data_version (
+    data_version_id  INTEGER NOT NULL,                  -- always 1
+    version          INTEGER NOT NULL,
+    loaded_at        DATETIME NOT NULL,
+
+    CONSTRAINT pk_data_version PRIMARY KEY (data_version_id)
+);
+
+------------------------------------------------------------
+-- [A3] EtlSourceFingerprint (incremental ETL change detection)
+------------------------------------------------------------
+-- row_hash is stored as a signed 64-bit integer; the ETL maps it back to unsigned.
+CREATE TABLE IF NOT EXISTS etl_source_fingerprint (
+    streaming_service_id INTEGER NOT NULL,
+    platform_show_id     VARCHAR(50) NOT NULL COLLATE NOCASE,
+    row_hash             INTEGER NOT NULL,
+    updated_at           DATETIME NOT NULL,
+
+    CONSTRAINT pk_etl_source_fingerprint PRIMARY KEY (streaming_service_id, platform_show_id),
+
+    CONSTRAINT fk_fingerprint_streaming_service
+        FOREIGN KEY (streaming_service_id)
+        REFERENCES streaming_service (streaming_service_id)
+        ON UPDATE CASCADE
+        ON DELETE CASCADE
+);
+
+------------------------------------------------------------
+-- [A4] EtlRun (ETL run reports, written by --record-run)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS etl_run (
+    etl_run_id       INTEGER PRIMARY KEY,
+    started_at       DATETIME NOT NULL,
+    finished_at      DATETIME NOT NULL,
+    status           VARCHAR(10) NOT NULL,
+    mode             VARCHAR(20) NOT NULL,
+    rows_read        INTEGER NOT NULL,
+    wall_seconds     NUMERIC NOT NULL,
+    peak_memory_mb   NUMERIC NULL,
+    report           TEXT NOT NULL CHECK (json_valid(report))
+);
+
+CREATE INDEX IF NOT EXISTS idx_etl_run_started ON etl_run (started_at);
+
+------------------------------------------------------------
+-- [A5] EtlCheckpoint (progress of checkpointed ETL runs)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS etl_checkpoint (
+    service_name      VARCHAR(100) NOT NULL,
+    source_path       VARCHAR(255) NOT NULL,
+    source_signature  VARCHAR(64) NOT NULL,
+    rows_committed    INTEGER NOT NULL,
+    completed         INTEGER NOT NULL DEFAULT 0,
+    updated_at        DATETIME NOT NULL,
+
+    CONSTRAINT pk_etl_checkpoint PRIMARY KEY (service_name)
+);
+
+------------------------------------------------------------
+-- Application roles and users (users_views_triggers.sql, section 1)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app_role (
+    role_id     INTEGER PRIMARY KEY,
+    role_name   VARCHAR(50) NOT NULL,
+
+    CONSTRAINT uq_app_role_name UNIQUE (role_name)
+);
+
+INSERT OR IGNORE INTO app_role (role_name)
+VALUES ('admin'), ('analyst'), ('viewer');
+
+CREATE TABLE IF NOT EXISTS app_user (
+    user_id        INTEGER PRIMARY KEY,
+    username       VARCHAR(100) NOT NULL,
+    email          VARCHAR(255) NOT NULL,
+    password_hash  VARCHAR(255) NOT NULL,
+    role_id        INTEGER NOT NULL,
+    is_active      INTEGER NOT NULL DEFAULT 1,
+    created_at     DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_login_at  DATETIME NULL,
+
+    CONSTRAINT uq_app_user_username UNIQUE (username),
+    CONSTRAINT uq_app_user_email UNIQUE (email),
+
+    CONSTRAINT fk_app_user_role
+        FOREIGN KEY (role_id)
+        REFERENCES app_role (role_id)
+        ON UPDATE CASCADE
+        ON DELETE RESTRICT
+);
+
+------------------------------------------------------------
+-- View: platform comparison (users_views_triggers.sql, section 2)
+------------------------------------------------------------
+CREATE VIEW IF NOT EXISTS vw_service_content_summary AS
+SELECT
+    s.streaming_service_id,
+    s.service_name,
+    t.content_type,
+    COUNT(DISTINCT t.title_id) AS title_count
+FROM streaming_availability sa
+JOIN streaming_service s
+  ON sa.streaming_service_id = s.streaming_service_id
+JOIN title t
+  ON sa.title_id = t.title_id
+GROUP BY s.streaming_service_id, s.service_name, t.content_type;
+
+------------------------------------------------------------
+-- User-creation audit (users_views_triggers.sql, section 4)
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app_user_audit (
+    audit_id      INTEGER PRIMARY KEY,
+    user_id       INTEGER NOT NULL,
+    action        TEXT NOT NULL CHECK (action IN ('CREATE', 'UPDATE', 'DELETE')),
+    old_role_id   INTEGER NULL,
+    new_role_id   INTEGER NULL,
+    changed_at    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    changed_by    VARCHAR(100) NOT NULL             -- SQLite has no CURRENT_USER(); always 'sqlite'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_app_user_after_insert
+AFTER INSERT ON app_user
+FOR EACH ROW
+BEGIN
+    INSERT INTO app_user_audit (user_id, action, old_role_id, new_role_id, changed_by)
+    VALUES (NEW.user_id, 'CREATE', NULL, NEW.role_id, 'sqlite');
+END;
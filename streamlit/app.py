@@ -7,6 +7,7 @@ import logging
 import streamlit as st
 
 from config import get_settings
+from filter_metadata import check_data_version
 from views import admin_dashboard, analyst_dashboard, auth_page, high_level, overview, questions, viewer_dashboard
 from pathlib import Path
 
@@ -100,6 +101,7 @@ def _maybe_reroute(current_key: str, chosen_key: str) -> None:
 
 def run() -> None:
     st.set_page_config(page_title="Streaming Market Intelligence", layout="wide")
+    check_data_version()
     if "current_page" not in st.session_state:
         st.session_state["current_page"] = "home"
 
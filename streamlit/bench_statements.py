@@ -0,0 +1,140 @@
+"""Micro-benchmark of the per-call Python cost of the ``fetch_*`` statements.
+
+For every prebuilt statement builder in ``queries`` and a few filter states,
+this times what a call costs before the database sees the SQL: binding the
+filters, getting the statement, and the compiled-cache lookup with parameter
+processing that ``Connection.execute`` does. Nothing is executed. Each cell is
+measured twice: with the cached template ("after"), and rebuilding the
+construct on every call as the query layer did before templates ("before").
+
+Run ``python bench_statements.py [calls]`` against the configured database;
+it is only read for the filter metadata and the in-memory indexes.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import time
+from typing import Any, Callable
+
+import queries
+from db import get_engine
+from filters import FilterState
+from title_search import title_search_match
+
+DEFAULT_CALLS = 300
+# Anchor title keyword for the similarity query
+_SIMILARITY_KEYWORD = "love"
+
+
+def _sample_filter_states() -> dict[str, FilterState | None]:
+    options = inspect.unwrap(queries.fetch_filter_options)()
+    services = tuple(sorted(options.services)[:2])
+    return {
+        "none": None,
+        "services": FilterState(services, (), (), (), (None, None), (None, None), None),
+        "all filters": FilterState(
+            services,
+            ("MOVIE",),
+            tuple(sorted(options.genres)[:2]),
+            tuple(sorted(options.countries)[:2]),
+            options.release_year_bounds,
+            options.date_added_bounds,
+            None,
+        ),
+        "title search": FilterState(services, (), (), (), (None, None), (None, None), _SIMILARITY_KEYWORD),
+    }
+
+
+def _statement_builders() -> dict[str, Callable]:
+    """The lru-cached ``_*_statement`` template builders in ``queries``."""
+
+    return {
+        name: builder
+        for name, builder in sorted(vars(queries).items())
+        if name.endswith("_statement") and hasattr(builder, "cache_info")
+    }
+
+
+def _call_for(name: str, filters: FilterState | None) -> Callable[[], tuple[tuple, dict[str, Any]]] | None:
+    """Per-call binding for builder ``name``: returns its arguments and parameters, or None if it does not apply."""
+
+    if "_cube_" in name:
+        if queries._bind_cube_filters(filters) is None:
+            return None
+
+        def bind():
+            shape, params = queries._bind_cube_filters(filters)
+            return (shape,), params
+
+    elif name == "_catalog_rows_statement":
+
+        def bind():
+            shape, params = queries._bind_filters(filters)
+            params["page_limit"] = 51
+            return (shape, "newest", True, None), params
+
+    elif name == "_similarity_candidates_statement":
+
+        def bind():
+            shape, params = queries._bind_filters(filters)
+            anchor_match, params["anchor_search"] = title_search_match(_SIMILARITY_KEYWORD)
+            return (shape, anchor_match), params
+
+    else:
+
+        def bind():
+            shape, params = queries._bind_filters(filters)
+            return (shape,), params
+
+    return bind
+
+
+def _time_calls(build: Callable, bind: Callable, calls: int, dialect, compiled_cache: dict) -> float:
+    """Mean microseconds per bind + build + compiled-cache lookup."""
+
+    def one_call():
+        args, params = bind()
+        statement = build(*args)
+        # The lookup Connection.execute does before handing SQL to the driver.
+        compiled, extracted, _, _ = statement._compile_w_cache(
+            dialect, compiled_cache=compiled_cache, column_keys=sorted(params), for_executemany=False
+        )
+        compiled.construct_params(params, extracted_parameters=extracted, escape_names=False)
+
+    one_call()  # warm the compiled cache and the indexes
+    started = time.perf_counter()
+    for _ in range(calls):
+        one_call()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def run(calls: int = DEFAULT_CALLS) -> None:
+    dialect = get_engine().dialect
+    compiled_cache: dict = {}
+    states = _sample_filter_states()
+    totals = {label: [0.0, 0.0] for label in states}
+
+    print(f"Microseconds per call (before / after), mean of {calls} calls")
+    print(f"{'statement':42s}" + "".join(f"{label:>22s}" for label in states))
+    for name, builder in _statement_builders().items():
+        cells = []
+        for label, filters in states.items():
+            bind = _call_for(name, filters)
+            if bind is None:
+                cells.append(f"{'-':>22s}")
+                continue
+            before = _time_calls(builder.__wrapped__, bind, calls, dialect, compiled_cache)
+            after = _time_calls(builder, bind, calls, dialect, compiled_cache)
+            totals[label][0] += before
+            totals[label][1] += after
+            cells.append(f"{before:12.0f} / {after:7.0f}")
+        print(f"{name:42s}" + "".join(cells))
+
+    print(f"{'total':42s}" + "".join(f"{before:12.0f} / {after:7.0f}" for before, after in totals.values()))
+    print(f"{'speedup':42s}" + "".join(f"{before / after:21.0f}x" for before, after in totals.values()))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS)
@@ -0,0 +1,263 @@
+"""Per-value title bitmaps used to resolve FilterState selections to title ids.
+
+Each genre, country, service, content type and release year maps to a bitmap
+over dense title positions (bit ``i`` set means the i-th title by id has that
+value). Python integers give us compact, arbitrary-length bitsets with
+C-speed AND/OR, so a multi-genre selection costs a handful of big-int
+operations instead of a correlated EXISTS per candidate row.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+from sqlalchemy import false, select
+
+from config import get_settings
+from db import get_session
+from filters import FilterState
+from models import Country, Genre, StreamingAvailability, StreamingService, Title, TitleCountry, TitleGenre
+
+_RESOLVED_CACHE_SIZE = 64
+# Past this many ids a bound IN list costs the database more than the
+# predicates it replaces (100k ids ran ~7x slower than the EXISTS filters).
+MAX_BOUND_IDS = 1000
+
+
+def _to_bitmap(positions: np.ndarray, size: int) -> int:
+    bits = np.zeros(size, dtype=bool)
+    bits[positions] = True
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+
+def _bitmaps_by_value(values: Iterable, positions: np.ndarray, size: int) -> dict[str, int]:
+    values = np.asarray(list(values), dtype=object)
+    bitmaps: dict[str, int] = {}
+    for value in set(values.tolist()):
+        if value is None:
+            continue
+        # MySQL compares these columns case-insensitively (utf8mb4_unicode_ci).
+        key = str(value).casefold()
+        bitmaps[key] = bitmaps.get(key, 0) | _to_bitmap(positions[values == value], size)
+    return bitmaps
+
+
+@dataclass(frozen=True)
+class TitleIdSet:
+    """A resolved set of title ids, kept as whichever of it or its complement is shorter.
+
+    ``kind`` is "none", "all", "in" (``ids`` are the matches), "not_in"
+    (``ids`` are the titles that do not match) or "unbounded" (both sides are
+    longer than ``MAX_BOUND_IDS``, so callers filter with SQL predicates instead).
+    """
+
+    kind: str
+    ids: tuple[int, ...]
+
+    @classmethod
+    def shorter_side(
+        cls,
+        total: int,
+        matched: int,
+        matched_ids: Callable[[], tuple[int, ...]],
+        excluded_ids: Callable[[], tuple[int, ...]],
+    ) -> "TitleIdSet":
+        """Build the set from counts; only the kept side's ids are materialized."""
+
+        if not matched:
+            return cls("none", ())
+        excluded = total - matched
+        if not excluded:
+            return cls("all", ())
+        # Whichever list is shorter keeps the IN clause (and its bind list) small.
+        if min(matched, excluded) > MAX_BOUND_IDS:
+            return cls("unbounded", ())
+        if excluded < matched:
+            return cls("not_in", excluded_ids())
+        return cls("in", matched_ids())
+
+    @property
+    def bounded(self) -> bool:
+        """Whether the set can be bound as an id list."""
+
+        return self.kind != "unbounded"
+
+    @property
+    def match(self) -> tuple[str, tuple[int, ...]]:
+        """``(kind, ids)`` for ``id_match_condition``."""
+
+        return self.kind, self.ids
+
+    def as_condition(self, column):
+        return id_match_condition(self.kind, column, self.ids)
+
+
+def id_match_condition(kind: str, column, ids):
+    """Predicate for a ``TitleIdSet.match`` kind, or None for "all".
+
+    ``ids`` is either the id tuple or an expanding ``bindparam`` standing in
+    for it, so prebuilt statements can take the ids at execution time.
+    """
+
+    if kind == "none":
+        return false()
+    if kind == "all":
+        return None
+    return column.not_in(ids) if kind == "not_in" else column.in_(ids)
+
+
+class TitleBitmapIndex:
+    """Bitmap index over title positions for the title-level filter dimensions."""
+
+    def __init__(
+        self,
+        title_ids: np.ndarray,
+        genres: Mapping[str, int],
+        countries: Mapping[str, int],
+        services: Mapping[str, int],
+        content_types: Mapping[str, int],
+        release_years: Mapping[int, int],
+    ) -> None:
+        self.title_ids = title_ids
+        self.size = len(title_ids)
+        self.universe = (1 << self.size) - 1
+        self.genres = dict(genres)
+        self.countries = dict(countries)
+        self.services = dict(services)
+        self.content_types = dict(content_types)
+        self.release_years = dict(release_years)
+        self._resolved: OrderedDict[FilterState, TitleIdSet] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> "TitleBitmapIndex":
+        with get_session() as session:
+            titles = session.execute(
+                select(Title.title_id, Title.content_type, Title.release_year).order_by(Title.title_id)
+            ).all()
+            genre_links = session.execute(
+                select(TitleGenre.title_id, Genre.genre_name).join(Genre, Genre.genre_id == TitleGenre.genre_id)
+            ).all()
+            country_links = session.execute(
+                select(TitleCountry.title_id, Country.country_name).join(
+                    Country, Country.country_id == TitleCountry.country_id
+                )
+            ).all()
+            service_links = session.execute(
+                select(StreamingAvailability.title_id, StreamingService.service_name).join(
+                    StreamingService,
+                    StreamingService.streaming_service_id == StreamingAvailability.streaming_service_id,
+                )
+            ).all()
+
+        title_ids = np.asarray([row.title_id for row in titles], dtype=np.int64)
+        size = len(title_ids)
+        all_positions = np.arange(size)
+
+        def link_bitmaps(links) -> dict[str, int]:
+            if not links:
+                return {}
+            ids = np.asarray([row[0] for row in links], dtype=np.int64)
+            positions = np.searchsorted(title_ids, ids)
+            return _bitmaps_by_value((row[1] for row in links), positions, size)
+
+        years = np.asarray([row.release_year for row in titles])
+        release_years = {
+            int(year): _to_bitmap(all_positions[years == year], size) for year in np.unique(years)
+        }
+
+        return cls(
+            title_ids=title_ids,
+            genres=link_bitmaps(genre_links),
+            countries=link_bitmaps(country_links),
+            services=link_bitmaps(service_links),
+            content_types=_bitmaps_by_value((row.content_type for row in titles), all_positions, size),
+            release_years=release_years,
+        )
+
+    def _any_of(self, bitmaps: Mapping[str, int], selected: Iterable[str]) -> int:
+        result = 0
+        for value in selected:
+            result |= bitmaps.get(value.casefold(), 0)
+        return result
+
+    def _bitmap_for(self, filters: FilterState) -> int:
+        result = self.universe
+        if filters.genres:
+            result &= self._any_of(self.genres, filters.genres)
+        if filters.countries:
+            result &= self._any_of(self.countries, filters.countries)
+        if filters.services:
+            result &= self._any_of(self.services, filters.services)
+        if filters.content_types:
+            result &= self._any_of(self.content_types, filters.content_types)
+
+        release_start, release_end = filters.release_year_range
+        if release_start is not None and release_end is not None:
+            years = 0
+            for year, bitmap in self.release_years.items():
+                if release_start <= year <= release_end:
+                    years |= bitmap
+            result &= years
+        return result
+
+    def _ids_for(self, bitmap: int) -> tuple[int, ...]:
+        if not bitmap:
+            return ()
+        raw = np.frombuffer(bitmap.to_bytes((self.size + 7) // 8, "little"), dtype=np.uint8)
+        positions = np.flatnonzero(np.unpackbits(raw, bitorder="little")[: self.size])
+        return tuple(self.title_ids[positions].tolist())
+
+    def resolve(self, filters: FilterState) -> TitleIdSet:
+        """Resolve the title-level predicates of ``filters`` to a title-id set.
+
+        Results are memoized on the normalized filters, so every ``fetch_*``
+        call in a rerun reuses the same set.
+        """
+
+        key = filters.normalized()
+        with self._lock:
+            cached = self._resolved.get(key)
+            if cached is not None:
+                self._resolved.move_to_end(key)
+                return cached
+
+        bitmap = self._bitmap_for(key)
+        resolved = TitleIdSet.shorter_side(
+            self.size,
+            bitmap.bit_count(),
+            lambda: self._ids_for(bitmap),
+            lambda: self._ids_for(self.universe & ~bitmap),
+        )
+        with self._lock:
+            self._resolved[key] = resolved
+            while len(self._resolved) > _RESOLVED_CACHE_SIZE:
+                self._resolved.popitem(last=False)
+        return resolved
+
+
+_INDEX: TitleBitmapIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_bitmap_index() -> TitleBitmapIndex:
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = TitleBitmapIndex.load()
+    return _INDEX
+
+
+def reset_bitmap_index() -> None:
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def bitmap_index_enabled() -> bool:
+    return get_settings().filter_bitmap_index
@@ -0,0 +1,159 @@
+"""Rating and genre bucket definitions shared by the SQL and in-memory query paths."""
+
+from __future__ import annotations
+
+RATING_G = ("G", "TV-G", "TV-Y", "Y")
+RATING_PG = ("PG", "TV-PG", "TV-Y7", "TV-Y7-FV")
+RATING_PG13 = ("PG-13", "TV-14")
+RATING_R = ("R", "NC-17", "TV-MA")
+
+# genre_category value used by catalog_cube rows that roll up every genre.
+CUBE_ALL_GENRES = "*"
+
+GENRE_GROUPS = {
+    "Kids & Family": (
+        "Children & Family Movies",
+        "Family",
+        "Kids",
+        "Teen",
+        "Teen TV Shows",
+        "Young Adult Audience",
+        "Coming of Age",
+    ),
+    "Comedy": (
+        "Comedy",
+        "Comedies",
+        "TV Comedies",
+        "Sitcom",
+        "Stand Up",
+        "Stand-Up Comedy",
+        "Stand-Up Comedy & Talk Shows",
+        "Sketch Comedy",
+        "Parody",
+        "Variety",
+        "Late Night",
+        "Talk Show",
+        "Talk Show and Variety",
+        "Game Shows",
+        "Game Show / Competition",
+        "Buddy",
+    ),
+    "Drama": (
+        "Drama",
+        "Dramas",
+        "TV Dramas",
+        "Anthology",
+        "Soap Opera / Melodrama",
+        "Medical",
+    ),
+    "Action & Adventure": (
+        "Action",
+        "Action & Adventure",
+        "Action-Adventure",
+        "Adventure",
+        "Disaster",
+        "Spy/Espionage",
+        "Police/Cop",
+        "Survival",
+        "Superhero",
+        "Military and War",
+        "Western",
+        "TV Action & Adventure",
+    ),
+    "Horror & Thriller": (
+        "Horror",
+        "Horror Movies",
+        "Thriller",
+        "Thrillers",
+        "Suspense",
+        "TV Horror",
+        "TV Thrillers",
+    ),
+    "Romance": (
+        "Romance",
+        "Romantic Movies",
+        "Romantic TV Shows",
+        "Romantic Comedy",
+    ),
+    "Sci-Fi & Fantasy": (
+        "Sci-Fi & Fantasy",
+        "Science Fiction",
+        "TV Sci-Fi & Fantasy",
+        "Fantasy",
+    ),
+    "Crime & Mystery": (
+        "Crime",
+        "Crime TV Shows",
+        "Mystery",
+        "TV Mysteries",
+    ),
+    "Documentary & History": (
+        "Documentary",
+        "Documentaries",
+        "Docuseries",
+        "Biographical",
+        "Historical",
+        "History",
+        "Science & Nature TV",
+        "Science & Technology",
+        "Animals & Nature",
+        "Special Interest",
+        "News",
+    ),
+    "Music & Performing Arts": (
+        "Music",
+        "Music & Musicals",
+        "Music Videos and Concerts",
+        "Musical",
+        "Concert Film",
+        "Dance",
+        "Arts",
+    ),
+    "Animation & Anime": (
+        "Anime",
+        "Anime Features",
+        "Anime Series",
+        "Animation",
+        "Adult Animation",
+        "Cartoons",
+    ),
+    "International / Regional": (
+        "International",
+        "International Movies",
+        "International TV Shows",
+        "British TV Shows",
+        "Korean TV Shows",
+        "Spanish-Language TV Shows",
+        "Latino",
+        "Black Stories",
+    ),
+}
+
+
+def rating_bucket(rating_code: str | None) -> str:
+    code = (rating_code or "").upper()
+    if code in RATING_G:
+        return "G"
+    if code in RATING_PG:
+        return "PG"
+    if code in RATING_PG13:
+        return "PG-13"
+    if code in RATING_R:
+        return "R/TV-MA"
+    return "Unrated/Other"
+
+
+def maturity_bucket(rating_code: str | None) -> str:
+    code = (rating_code or "").upper()
+    if code in RATING_G + RATING_PG:
+        return "Family (G/PG)"
+    if code in RATING_PG13 + RATING_R:
+        return "Mature (PG-13+/R)"
+    return "Other / Unrated"
+
+
+def genre_category(genre_name: str | None) -> str:
+    for label, names in GENRE_GROUPS.items():
+        if genre_name in names:
+            return label
+    return "Other"
@@ -0,0 +1,455 @@
+"""In-memory columnar catalog engine for the dashboard aggregations.
+
+The title x service x genre x country fact data is loaded once into
+dictionary-encoded NumPy arrays. ``FilterState`` selections become boolean
+masks and every aggregation is a vectorized distinct-count group-by, so the
+supported ``fetch_*`` functions never touch MySQL after the initial load.
+
+Run ``python columnar.py`` to diff every supported query against the SQL path.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import threading
+from typing import Callable, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from buckets import genre_category, maturity_bucket, rating_bucket
+from config import get_settings
+from db import get_session
+from filters import FilterState
+from models import Country, Genre, StreamingAvailability, StreamingService, Title, TitleCountry, TitleGenre
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_QUERIES = (
+    "fetch_overview_metrics",
+    "fetch_platform_breakdown",
+    "fetch_genre_distribution",
+    "fetch_release_year_trend",
+    "fetch_rating_distribution",
+    "fetch_maturity_mix",
+    "fetch_date_added_trend",
+)
+
+
+def _encode(values: Sequence) -> tuple[np.ndarray, np.ndarray]:
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    return codes.astype(np.int32), np.asarray(uniques, dtype=object)
+
+
+def _lookup_codes(dictionary: np.ndarray, wanted: Sequence[str]) -> np.ndarray:
+    # MySQL compares these columns case-insensitively (utf8mb4_unicode_ci).
+    wanted_set = {value.casefold() for value in wanted}
+    return np.flatnonzero([str(value).casefold() in wanted_set for value in dictionary])
+
+
+def _distinct_counts(group_codes: np.ndarray, title_pos: np.ndarray, n_titles: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (group codes, distinct title counts) for the given (group, title) pairs."""
+
+    if group_codes.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(group_codes.astype(np.int64) * n_titles + title_pos)
+    groups, counts = np.unique(pairs // n_titles, return_counts=True)
+    return groups, counts
+
+
+class ColumnarCatalog:
+    """Dictionary-encoded snapshot of the catalog fact tables."""
+
+    def __init__(
+        self,
+        titles: pd.DataFrame,
+        availability: pd.DataFrame,
+        title_genres: pd.DataFrame,
+        title_countries: pd.DataFrame,
+    ) -> None:
+        # Title dimension, indexed by dense title position.
+        self.title_ids = titles["title_id"].to_numpy(dtype=np.int64)
+        self.n_titles = max(len(self.title_ids), 1)
+        position = pd.Series(np.arange(len(self.title_ids), dtype=np.int32), index=self.title_ids)
+        # Title search matches either name; NUL cannot appear in a search term.
+        self.title_names = (
+            (titles["global_title_name"].fillna("").astype(str) + "\0" + titles["original_title"].fillna("").astype(str))
+            .str.casefold()
+            .to_numpy(dtype=object)
+        )
+        self.release_year = titles["release_year"].to_numpy(dtype=np.int32)
+        self.content_type, self.content_types = _encode(titles["content_type"])
+        self.is_movie = self.content_type == _first_code(self.content_types, "MOVIE")
+        self.is_tv_show = self.content_type == _first_code(self.content_types, "TV_SHOW")
+
+        rating_codes, ratings = _encode(titles["age_rating_code"])
+        self.rating_bucket, self.rating_buckets = _remap(rating_codes, ratings, rating_bucket)
+        self.maturity_bucket, self.maturity_buckets = _remap(rating_codes, ratings, maturity_bucket)
+
+        # Availability facts, one row per (service, title).
+        self.av_title = position.reindex(availability["title_id"].to_numpy()).to_numpy(dtype=np.int32)
+        self.av_service, self.services = _encode(availability["service_name"])
+        self.av_date = pd.to_datetime(availability["date_added"]).to_numpy(dtype="datetime64[D]")
+
+        # Bridge tables.
+        self.tg_title = position.reindex(title_genres["title_id"].to_numpy()).to_numpy(dtype=np.int32)
+        self.tg_genre, self.genres = _encode(title_genres["genre_name"])
+        self.genre_category, self.genre_categories = _remap(self.tg_genre, self.genres, genre_category)
+        self.tc_title = position.reindex(title_countries["title_id"].to_numpy()).to_numpy(dtype=np.int32)
+        self.tc_country, self.countries = _encode(title_countries["country_name"])
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls) -> "ColumnarCatalog":
+        with get_session() as session:
+            titles = session.execute(
+                select(
+                    Title.title_id,
+                    Title.global_title_name,
+                    Title.original_title,
+                    Title.release_year,
+                    Title.content_type,
+                    Title.age_rating_code,
+                )
+            ).mappings().all()
+            availability = session.execute(
+                select(
+                    StreamingAvailability.title_id,
+                    StreamingService.service_name,
+                    StreamingAvailability.date_added,
+                ).join(
+                    StreamingService,
+                    StreamingService.streaming_service_id == StreamingAvailability.streaming_service_id,
+                )
+            ).mappings().all()
+            title_genres = session.execute(
+                select(TitleGenre.title_id, Genre.genre_name).join(Genre, Genre.genre_id == TitleGenre.genre_id)
+            ).mappings().all()
+            title_countries = session.execute(
+                select(TitleCountry.title_id, Country.country_name).join(
+                    Country, Country.country_id == TitleCountry.country_id
+                )
+            ).mappings().all()
+
+        return cls(
+            titles=pd.DataFrame(titles, columns=["title_id", "global_title_name", "original_title", "release_year", "content_type", "age_rating_code"]),
+            availability=pd.DataFrame(availability, columns=["title_id", "service_name", "date_added"]),
+            title_genres=pd.DataFrame(title_genres, columns=["title_id", "genre_name"]),
+            title_countries=pd.DataFrame(title_countries, columns=["title_id", "country_name"]),
+        )
+
+    # ------------------------------------------------------------------
+    # Filter evaluation
+    # ------------------------------------------------------------------
+
+    def _title_mask(self, filters: FilterState | None) -> np.ndarray:
+        mask = np.ones(len(self.title_ids), dtype=bool)
+        if not filters:
+            return mask
+
+        if filters.content_types:
+            mask &= np.isin(self.content_type, _lookup_codes(self.content_types, filters.content_types))
+
+        if filters.genres:
+            has_genre = np.zeros(len(self.title_ids), dtype=bool)
+            links = np.isin(self.tg_genre, _lookup_codes(self.genres, filters.genres))
+            has_genre[self.tg_title[links]] = True
+            mask &= has_genre
+
+        if filters.countries:
+            has_country = np.zeros(len(self.title_ids), dtype=bool)
+            links = np.isin(self.tc_country, _lookup_codes(self.countries, filters.countries))
+            has_country[self.tc_title[links]] = True
+            mask &= has_country
+
+        release_start, release_end = filters.release_year_range
+        if release_start is not None and release_end is not None:
+            mask &= (self.release_year >= release_start) & (self.release_year <= release_end)
+
+        if filters.title_search:
+            term = filters.title_search.strip().casefold()
+            mask &= np.fromiter((term in name for name in self.title_names), dtype=bool, count=len(self.title_names))
+
+        return mask
+
+    def _availability_mask(self, filters: FilterState | None) -> np.ndarray:
+        mask = self._title_mask(filters)[self.av_title]
+        if not filters:
+            return mask
+
+        if filters.services:
+            mask &= np.isin(self.av_service, _lookup_codes(self.services, filters.services))
+
+        date_start, date_end = filters.date_added_range
+        if date_start is not None and date_end is not None:
+            start = np.datetime64(date_start, "D")
+            end = np.datetime64(date_end, "D")
+            mask &= (self.av_date >= start) & (self.av_date <= end)
+
+        return mask
+
+    # ------------------------------------------------------------------
+    # Aggregations mirroring queries.fetch_*
+    # ------------------------------------------------------------------
+
+    def fetch_overview_metrics(self, filters: FilterState | None) -> pd.DataFrame:
+        selected = np.zeros(len(self.title_ids), dtype=bool)
+        selected[self.av_title[self._availability_mask(filters)]] = True
+
+        return pd.DataFrame(
+            [
+                {
+                    "total_titles": int(selected.sum()),
+                    "movie_count": int((selected & self.is_movie).sum()),
+                    "tv_show_count": int((selected & self.is_tv_show).sum()),
+                    "distinct_genres": int(np.unique(self.tg_genre[selected[self.tg_title]]).size),
+                    "distinct_countries": int(np.unique(self.tc_country[selected[self.tc_title]]).size),
+                }
+            ]
+        )
+
+    def fetch_platform_breakdown(self, filters: FilterState | None) -> pd.DataFrame:
+        mask = self._availability_mask(filters)
+        services = self.av_service[mask]
+        rows = self.av_title[mask]
+        groups, counts = _distinct_counts(services, rows, self.n_titles)
+        if groups.size == 0:
+            return pd.DataFrame()
+
+        n_services = len(self.services)
+        movie_counts = np.bincount(services, weights=self.is_movie[rows], minlength=n_services)
+        tv_counts = np.bincount(services, weights=self.is_tv_show[rows], minlength=n_services)
+        df = pd.DataFrame(
+            {
+                "service_name": self.services[groups],
+                "total_titles": counts,
+                "movie_count": movie_counts[groups].astype(np.int64),
+                "tv_show_count": tv_counts[groups].astype(np.int64),
+            }
+        )
+        return df.sort_values(["total_titles", "service_name"], ascending=[False, True], ignore_index=True)
+
+    def fetch_genre_distribution(self, filters: FilterState | None) -> pd.DataFrame:
+        selected = np.zeros(len(self.title_ids), dtype=bool)
+        selected[self.av_title[self._availability_mask(filters)]] = True
+        links = selected[self.tg_title]
+        groups, counts = _distinct_counts(self.genre_category[links], self.tg_title[links], self.n_titles)
+        if groups.size == 0:
+            return pd.DataFrame()
+
+        df = pd.DataFrame({"genre_category": self.genre_categories[groups], "title_count": counts})
+        return df.sort_values(["title_count", "genre_category"], ascending=[False, True], ignore_index=True)
+
+    def fetch_release_year_trend(self, filters: FilterState | None) -> pd.DataFrame:
+        mask = self._availability_mask(filters)
+        rows = self.av_title[mask]
+        years, year_codes = np.unique(self.release_year[rows], return_inverse=True)
+        df = self._grouped_counts(
+            year_codes.reshape(-1) * len(self.services) + self.av_service[mask],
+            rows,
+            lambda groups: {
+                "release_year": years[groups // len(self.services)],
+                "service_name": self.services[groups % len(self.services)],
+            },
+        )
+        if df.empty:
+            return df
+        return df.sort_values(["release_year", "service_name"], ignore_index=True)
+
+    def fetch_rating_distribution(self, filters: FilterState | None = None) -> pd.DataFrame:
+        return self._service_bucket_counts(filters, self.rating_bucket, self.rating_buckets, "rating_bucket")
+
+    def fetch_maturity_mix(self, filters: FilterState | None = None) -> pd.DataFrame:
+        df = self._service_bucket_counts(filters, self.maturity_bucket, self.maturity_buckets, "content_group")
+        if not df.empty:
+            df["share"] = df.groupby("service_name")["title_count"].transform(lambda series: series / series.sum())
+        return df
+
+    def fetch_date_added_trend(self, filters: FilterState | None) -> pd.DataFrame:
+        mask = self._availability_mask(filters) & ~np.isnat(self.av_date)
+        rows = self.av_title[mask]
+        months, month_codes = np.unique(self.av_date[mask].astype("datetime64[M]"), return_inverse=True)
+        labels = np.datetime_as_string(months.astype("datetime64[D]"), unit="D").astype(object)
+        df = self._grouped_counts(
+            month_codes.reshape(-1) * len(self.services) + self.av_service[mask],
+            rows,
+            lambda groups: {
+                "month_bucket": labels[groups // len(self.services)],
+                "service_name": self.services[groups % len(self.services)],
+            },
+        )
+        if df.empty:
+            return df
+        return df.sort_values(["month_bucket", "service_name"], ignore_index=True)
+
+    def _service_bucket_counts(
+        self,
+        filters: FilterState | None,
+        title_buckets: np.ndarray,
+        bucket_labels: np.ndarray,
+        column: str,
+    ) -> pd.DataFrame:
+        mask = self._availability_mask(filters)
+        rows = self.av_title[mask]
+        df = self._grouped_counts(
+            self.av_service[mask] * len(bucket_labels) + title_buckets[rows],
+            rows,
+            lambda groups: {
+                "service_name": self.services[groups // len(bucket_labels)],
+                column: bucket_labels[groups % len(bucket_labels)],
+            },
+        )
+        if df.empty:
+            return df
+        return df.sort_values(["service_name", column], ignore_index=True)
+
+    def _grouped_counts(
+        self,
+        group_codes: np.ndarray,
+        rows: np.ndarray,
+        decode: Callable[[np.ndarray], dict],
+    ) -> pd.DataFrame:
+        groups, counts = _distinct_counts(group_codes, rows, self.n_titles)
+        if groups.size == 0:
+            return pd.DataFrame()
+        columns = decode(groups)
+        columns["title_count"] = counts
+        return pd.DataFrame(columns)
+
+
+def _first_code(dictionary: np.ndarray, value: str) -> int:
+    matches = np.flatnonzero(dictionary == value)
+    return int(matches[0]) if matches.size else -1
+
+
+def _remap(codes: np.ndarray, dictionary: np.ndarray, mapper: Callable) -> tuple[np.ndarray, np.ndarray]:
+    """Map dictionary-encoded values through ``mapper`` and re-encode the labels."""
+
+    mapped = [mapper(value if isinstance(value, str) else None) for value in dictionary] + [mapper(None)]
+    label_codes, labels = _encode(mapped)
+    # factorize uses -1 for missing values; route those to the mapper(None) label.
+    return label_codes[codes], labels
+
+
+_CATALOG: ColumnarCatalog | None = None
+_CATALOG_LOCK = threading.Lock()
+
+
+def get_catalog() -> ColumnarCatalog:
+    global _CATALOG
+    if _CATALOG is None:
+        with _CATALOG_LOCK:
+            if _CATALOG is None:
+                _CATALOG = ColumnarCatalog.load()
+    return _CATALOG
+
+
+def reset_catalog() -> None:
+    global _CATALOG
+    with _CATALOG_LOCK:
+        _CATALOG = None
+
+
+def columnar_enabled() -> bool:
+    return get_settings().query_engine == "columnar"
+
+
+def columnar_capable(func: Callable) -> Callable:
+    """Route a ``fetch_*`` function to the columnar engine when it is selected."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if columnar_enabled():
+            return getattr(get_catalog(), func.__name__)(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+# ----------------------------------------------------------------------
+# Differential check against the SQL path
+# ----------------------------------------------------------------------
+
+
+def _canonical(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty:
+        return df
+    df = df.copy()
+    for column in df.columns:
+        numeric = pd.to_numeric(df[column], errors="coerce")
+        if numeric.notna().sum() == df[column].notna().sum():
+            df[column] = numeric.astype(float)
+        else:
+            df[column] = df[column].astype(str)
+    keys = [column for column in df.columns if df[column].dtype == object]
+    return df.sort_values(keys or list(df.columns), ignore_index=True)
+
+
+def compare_with_sql(filters_list: Sequence[FilterState | None]) -> list[str]:
+    """Run every supported query through both engines and describe any mismatches."""
+
+    import queries
+
+    catalog = ColumnarCatalog.load()
+    mismatches: list[str] = []
+    for filters in filters_list:
+        for name in SUPPORTED_QUERIES:
+            expected = _canonical(inspect.unwrap(getattr(queries, name))(filters))
+            actual = _canonical(getattr(catalog, name)(filters))
+            if expected.empty and actual.empty:
+                continue
+            try:
+                pd.testing.assert_frame_equal(
+                    expected[sorted(expected.columns)],
+                    actual[sorted(actual.columns)],
+                    check_dtype=False,
+                )
+            except (AssertionError, KeyError) as exc:
+                mismatches.append(f"{name}({filters}): {exc}")
+    return mismatches
+
+
+def _sample_filter_states() -> list[FilterState | None]:
+    """Filter states for the differential check, or [] when the filter metadata cannot be read."""
+
+    import queries
+
+    try:
+        options = inspect.unwrap(queries.fetch_filter_options)()
+    except DBAPIError:
+        logger.exception("Could not load filter metadata for the differential check.")
+        return []
+
+    genres = tuple(sorted(options.genres)[:5])
+    countries = tuple(sorted(options.countries)[:3])
+    services = tuple(sorted(options.services)[:2])
+    date_min, date_max = options.date_added_bounds
+    return [
+        None,
+        FilterState(services, ("MOVIE",), (), (), (None, None), (None, None), None),
+        FilterState((), ("MOVIE", "TV_SHOW"), genres, (), (1990, 2020), (None, None), None),
+        FilterState((), (), (), countries, (None, None), (date_min, date_max), None),
+        FilterState(services, ("TV_SHOW",), genres, countries, (2000, 2021), (date_min, date_max), "the"),
+        FilterState((), (), (), (), (None, None), (None, None), "no such title zzz"),
+    ]
+
+
+if __name__ == "__main__":
+    states = _sample_filter_states()
+    if not states:
+        raise SystemExit("No sample filter states could be built; the differential check did not run.")
+    problems = compare_with_sql(states)
+    for problem in problems:
+        print(problem)
+    print(
+        f"Columnar engine matches SQL on {len(states)} filter states."
+        if not problems
+        else f"{len(problems)} mismatches found."
+    )
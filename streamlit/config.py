@@ -29,6 +29,8 @@ class DatabaseSettings:
     user: str
     password: str
     name: str
+    backend: str = "mysql"
+    sqlite_path: str = ""
 
 
 @dataclass(frozen=True)
@@ -39,6 +41,34 @@ class VisualizationSettings:
     plotly_template: str = "plotly_white"
 
 
+@dataclass(frozen=True)
+class QueryCacheSettings:
+    """Limits for the process-wide query result cache."""
+
+    max_entries: int = 256
+    max_bytes: int = 64 * 1024 * 1024
+    ttl_seconds: float = 600.0
+
+
+@dataclass(frozen=True)
+class QueryLogSettings:
+    """SQL timing ring buffer and slow-query log."""
+
+    max_entries: int = 2000
+    slow_ms: float = 500.0
+    slow_log_path: str = ""
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """SQLAlchemy connection pool limits shared by every Streamlit session."""
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout_seconds: float = 30.0
+    recycle_seconds: int = 1800
+
+
 @dataclass(frozen=True)
 class AppSettings:
     """Aggregate configuration consumed throughout the dashboard."""
@@ -58,13 +88,25 @@ class AppSettings:
     visualization: VisualizationSettings = field(
         default_factory=VisualizationSettings
     )
+    query_cache: QueryCacheSettings = field(default_factory=QueryCacheSettings)
+    pool: PoolSettings = field(default_factory=PoolSettings)
+    query_log: QueryLogSettings = field(default_factory=QueryLogSettings)
+    query_engine: str = "sql"
+    filter_bitmap_index: bool = True
+    title_search_index: bool = True
+    prefetch_workers: int = 8
+    query_timeout_seconds: float = 30.0
+    filter_metadata_check_seconds: float = 30.0
     summary: str = field(init=False)
 
     def __post_init__(self) -> None:
-        summary = (
-            f"Database host={self.database.host}:{self.database.port}, "
-            f"user={self.database.user}, schema={self.database.name}"
-        )
+        if self.database.backend == "sqlite":
+            summary = f"Database sqlite file={self.database.sqlite_path}"
+        else:
+            summary = (
+                f"Database host={self.database.host}:{self.database.port}, "
+                f"user={self.database.user}, schema={self.database.name}"
+            )
         object.__setattr__(self, "summary", summary)
 
     def settings_summary(self) -> str:
@@ -75,6 +117,8 @@ class AppSettings:
 def get_settings() -> AppSettings:
     """Return cached application settings."""
 
+    # An empty SLOW_QUERY_LOG turns the slow-query file off.
+    slow_query_log = os.getenv("SLOW_QUERY_LOG", "slow_queries.log").strip()
     return AppSettings(
         database=DatabaseSettings(
             host=os.getenv("DB_HOST", "localhost"),
@@ -82,7 +126,31 @@ def get_settings() -> AppSettings:
             user=os.getenv("DB_USER", "root"),
             password=os.getenv("DB_PASSWORD", "password"),
             name=os.getenv("DB_NAME", "streaming_media_db"),
-        )
+            backend=os.getenv("DB_BACKEND", "mysql").strip().lower(),
+            sqlite_path=str(_PROJECT_ROOT / os.getenv("DB_SQLITE_PATH", "streaming_media_db.sqlite3")),
+        ),
+        query_cache=QueryCacheSettings(
+            max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256")),
+            max_bytes=int(float(os.getenv("QUERY_CACHE_MAX_MB", "64")) * 1024 * 1024),
+            ttl_seconds=float(os.getenv("QUERY_CACHE_TTL_SECONDS", "600")),
+        ),
+        pool=PoolSettings(
+            size=max(1, int(os.getenv("DB_POOL_SIZE", "5"))),
+            max_overflow=max(0, int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))),
+            timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+            recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+        ),
+        query_log=QueryLogSettings(
+            max_entries=int(os.getenv("QUERY_LOG_ENTRIES", "2000")),
+            slow_ms=float(os.getenv("SLOW_QUERY_MS", "500")),
+            slow_log_path=str(_PROJECT_ROOT / slow_query_log) if slow_query_log else "",
+        ),
+        query_engine=os.getenv("QUERY_ENGINE", "sql").strip().lower(),
+        filter_bitmap_index=os.getenv("FILTER_BITMAP_INDEX", "1").strip().lower() not in {"0", "false", "no"},
+        title_search_index=os.getenv("TITLE_SEARCH_INDEX", "1").strip().lower() not in {"0", "false", "no"},
+        prefetch_workers=max(1, int(os.getenv("QUERY_PREFETCH_WORKERS", "8"))),
+        query_timeout_seconds=float(os.getenv("QUERY_TIMEOUT_SECONDS", "30")),
+        filter_metadata_check_seconds=float(os.getenv("FILTER_METADATA_CHECK_SECONDS", "30")),
     )
 
 
@@ -2,23 +2,112 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Iterator
 from urllib.parse import quote_plus
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from config import AppSettings, get_settings
+from query_log import calling_fetch_function, get_query_log
 
 _ENGINE: Engine | None = None
 _SESSION_FACTORY: sessionmaker | None = None
+# Queries may be dispatched from worker threads, so initialise the singletons once.
+_ENGINE_LOCK = threading.Lock()
+# Checkout waits kept for the percentile shown on the admin page
+_RECENT_WAITS = 1000
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time counters for the engine's connection pool."""
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    waiting: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection.
+
+    The wait covers queueing for a free connection and, while the pool has
+    room, opening a new one.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=_RECENT_WAITS)
+
+    def _do_get(self):
+        with self._stats_lock:
+            self._waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._waiting -= 1
+        with self._stats_lock:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._recent_waits.append(waited)
+        return connection
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            recent = sorted(self._recent_waits)
+            checkouts = self._checkouts
+            p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+            return PoolStats(
+                size=self.size(),
+                max_overflow=self._max_overflow,
+                checked_out=self.checkedout(),
+                idle=self.checkedin(),
+                # QueuePool counts overflow from -size, so it is negative until the pool is full.
+                overflow=max(0, self.overflow()),
+                waiting=self._waiting,
+                checkouts=checkouts,
+                timeouts=self._timeouts,
+                wait_avg_ms=self._wait_total / checkouts * 1000 if checkouts else 0.0,
+                wait_p95_ms=p95 * 1000,
+                wait_max_ms=self._wait_max * 1000,
+            )
 
 
 def _build_connection_string(settings: AppSettings) -> str:
     db = settings.database
+    if db.backend == "sqlite":
+        return f"sqlite:///{db.sqlite_path}"
     user = quote_plus(db.user)
     password = quote_plus(db.password)
     host = db.host
@@ -27,23 +116,68 @@ def _build_connection_string(settings: AppSettings) -> str:
     return f"mysql+pymysql://{user}:{password}@{host}:{port}/{name}?charset=utf8mb4"
 
 
+def _engine_options(settings: AppSettings) -> dict:
+    pool = settings.pool
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool.size,
+        "max_overflow": pool.max_overflow,
+        "pool_timeout": pool.timeout_seconds,
+        "pool_recycle": pool.recycle_seconds,
+    }
+    if settings.database.backend == "sqlite":
+        # Prefetch worker threads share pooled connections; sqlite3 refuses that by default.
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        options["pool_pre_ping"] = True
+    return options
+
+
+def _install_query_timing(engine: Engine) -> None:
+    """Time every statement into the query log (see query_log.py)."""
+
+    query_log = get_query_log()
+    if not query_log.enabled:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        context.query_log_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_timing(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - context.query_log_started
+        # rowcount is the number of rows fetched for a pymysql SELECT; sqlite3 reports -1
+        query_log.record(statement, parameters, cursor.rowcount, duration, calling_fetch_function())
+
+
 def get_engine() -> Engine:
     global _ENGINE
     if _ENGINE is None:
-        settings = get_settings()
-        _ENGINE = create_engine(
-            _build_connection_string(settings),
-            pool_pre_ping=True,
-            pool_recycle=1800,
-            future=True,
-        )
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                settings = get_settings()
+                engine = create_engine(
+                    _build_connection_string(settings),
+                    future=True,
+                    **_engine_options(settings),
+                )
+                _install_query_timing(engine)
+                _ENGINE = engine
     return _ENGINE
 
 
+def pool_stats() -> PoolStats:
+    return get_engine().pool.stats()
+
+
 def _get_session_factory() -> sessionmaker:
     global _SESSION_FACTORY
     if _SESSION_FACTORY is None:
-        _SESSION_FACTORY = sessionmaker(bind=get_engine(), expire_on_commit=False, future=True)
+        engine = get_engine()
+        with _ENGINE_LOCK:
+            if _SESSION_FACTORY is None:
+                _SESSION_FACTORY = sessionmaker(bind=engine, expire_on_commit=False, future=True)
     return _SESSION_FACTORY
 
 
@@ -0,0 +1,120 @@
+"""Process-wide filter metadata shared by every page and Streamlit session.
+
+``fetch_filter_options`` runs five queries, two of them MIN/MAX scans over
+``title`` and ``streaming_availability``. The result only changes when the ETL
+loads new data, so it is computed once per ``data_version`` and reused until a
+live run bumps that version. Checking the version is a primary-key lookup,
+throttled to once every ``FILTER_METADATA_CHECK_SECONDS``.
+
+``app.run`` calls ``check_data_version`` at the start of every rerun, so a
+bump also clears the result cache, bitmap index, title search index and
+columnar snapshot on pages that never read the filter options.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+import queries
+from bitmap_index import reset_bitmap_index
+from columnar import reset_catalog
+from config import get_settings
+from db import get_session
+from filters import FilterOptions
+from models import DataVersion
+from result_cache import clear_result_cache
+from title_search import reset_title_search_index
+
+logger = logging.getLogger(__name__)
+
+
+def current_data_version() -> int | None:
+    """Version stamped by the last ETL live run, or None if the database has none."""
+
+    try:
+        with get_session() as session:
+            return session.scalar(select(DataVersion.version).where(DataVersion.data_version_id == 1))
+    except DBAPIError:
+        logger.debug("data_version unavailable; filter metadata refreshes on restart only.", exc_info=True)
+        return None
+
+
+def _invalidate_loaded_data() -> None:
+    # Everything derived from the previous load is stale once the version moves.
+    clear_result_cache()
+    reset_bitmap_index()
+    reset_title_search_index()
+    reset_catalog()
+
+
+class FilterMetadataService:
+    """Tracks the data version and caches ``FilterOptions`` against it."""
+
+    def __init__(self, check_interval: float) -> None:
+        self._check_interval = check_interval
+        self._options: FilterOptions | None = None
+        self._version: int | None = None
+        self._version_known = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _check_version(self) -> None:
+        # Caller holds self._lock.
+        now = time.monotonic()
+        if self._version_known and now - self._checked_at < self._check_interval:
+            return
+
+        version = current_data_version()
+        self._checked_at = now
+        if self._version_known and version == self._version:
+            return
+
+        if self._version_known:
+            logger.info("Data version changed (%s -> %s); dropping data loaded from the old version.", self._version, version)
+            _invalidate_loaded_data()
+        self._options = None
+        self._version = version
+        self._version_known = True
+
+    def check_version(self) -> None:
+        """Throttled data_version check; a new version drops every cache built from the old load."""
+
+        with self._lock:
+            self._check_version()
+
+    def get(self) -> FilterOptions:
+        with self._lock:
+            self._check_version()
+            if self._options is None:
+                # Bypass the result cache so a new version never sees pre-load metadata.
+                self._options = inspect.unwrap(queries.fetch_filter_options)()
+            return self._options
+
+
+_SERVICE: FilterMetadataService | None = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_filter_metadata_service() -> FilterMetadataService:
+    global _SERVICE
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = FilterMetadataService(get_settings().filter_metadata_check_seconds)
+    return _SERVICE
+
+
+def check_data_version() -> None:
+    """Run once per rerun (``app.run``) so every page notices a new ETL load."""
+
+    get_filter_metadata_service().check_version()
+
+
+def get_filter_options() -> FilterOptions:
+    return get_filter_metadata_service().get()
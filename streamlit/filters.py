@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Iterable, Sequence
 
 import streamlit as st
@@ -44,6 +44,32 @@ class FilterState:
     date_added_range: tuple[date | None, date | None]
     title_search: str | None
 
+    def normalized(self) -> "FilterState":
+        """Canonical form used for cache keys (selection order and case do not matter)."""
+
+        search = (self.title_search or "").strip().casefold()
+        return FilterState(
+            services=tuple(sorted(set(self.services))),
+            content_types=tuple(sorted(set(self.content_types))),
+            genres=tuple(sorted(set(self.genres))),
+            countries=tuple(sorted(set(self.countries))),
+            release_year_range=tuple(self.release_year_range),
+            date_added_range=tuple(self.date_added_range),
+            title_search=search or None,
+        )
+
+
+def month_span(start: date, end: date) -> tuple[date, date]:
+    """Widen ``start``/``end`` to whole calendar months.
+
+    The default date range is the data's min/max ``date_added``, so widening
+    it selects the same rows while keeping it month-aligned, which lets
+    ``queries`` answer coarse filters from ``catalog_cube``.
+    """
+
+    next_month = (end.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return start.replace(day=1), next_month - timedelta(days=1)
+
 
 def _normalize_multiselect(values: Iterable[str]) -> tuple[str, ...]:
     return tuple(v for v in values if v)
@@ -93,7 +119,7 @@ def render_sidebar_filters(options: FilterOptions | None = None) -> FilterState:
         ),
     )
 
-    date_min, date_max = opts.date_added_bounds
+    date_min, date_max = month_span(*opts.date_added_bounds) if all(opts.date_added_bounds) else opts.date_added_bounds
     date_added_range = st.sidebar.date_input(
         "Date added range",
         value=(date_min or date(2010, 1, 1), date_max or date.today()),
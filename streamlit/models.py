@@ -79,6 +79,27 @@ class TitleCountry(Base):
     country_id = Column(Integer, ForeignKey("country.country_id"), primary_key=True)
 
 
+class CatalogCube(Base):
+    __tablename__ = "catalog_cube"
+
+    cube_id = Column(BigInteger, primary_key=True)
+    service_name = Column(String(100), nullable=False)
+    content_type = Column(String(10), nullable=False)
+    release_year = Column(Integer, nullable=False)
+    month_added = Column(Date)
+    rating_bucket = Column(String(20), nullable=False)
+    genre_category = Column(String(50), nullable=False)
+    title_count = Column(Integer, nullable=False)
+
+
+class DataVersion(Base):
+    __tablename__ = "data_version"
+
+    data_version_id = Column(SmallInteger, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    loaded_at = Column(DateTime, nullable=False)
+
+
 class AppRole(Base):
     __tablename__ = "app_role"
 
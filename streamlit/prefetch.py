@@ -0,0 +1,86 @@
+"""Run independent dashboard queries concurrently before a page renders."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from config import get_settings
+from db import get_engine
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a prefetched query does not finish within its time budget."""
+
+
+@dataclass(frozen=True)
+class PrefetchResult:
+    """Outcome of one prefetched query."""
+
+    value: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def get(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # One executor for the whole process keeps concurrent sessions from
+    # oversubscribing the SQLAlchemy connection pool.
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=get_settings().prefetch_workers,
+                    thread_name_prefix="query-prefetch",
+                )
+    return _EXECUTOR
+
+
+def prefetch(
+    tasks: Mapping[str, Callable[[], Any]],
+    *,
+    timeout: float | None = None,
+    timeouts: Mapping[str, float] | None = None,
+) -> dict[str, PrefetchResult]:
+    """Dispatch every task at once and collect the results by key.
+
+    ``timeout`` applies to every task unless ``timeouts`` overrides it for a
+    given key; budgets are measured from dispatch, so the page waits at most
+    for its slowest budget. A query that overruns keeps running in the
+    background (its result still lands in the shared result cache) but is
+    reported here as a ``QueryTimeoutError``.
+    """
+
+    get_engine()
+    executor = _get_executor()
+    started = time.monotonic()
+    futures: dict[str, Future] = {key: executor.submit(task) for key, task in tasks.items()}
+
+    results: dict[str, PrefetchResult] = {}
+    for key, future in futures.items():
+        budget = (timeouts or {}).get(key, timeout)
+        remaining = None if budget is None else max(0.0, started + budget - time.monotonic())
+        try:
+            results[key] = PrefetchResult(value=future.result(timeout=remaining))
+        except FutureTimeoutError:
+            future.cancel()
+            results[key] = PrefetchResult(error=QueryTimeoutError(f"{key} did not finish within {budget:.1f}s"))
+        except Exception as exc:  # surfaced to the caller via PrefetchResult.get()
+            results[key] = PrefetchResult(error=exc)
+    return results
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, List
 
 import pandas as pd
-from sqlalchemy import and_, case, distinct, func, select, text
+from sqlalchemy import Integer, and_, bindparam, case, cast, distinct, func, or_, select, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import aliased
 
+from bitmap_index import TitleIdSet, bitmap_index_enabled, get_bitmap_index, id_match_condition
+from buckets import CUBE_ALL_GENRES, GENRE_GROUPS, RATING_G, RATING_PG, RATING_PG13, RATING_R
+from columnar import columnar_capable
+from config import get_settings
 from db import get_session
 from filters import FilterOptions, FilterState
 from models import (
+    CatalogCube,
     Country,
     Genre,
     StreamingAvailability,
@@ -20,130 +29,14 @@ from models import (
     TitleCountry,
     TitleGenre,
 )
+from result_cache import cached_query
+from sql_dialect import distinct_list, month_start
+from title_search import title_match_condition, title_search_match
 
-_RATING_G = ("G", "TV-G", "TV-Y", "Y")
-_RATING_PG = ("PG", "TV-PG", "TV-Y7", "TV-Y7-FV")
-_RATING_PG13 = ("PG-13", "TV-14")
-_RATING_R = ("R", "NC-17", "TV-MA")
-
-_GENRE_GROUPS = {
-    "Kids & Family": (
-        "Children & Family Movies",
-        "Family",
-        "Kids",
-        "Teen",
-        "Teen TV Shows",
-        "Young Adult Audience",
-        "Coming of Age",
-    ),
-    "Comedy": (
-        "Comedy",
-        "Comedies",
-        "TV Comedies",
-        "Sitcom",
-        "Stand Up",
-        "Stand-Up Comedy",
-        "Stand-Up Comedy & Talk Shows",
-        "Sketch Comedy",
-        "Parody",
-        "Variety",
-        "Late Night",
-        "Talk Show",
-        "Talk Show and Variety",
-        "Game Shows",
-        "Game Show / Competition",
-        "Buddy",
-    ),
-    "Drama": (
-        "Drama",
-        "Dramas",
-        "TV Dramas",
-        "Anthology",
-        "Soap Opera / Melodrama",
-        "Medical",
-    ),
-    "Action & Adventure": (
-        "Action",
-        "Action & Adventure",
-        "Action-Adventure",
-        "Adventure",
-        "Disaster",
-        "Spy/Espionage",
-        "Police/Cop",
-        "Survival",
-        "Superhero",
-        "Military and War",
-        "Western",
-        "TV Action & Adventure",
-    ),
-    "Horror & Thriller": (
-        "Horror",
-        "Horror Movies",
-        "Thriller",
-        "Thrillers",
-        "Suspense",
-        "TV Horror",
-        "TV Thrillers",
-    ),
-    "Romance": (
-        "Romance",
-        "Romantic Movies",
-        "Romantic TV Shows",
-        "Romantic Comedy",
-    ),
-    "Sci-Fi & Fantasy": (
-        "Sci-Fi & Fantasy",
-        "Science Fiction",
-        "TV Sci-Fi & Fantasy",
-        "Fantasy",
-    ),
-    "Crime & Mystery": (
-        "Crime",
-        "Crime TV Shows",
-        "Mystery",
-        "TV Mysteries",
-    ),
-    "Documentary & History": (
-        "Documentary",
-        "Documentaries",
-        "Docuseries",
-        "Biographical",
-        "Historical",
-        "History",
-        "Science & Nature TV",
-        "Science & Technology",
-        "Animals & Nature",
-        "Special Interest",
-        "News",
-    ),
-    "Music & Performing Arts": (
-        "Music",
-        "Music & Musicals",
-        "Music Videos and Concerts",
-        "Musical",
-        "Concert Film",
-        "Dance",
-        "Arts",
-    ),
-    "Animation & Anime": (
-        "Anime",
-        "Anime Features",
-        "Anime Series",
-        "Animation",
-        "Adult Animation",
-        "Cartoons",
-    ),
-    "International / Regional": (
-        "International",
-        "International Movies",
-        "International TV Shows",
-        "British TV Shows",
-        "Korean TV Shows",
-        "Spanish-Language TV Shows",
-        "Latino",
-        "Black Stories",
-    ),
-}
+logger = logging.getLogger(__name__)
+
+# Prebuilt statements kept per fetch function, one per filter shape in use
+_STATEMENT_CACHE_SIZE = 64
 
 
 def _to_dataframe(rows: list[dict]) -> pd.DataFrame:
@@ -152,9 +45,9 @@ def _to_dataframe(rows: list[dict]) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
-def _execute_statement(statement) -> pd.DataFrame:
+def _execute_statement(statement, params: dict[str, Any] | None = None) -> pd.DataFrame:
     with get_session() as session:
-        result = session.execute(statement)
+        result = session.execute(statement, params)
         rows = result.mappings().all()
     return _to_dataframe(rows)
 
@@ -167,6 +60,7 @@ def _normalize_date(value):
     return value
 
 
+@cached_query
 def fetch_filter_options() -> FilterOptions:
     with get_session() as session:
         services = session.scalars(
@@ -202,69 +96,134 @@ def fetch_filter_options() -> FilterOptions:
     )
 
 
-def _build_filters(
-    filters: FilterState | None,
-    *,
-    title_entity=Title,
-    availability_entity=StreamingAvailability,
-    service_entity=StreamingService,
-):
+def _resolve_title_ids(filters: FilterState) -> TitleIdSet | None:
+    # Only genre/country selections need the index; the remaining title-level
+    # predicates are plain column comparisons MySQL already handles well.
+    if not (filters.genres or filters.countries) or not bitmap_index_enabled():
+        return None
+    try:
+        resolved = get_bitmap_index().resolve(filters)
+    except DBAPIError:
+        logger.warning("Title bitmap index unavailable; falling back to EXISTS filters.", exc_info=True)
+        return None
+    # Broad selections would bind thousands of ids; the EXISTS filters are cheaper there.
+    return resolved if resolved.bounded else None
+
+
+def _bind_filters(filters: FilterState | None) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """Split ``filters`` into a statement shape and the values for its bind parameters.
+
+    The shape names the predicates that apply (with how id sets are matched),
+    so every FilterState with the same shape reuses one prebuilt statement;
+    the selections themselves only travel as parameters.
+    """
+
     if not filters:
-        return []
+        return (), {}
 
-    conditions: List = []
+    shape: List[str] = []
+    params: dict[str, Any] = {}
 
     if filters.services:
-        conditions.append(service_entity.service_name.in_(filters.services))
-
-    if filters.content_types:
-        conditions.append(title_entity.content_type.in_(filters.content_types))
-
-    if filters.genres:
-        tg = aliased(TitleGenre)
-        g = aliased(Genre)
-        genre_exists = (
-            select(1)
-            .select_from(tg)
-            .join(g, tg.genre_id == g.genre_id)
-            .where(tg.title_id == title_entity.title_id, g.genre_name.in_(filters.genres))
-            .exists()
-        )
-        conditions.append(genre_exists)
-
-    if filters.countries:
-        tc = aliased(TitleCountry)
-        c = aliased(Country)
-        country_exists = (
-            select(1)
-            .select_from(tc)
-            .join(c, tc.country_id == c.country_id)
-            .where(tc.title_id == title_entity.title_id, c.country_name.in_(filters.countries))
-            .exists()
-        )
-        conditions.append(country_exists)
+        shape.append("services")
+        params["services"] = filters.services
+
+    title_ids = _resolve_title_ids(filters)
+    if title_ids is not None:
+        kind, ids = title_ids.match
+        if kind != "all":
+            shape.append(f"title_ids:{kind}")
+            params["title_ids"] = ids
+    else:
+        if filters.content_types:
+            shape.append("content_types")
+            params["content_types"] = filters.content_types
+
+        if filters.genres:
+            shape.append("genres")
+            params["genres"] = filters.genres
+
+        if filters.countries:
+            shape.append("countries")
+            params["countries"] = filters.countries
 
-    release_start, release_end = filters.release_year_range
-    if release_start is not None and release_end is not None:
-        conditions.append(title_entity.release_year.between(release_start, release_end))
+        release_start, release_end = filters.release_year_range
+        if release_start is not None and release_end is not None:
+            shape.append("release_years")
+            params.update(release_start=release_start, release_end=release_end)
 
     date_start, date_end = filters.date_added_range
     if date_start is not None and date_end is not None:
-        conditions.append(availability_entity.date_added.between(date_start, date_end))
+        shape.append("date_added")
+        params.update(date_start=date_start, date_end=date_end)
 
     if filters.title_search:
-        conditions.append(title_entity.global_title_name.ilike(f"%{filters.title_search}%"))
+        kind, value = title_search_match(filters.title_search)
+        shape.append(f"title_search:{kind}")
+        params["title_search"] = value
+
+    return tuple(shape), params
+
+
+def _filter_conditions(
+    shape: tuple[str, ...],
+    *,
+    title_entity=Title,
+    availability_entity=StreamingAvailability,
+    service_entity=StreamingService,
+) -> List:
+    """Predicates for a ``_bind_filters`` shape, reading their values from bind parameters."""
 
+    conditions: List = []
+    for part in shape:
+        name, _, kind = part.partition(":")
+        if name == "services":
+            conditions.append(service_entity.service_name.in_(bindparam("services", expanding=True)))
+        elif name == "title_ids":
+            conditions.append(
+                id_match_condition(kind, title_entity.title_id, bindparam("title_ids", expanding=True))
+            )
+        elif name == "content_types":
+            conditions.append(title_entity.content_type.in_(bindparam("content_types", expanding=True)))
+        elif name == "genres":
+            tg = aliased(TitleGenre)
+            g = aliased(Genre)
+            genre_exists = (
+                select(1)
+                .select_from(tg)
+                .join(g, tg.genre_id == g.genre_id)
+                .where(tg.title_id == title_entity.title_id, g.genre_name.in_(bindparam("genres", expanding=True)))
+                .exists()
+            )
+            conditions.append(genre_exists)
+        elif name == "countries":
+            tc = aliased(TitleCountry)
+            c = aliased(Country)
+            country_exists = (
+                select(1)
+                .select_from(tc)
+                .join(c, tc.country_id == c.country_id)
+                .where(tc.title_id == title_entity.title_id, c.country_name.in_(bindparam("countries", expanding=True)))
+                .exists()
+            )
+            conditions.append(country_exists)
+        elif name == "release_years":
+            conditions.append(title_entity.release_year.between(bindparam("release_start"), bindparam("release_end")))
+        elif name == "date_added":
+            conditions.append(availability_entity.date_added.between(bindparam("date_start"), bindparam("date_end")))
+        elif name == "title_search":
+            value = bindparam("title_search", expanding=kind != "pattern")
+            conditions.append(title_match_condition(kind, value, title_entity))
     return conditions
 
 
 def _rating_bucket_expression():
     rating_upper = func.upper(Title.age_rating_code)
     return case(
-        (rating_upper.in_(_RATING_G), "G"),
-        (rating_upper.in_(_RATING_PG), "PG"),
-        (rating_upper.in_(_RATING_PG13), "PG-13"),
-        (rating_upper.in_(_RATING_R), "R/TV-MA"),
+        (rating_upper.in_(RATING_G), "G"),
+        (rating_upper.in_(RATING_PG), "PG"),
+        (rating_upper.in_(RATING_PG13), "PG-13"),
+        (rating_upper.in_(RATING_R), "R/TV-MA"),
         else_="Unrated/Other",
     )
 
@@ -272,44 +231,142 @@ def _rating_bucket_expression():
 def _maturity_bucket_expression():
     rating_upper = func.upper(Title.age_rating_code)
     return case(
-        (rating_upper.in_(_RATING_G + _RATING_PG), "Family (G/PG)"),
-        (rating_upper.in_(_RATING_PG13 + _RATING_R), "Mature (PG-13+/R)"),
+        (rating_upper.in_(RATING_G + RATING_PG), "Family (G/PG)"),
+        (rating_upper.in_(RATING_PG13 + RATING_R), "Mature (PG-13+/R)"),
         else_="Other / Unrated",
     )
 
 
 def _genre_category_case():
     conditions = []
-    for label, names in _GENRE_GROUPS.items():
+    for label, names in GENRE_GROUPS.items():
         conditions.append((Genre.genre_name.in_(names), label))
     return case(*conditions, else_="Other")
 
 
-def fetch_overview_metrics(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+def _month_aligned(start: date, end: date) -> bool:
+    return start.day == 1 and (end + timedelta(days=1)).day == 1
 
-    stmt = (
-        select(
-            func.count(distinct(Title.title_id)).label("total_titles"),
-            func.sum(case((Title.content_type == "MOVIE", 1), else_=0)).label("movie_count"),
-            func.sum(case((Title.content_type == "TV_SHOW", 1), else_=0)).label("tv_show_count"),
-            func.count(distinct(Genre.genre_id)).label("distinct_genres"),
-            func.count(distinct(Country.country_id)).label("distinct_countries"),
-        )
+
+def _bind_cube_filters(filters: FilterState | None) -> tuple[tuple[str, ...], dict[str, Any]] | None:
+    """``_bind_filters`` for catalog_cube statements, or None when only the raw tables can answer."""
+
+    if not filters:
+        return (), {}
+
+    if filters.genres or filters.countries or filters.title_search:
+        return None
+
+    shape: List[str] = []
+    params: dict[str, Any] = {}
+
+    if filters.services:
+        shape.append("services")
+        params["services"] = filters.services
+
+    if filters.content_types:
+        shape.append("content_types")
+        params["content_types"] = filters.content_types
+
+    release_start, release_end = filters.release_year_range
+    if release_start is not None and release_end is not None:
+        shape.append("release_years")
+        params.update(release_start=release_start, release_end=release_end)
+
+    date_start, date_end = filters.date_added_range
+    if date_start is not None and date_end is not None:
+        if not _month_aligned(date_start, date_end):
+            return None
+        shape.append("date_added")
+        params.update(date_start=date_start, date_end=date_end)
+
+    return tuple(shape), params
+
+
+def _cube_conditions(shape: tuple[str, ...], *, genre_rows: bool = False) -> List:
+    """Cube predicates for a ``_bind_cube_filters`` shape, over the all-genre or the per-genre rows."""
+
+    if genre_rows:
+        conditions: List = [CatalogCube.genre_category != CUBE_ALL_GENRES]
+    else:
+        conditions = [CatalogCube.genre_category == CUBE_ALL_GENRES]
+    for name in shape:
+        if name == "services":
+            conditions.append(CatalogCube.service_name.in_(bindparam("services", expanding=True)))
+        elif name == "content_types":
+            conditions.append(CatalogCube.content_type.in_(bindparam("content_types", expanding=True)))
+        elif name == "release_years":
+            conditions.append(CatalogCube.release_year.between(bindparam("release_start"), bindparam("release_end")))
+        elif name == "date_added":
+            conditions.append(CatalogCube.month_added.between(bindparam("date_start"), bindparam("date_end")))
+    return conditions
+
+
+def _cube_sum(expression=CatalogCube.title_count):
+    # The '*' rows hold one cell per title and service (the genre rows one per
+    # title, service and genre category), so per-service sums are distinct counts.
+    return cast(func.sum(expression), Integer)
+
+
+def _cube_maturity_expression():
+    return case(
+        (CatalogCube.rating_bucket.in_(("G", "PG")), "Family (G/PG)"),
+        (CatalogCube.rating_bucket.in_(("PG-13", "R/TV-MA")), "Mature (PG-13+/R)"),
+        else_="Other / Unrated",
+    )
+
+
+def _execute_cube_statement(statement, params: dict[str, Any]) -> pd.DataFrame | None:
+    """Run a catalog_cube query; None tells the caller to fall back to the raw tables."""
+
+    try:
+        df = _execute_statement(statement, params)
+    except DBAPIError:
+        logger.warning("catalog_cube is unavailable; querying the raw tables instead.", exc_info=True)
+        return None
+    return None if df.empty else df
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _overview_metrics_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
+
+    # Deduplicate the filtered titles once; every KPI is then computed over its
+    # own subset instead of the title x availability x genre x country fan-out.
+    filtered = (
+        select(Title.title_id, Title.content_type)
         .join(StreamingAvailability, StreamingAvailability.title_id == Title.title_id)
         .join(StreamingService, StreamingService.streaming_service_id == StreamingAvailability.streaming_service_id)
-        .outerjoin(TitleGenre, TitleGenre.title_id == Title.title_id)
-        .outerjoin(Genre, Genre.genre_id == TitleGenre.genre_id)
-        .outerjoin(TitleCountry, TitleCountry.title_id == Title.title_id)
-        .outerjoin(Country, Country.country_id == TitleCountry.country_id)
+        .distinct()
     )
-
     if conditions:
-        stmt = stmt.where(and_(*conditions))
-
-    return _execute_statement(stmt)
+        filtered = filtered.where(and_(*conditions))
+    filtered = filtered.cte("filtered_titles")
+    filtered_ids = select(filtered.c.title_id)
+
+    return select(
+        func.count().label("total_titles"),
+        func.coalesce(func.sum(case((filtered.c.content_type == "MOVIE", 1), else_=0)), 0).label("movie_count"),
+        func.coalesce(func.sum(case((filtered.c.content_type == "TV_SHOW", 1), else_=0)), 0).label("tv_show_count"),
+        select(func.count(distinct(TitleGenre.genre_id)))
+        .where(TitleGenre.title_id.in_(filtered_ids))
+        .scalar_subquery()
+        .label("distinct_genres"),
+        select(func.count(distinct(TitleCountry.country_id)))
+        .where(TitleCountry.title_id.in_(filtered_ids))
+        .scalar_subquery()
+        .label("distinct_countries"),
+    ).select_from(filtered)
+
+
+@cached_query
+@columnar_capable
+def fetch_overview_metrics(filters: FilterState | None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_overview_metrics_statement(shape), params)
 
 
+@cached_query
 def fetch_service_content_summary_view() -> pd.DataFrame:
     statement = text(
         "SELECT service_name, content_type, title_count FROM vw_service_content_summary"
@@ -319,8 +376,24 @@ def fetch_service_content_summary_view() -> pd.DataFrame:
     return _to_dataframe(rows)
 
 
-def fetch_platform_breakdown(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _platform_breakdown_cube_statement(shape: tuple[str, ...]):
+    return (
+        select(
+            CatalogCube.service_name,
+            _cube_sum().label("total_titles"),
+            _cube_sum(case((CatalogCube.content_type == "MOVIE", CatalogCube.title_count), else_=0)).label("movie_count"),
+            _cube_sum(case((CatalogCube.content_type == "TV_SHOW", CatalogCube.title_count), else_=0)).label("tv_show_count"),
+        )
+        .where(and_(*_cube_conditions(shape)))
+        .group_by(CatalogCube.service_name)
+        .order_by(func.sum(CatalogCube.title_count).desc())
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _platform_breakdown_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
 
     stmt = (
         select(
@@ -337,10 +410,41 @@ def fetch_platform_breakdown(filters: FilterState | None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
+
+@cached_query
+@columnar_capable
+def fetch_platform_breakdown(filters: FilterState | None) -> pd.DataFrame:
+    cube_filters = _bind_cube_filters(filters)
+    if cube_filters is not None:
+        shape, params = cube_filters
+        df = _execute_cube_statement(_platform_breakdown_cube_statement(shape), params)
+        if df is not None:
+            return df
+
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_platform_breakdown_statement(shape), params)
+
+
+# Body of sp_get_titles_for_dashboard (documents/database/users_views_triggers.sql)
+_TITLES_FOR_DASHBOARD_SELECT = text(
+    """
+    SELECT s.service_name, t.title_id, t.global_title_name, t.content_type,
+           t.release_year, t.runtime_minutes, t.num_seasons
+    FROM streaming_availability sa
+    JOIN streaming_service s ON sa.streaming_service_id = s.streaming_service_id
+    JOIN title t ON sa.title_id = t.title_id
+    WHERE (:p_service_name IS NULL OR s.service_name = :p_service_name)
+      AND (:p_content_type IS NULL OR t.content_type = :p_content_type)
+      AND (:p_release_year_start IS NULL OR t.release_year >= :p_release_year_start)
+      AND (:p_release_year_end IS NULL OR t.release_year <= :p_release_year_end)
+    ORDER BY s.service_name, t.release_year, t.global_title_name
+    """
+)
 
 
+@cached_query
 def fetch_titles_via_stored_procedure(filters: FilterState | None) -> pd.DataFrame:
     """Call sp_get_titles_for_dashboard with supported sidebar filters."""
 
@@ -361,20 +465,22 @@ def fetch_titles_via_stored_procedure(filters: FilterState | None) -> pd.DataFra
         params["p_release_year_start"] = release_start
         params["p_release_year_end"] = release_end
 
-    with get_session() as session:
-        result = session.execute(
-            text(
-                "CALL sp_get_titles_for_dashboard(:p_service_name, :p_content_type, :p_release_year_start, :p_release_year_end)"
-            ),
-            params,
+    if get_settings().database.backend == "sqlite":
+        # SQLite has no stored procedures, so run the procedure's SELECT directly.
+        statement = _TITLES_FOR_DASHBOARD_SELECT
+    else:
+        statement = text(
+            "CALL sp_get_titles_for_dashboard(:p_service_name, :p_content_type, :p_release_year_start, :p_release_year_end)"
         )
-        rows = result.mappings().all()
+    with get_session() as session:
+        rows = session.execute(statement, params).mappings().all()
 
     return _to_dataframe(rows)
 
 
-def fetch_genre_distribution(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _genre_distribution_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     genre_category = _genre_category_case().label("genre_category")
 
     stmt = (
@@ -392,14 +498,34 @@ def fetch_genre_distribution(filters: FilterState | None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+# Not served from catalog_cube: summing its cells would count a title once per service.
+@cached_query
+@columnar_capable
+def fetch_genre_distribution(filters: FilterState | None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_genre_distribution_statement(shape), params)
 
-def fetch_genre_distribution_by_service(filters: FilterState | None) -> pd.DataFrame:
-    """Genre distribution broken down by streaming service."""
 
-    conditions = _build_filters(filters)
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _genre_distribution_by_service_cube_statement(shape: tuple[str, ...]):
+    return (
+        select(
+            CatalogCube.service_name,
+            CatalogCube.genre_category,
+            _cube_sum().label("title_count"),
+        )
+        .where(and_(*_cube_conditions(shape, genre_rows=True)))
+        .group_by(CatalogCube.service_name, CatalogCube.genre_category)
+        .order_by(CatalogCube.service_name, func.sum(CatalogCube.title_count).desc(), CatalogCube.genre_category)
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _genre_distribution_by_service_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     genre_category = _genre_category_case().label("genre_category")
 
     stmt = (
@@ -413,17 +539,32 @@ def fetch_genre_distribution_by_service(filters: FilterState | None) -> pd.DataF
         .join(TitleGenre, TitleGenre.title_id == Title.title_id)
         .join(Genre, Genre.genre_id == TitleGenre.genre_id)
         .group_by(StreamingService.service_name, genre_category)
-        .order_by(StreamingService.service_name, func.count(distinct(Title.title_id)).desc())
+        .order_by(StreamingService.service_name, func.count(distinct(Title.title_id)).desc(), genre_category)
     )
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
+
+
+@cached_query
+def fetch_genre_distribution_by_service(filters: FilterState | None) -> pd.DataFrame:
+    """Genre distribution broken down by streaming service."""
 
-    return _execute_statement(stmt)
+    cube_filters = _bind_cube_filters(filters)
+    if cube_filters is not None:
+        shape, params = cube_filters
+        df = _execute_cube_statement(_genre_distribution_by_service_cube_statement(shape), params)
+        if df is not None:
+            return df
 
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_genre_distribution_by_service_statement(shape), params)
 
-def fetch_country_distribution(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _country_distribution_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
 
     stmt = (
         select(
@@ -439,12 +580,18 @@ def fetch_country_distribution(filters: FilterState | None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+@cached_query
+def fetch_country_distribution(filters: FilterState | None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_country_distribution_statement(shape), params)
 
-def fetch_country_diversity_by_service(filters: FilterState | None = None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _country_diversity_by_service_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
 
     stmt = (
         select(
@@ -462,12 +609,18 @@ def fetch_country_diversity_by_service(filters: FilterState | None = None) -> pd
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+@cached_query
+def fetch_country_diversity_by_service(filters: FilterState | None = None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_country_diversity_by_service_statement(shape), params)
 
-def fetch_genre_uniqueness(filters: FilterState | None = None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _genre_uniqueness_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     genre_category = _genre_category_case().label("genre_category")
 
     base = (
@@ -556,7 +709,7 @@ def fetch_genre_uniqueness(filters: FilterState | None = None) -> pd.DataFrame:
         )
     ).cte("ranked")
 
-    stmt = (
+    return (
         select(
             ranked.c.service_name,
             ranked.c.genre_category,
@@ -569,11 +722,30 @@ def fetch_genre_uniqueness(filters: FilterState | None = None) -> pd.DataFrame:
         .order_by(ranked.c.service_name, ranked.c.dominance_share_pct.desc())
     )
 
-    return _execute_statement(stmt)
+
+@cached_query
+def fetch_genre_uniqueness(filters: FilterState | None = None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_genre_uniqueness_statement(shape), params)
 
 
-def fetch_release_year_trend(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _release_year_trend_cube_statement(shape: tuple[str, ...]):
+    return (
+        select(
+            CatalogCube.release_year,
+            CatalogCube.service_name,
+            _cube_sum().label("title_count"),
+        )
+        .where(and_(*_cube_conditions(shape)))
+        .group_by(CatalogCube.release_year, CatalogCube.service_name)
+        .order_by(CatalogCube.release_year.asc())
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _release_year_trend_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
 
     stmt = (
         select(
@@ -589,12 +761,40 @@ def fetch_release_year_trend(filters: FilterState | None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+@cached_query
+@columnar_capable
+def fetch_release_year_trend(filters: FilterState | None) -> pd.DataFrame:
+    cube_filters = _bind_cube_filters(filters)
+    if cube_filters is not None:
+        shape, params = cube_filters
+        df = _execute_cube_statement(_release_year_trend_cube_statement(shape), params)
+        if df is not None:
+            return df
 
-def fetch_rating_distribution(filters: FilterState | None = None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_release_year_trend_statement(shape), params)
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _rating_distribution_cube_statement(shape: tuple[str, ...]):
+    return (
+        select(
+            CatalogCube.service_name,
+            CatalogCube.rating_bucket,
+            _cube_sum().label("title_count"),
+        )
+        .where(and_(*_cube_conditions(shape)))
+        .group_by(CatalogCube.service_name, CatalogCube.rating_bucket)
+        .order_by(CatalogCube.service_name, CatalogCube.rating_bucket)
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _rating_distribution_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     rating_bucket = _rating_bucket_expression()
 
     stmt = (
@@ -611,12 +811,41 @@ def fetch_rating_distribution(filters: FilterState | None = None) -> pd.DataFram
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+@cached_query
+@columnar_capable
+def fetch_rating_distribution(filters: FilterState | None = None) -> pd.DataFrame:
+    cube_filters = _bind_cube_filters(filters)
+    if cube_filters is not None:
+        shape, params = cube_filters
+        df = _execute_cube_statement(_rating_distribution_cube_statement(shape), params)
+        if df is not None:
+            return df
 
-def fetch_maturity_mix(filters: FilterState | None = None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_rating_distribution_statement(shape), params)
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _maturity_mix_cube_statement(shape: tuple[str, ...]):
+    cube_bucket = _cube_maturity_expression()
+    return (
+        select(
+            CatalogCube.service_name,
+            cube_bucket.label("content_group"),
+            _cube_sum().label("title_count"),
+        )
+        .where(and_(*_cube_conditions(shape)))
+        .group_by(CatalogCube.service_name, cube_bucket)
+        .order_by(CatalogCube.service_name, cube_bucket)
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _maturity_mix_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     maturity_bucket = _maturity_bucket_expression()
 
     stmt = (
@@ -633,18 +862,33 @@ def fetch_maturity_mix(filters: FilterState | None = None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
+
+
+@cached_query
+@columnar_capable
+def fetch_maturity_mix(filters: FilterState | None = None) -> pd.DataFrame:
+    df = None
+    cube_filters = _bind_cube_filters(filters)
+    if cube_filters is not None:
+        shape, params = cube_filters
+        df = _execute_cube_statement(_maturity_mix_cube_statement(shape), params)
+
+    if df is None:
+        shape, params = _bind_filters(filters)
+        df = _execute_statement(_maturity_mix_statement(shape), params)
 
-    df = _execute_statement(stmt)
     if not df.empty:
         df["share"] = df.groupby("service_name")["title_count"].transform(lambda series: series / series.sum())
     return df
 
 
-def fetch_date_added_trend(filters: FilterState | None) -> pd.DataFrame:
-    conditions = _build_filters(filters)
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _date_added_trend_statement(shape: tuple[str, ...]):
+    conditions = _filter_conditions(shape)
     conditions.append(StreamingAvailability.date_added.is_not(None))
 
-    month_bucket = func.date_format(StreamingAvailability.date_added, "%Y-%m-01").label("month_bucket")
+    month_bucket = month_start(StreamingAvailability.date_added).label("month_bucket")
 
     stmt = (
         select(
@@ -660,47 +904,210 @@ def fetch_date_added_trend(filters: FilterState | None) -> pd.DataFrame:
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
 
+@cached_query
+@columnar_capable
+def fetch_date_added_trend(filters: FilterState | None) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    return _execute_statement(_date_added_trend_statement(shape), params)
 
-def fetch_titles_table(filters: FilterState | None, limit: int = 250) -> pd.DataFrame:
-    conditions = _build_filters(filters)
 
-    stmt = (
+CATALOG_SORTS = {
+    "newest": "Newest added",
+    "oldest": "Oldest added",
+    "title": "Title A-Z",
+}
+
+_CATALOG_SORT_COLUMNS = {
+    "newest": (StreamingAvailability.date_added, True),
+    "oldest": (StreamingAvailability.date_added, False),
+    "title": (Title.global_title_name, False),
+}
+
+
+@dataclass(frozen=True)
+class CatalogCursor:
+    """Keyset position: the sort value and availability_id of a boundary row."""
+
+    sort_value: Any
+    availability_id: int
+
+
+@dataclass(frozen=True)
+class CatalogPage:
+    rows: pd.DataFrame
+    next_cursor: CatalogCursor | None
+    previous_cursor: CatalogCursor | None
+
+
+def _keyset_after(column, descending: bool, null_cursor: bool):
+    """Rows strictly after the ``cursor_value``/``cursor_id`` parameters in ``ORDER BY column, availability_id``.
+
+    ``null_cursor`` says whether the boundary row's sort value is NULL (MySQL
+    and SQLite sort NULLs lowest).
+    """
+
+    row_id = StreamingAvailability.availability_id
+    value = bindparam("cursor_value")
+    cursor_id = bindparam("cursor_id")
+    if descending:
+        if null_cursor:
+            return and_(column.is_(None), row_id < cursor_id)
+        return or_(
+            column < value,
+            and_(column == value, row_id < cursor_id),
+            column.is_(None),
+        )
+    if null_cursor:
+        return or_(and_(column.is_(None), row_id > cursor_id), column.is_not(None))
+    return or_(column > value, and_(column == value, row_id > cursor_id))
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _catalog_rows_statement(shape: tuple[str, ...], sort: str, descending: bool, cursor: str | None):
+    """One catalog page; ``cursor`` is None on the first page, else "null" or "value" (see ``_keyset_after``)."""
+
+    sort_column, _ = _CATALOG_SORT_COLUMNS[sort]
+    row_id = StreamingAvailability.availability_id
+
+    conditions = _filter_conditions(shape)
+    if cursor is not None:
+        conditions.append(_keyset_after(sort_column, descending, cursor == "null"))
+
+    # Pick the page's availability rows first (one extra to detect a further
+    # page) so the genre/country aggregation only touches page_size titles.
+    page = (
+        select(row_id, sort_column.label("sort_value"))
+        .join(Title, Title.title_id == StreamingAvailability.title_id)
+        .join(StreamingService, StreamingService.streaming_service_id == StreamingAvailability.streaming_service_id)
+        .order_by(*(
+            (sort_column.desc(), row_id.desc()) if descending else (sort_column.asc(), row_id.asc())
+        ))
+        .limit(bindparam("page_limit", type_=Integer))
+    )
+    if conditions:
+        page = page.where(and_(*conditions))
+    page = page.subquery("page")
+
+    return (
         select(
+            page.c.availability_id,
+            page.c.sort_value,
             Title.global_title_name.label("title"),
             Title.content_type,
             Title.release_year,
-            func.group_concat(distinct(Genre.genre_name)).label("genres"),
-            func.group_concat(distinct(Country.country_name)).label("countries"),
+            distinct_list(Genre.genre_name).label("genres"),
+            distinct_list(Country.country_name).label("countries"),
             StreamingService.service_name,
             StreamingAvailability.date_added,
         )
-        .join(StreamingAvailability, StreamingAvailability.title_id == Title.title_id)
+        .select_from(page)
+        .join(StreamingAvailability, StreamingAvailability.availability_id == page.c.availability_id)
+        .join(Title, Title.title_id == StreamingAvailability.title_id)
         .join(StreamingService, StreamingService.streaming_service_id == StreamingAvailability.streaming_service_id)
         .outerjoin(TitleGenre, TitleGenre.title_id == Title.title_id)
         .outerjoin(Genre, Genre.genre_id == TitleGenre.genre_id)
         .outerjoin(TitleCountry, TitleCountry.title_id == Title.title_id)
         .outerjoin(Country, Country.country_id == TitleCountry.country_id)
-        .group_by(Title.title_id, StreamingService.service_name, StreamingAvailability.date_added)
-        .order_by(StreamingAvailability.date_added.desc())
-        .limit(limit)
+        .group_by(
+            page.c.availability_id,
+            page.c.sort_value,
+            Title.title_id,
+            StreamingService.service_name,
+            StreamingAvailability.date_added,
+        )
+        .order_by(*(
+            (page.c.sort_value.desc(), page.c.availability_id.desc())
+            if descending
+            else (page.c.sort_value.asc(), page.c.availability_id.asc())
+        ))
     )
 
-    if conditions:
-        stmt = stmt.where(and_(*conditions))
 
-    return _execute_statement(stmt)
+@cached_query
+def _fetch_catalog_rows(
+    filters: FilterState | None,
+    sort: str,
+    page_size: int,
+    cursor: CatalogCursor | None,
+    backwards: bool,
+) -> pd.DataFrame:
+    _, descending = _CATALOG_SORT_COLUMNS[sort]
+    # Walking backwards is walking forwards through the reversed order.
+    descending ^= backwards
 
+    shape, params = _bind_filters(filters)
+    params["page_limit"] = page_size + 1
+    cursor_kind = None
+    if cursor is not None:
+        cursor_kind = "null" if cursor.sort_value is None else "value"
+        params.update(cursor_value=cursor.sort_value, cursor_id=cursor.availability_id)
 
-def fetch_similarity_candidates(filters: FilterState | None, title_keyword: str) -> pd.DataFrame:
+    return _execute_statement(_catalog_rows_statement(shape, sort, descending, cursor_kind), params)
+
+
+def _row_cursor(row) -> CatalogCursor:
+    value = row["sort_value"]
+    if pd.isna(value):
+        value = None
+    return CatalogCursor(sort_value=_normalize_date(value), availability_id=int(row["availability_id"]))
+
+
+def fetch_titles_page(
+    filters: FilterState | None,
+    *,
+    sort: str = "newest",
+    page_size: int = 50,
+    after: CatalogCursor | None = None,
+    before: CatalogCursor | None = None,
+) -> CatalogPage:
+    """One keyset-paginated page of the filtered catalog.
+
+    Pass ``after=page.next_cursor`` or ``before=page.previous_cursor`` to move
+    between pages; each page costs the same regardless of depth.
+    """
+
+    if sort not in _CATALOG_SORT_COLUMNS:
+        raise ValueError(f"Unknown catalog sort: {sort!r}")
+
+    backwards = before is not None
+    df = _fetch_catalog_rows(filters, sort, page_size, before if backwards else after, backwards)
+    if df.empty:
+        return CatalogPage(rows=df, next_cursor=None, previous_cursor=None)
+
+    has_more = len(df) > page_size
+    df = df.iloc[:page_size]
+    if backwards:
+        df = df.iloc[::-1]
+    df = df.reset_index(drop=True)
+
+    first, last = _row_cursor(df.iloc[0]), _row_cursor(df.iloc[-1])
+    if backwards:
+        next_cursor, previous_cursor = last, first if has_more else None
+    else:
+        next_cursor, previous_cursor = last if has_more else None, first if after is not None else None
+
+    return CatalogPage(
+        rows=df.drop(columns=["availability_id", "sort_value"]),
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
+    )
+
+
+def fetch_titles_table(filters: FilterState | None, limit: int = 250) -> pd.DataFrame:
+    return fetch_titles_page(filters, page_size=limit).rows
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _similarity_candidates_statement(shape: tuple[str, ...], anchor_match: str):
     other_title = aliased(Title)
     other_availability = aliased(StreamingAvailability)
     other_service = aliased(StreamingService)
 
-    conditions = _build_filters(
-        filters,
+    conditions = _filter_conditions(
+        shape,
         title_entity=other_title,
         availability_entity=other_availability,
         service_entity=other_service,
@@ -709,6 +1116,7 @@ def fetch_similarity_candidates(filters: FilterState | None, title_keyword: str)
     anchor_title = aliased(Title)
     anchor_tg = aliased(TitleGenre)
     other_tg = aliased(TitleGenre)
+    anchor_search = bindparam("anchor_search", expanding=anchor_match != "pattern")
 
     stmt = (
         select(
@@ -722,7 +1130,7 @@ def fetch_similarity_candidates(filters: FilterState | None, title_keyword: str)
         .join(anchor_title, anchor_title.title_id == anchor_tg.title_id)
         .join(other_availability, other_availability.title_id == other_title.title_id)
         .join(other_service, other_service.streaming_service_id == other_availability.streaming_service_id)
-        .where(anchor_title.global_title_name.ilike(f"%{title_keyword}%"))
+        .where(title_match_condition(anchor_match, anchor_search, anchor_title))
         .where(other_title.title_id != anchor_title.title_id)
         .group_by(other_title.title_id, other_service.service_name)
         .order_by(func.count().desc(), other_title.release_year.desc())
@@ -731,8 +1139,14 @@ def fetch_similarity_candidates(filters: FilterState | None, title_keyword: str)
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
 
-    return _execute_statement(stmt)
+
+@cached_query
+def fetch_similarity_candidates(filters: FilterState | None, title_keyword: str) -> pd.DataFrame:
+    shape, params = _bind_filters(filters)
+    anchor_match, params["anchor_search"] = title_search_match(title_keyword)
+    return _execute_statement(_similarity_candidates_statement(shape, anchor_match), params)
 
 
 
@@ -0,0 +1,187 @@
+"""In-process SQL timing log: recent statements per fetch function plus a slow-query file.
+
+``db.get_engine`` hooks ``before_cursor_execute``/``after_cursor_execute`` and
+records every statement here with its fingerprint, the ``fetch_*`` function
+that issued it, a hash of its parameters, the driver's row count and its
+duration. The newest ``QUERY_LOG_ENTRIES`` records are kept in a ring buffer
+for the admin page; statements slower than ``SLOW_QUERY_MS`` are also written
+to ``SLOW_QUERY_LOG``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from config import QueryLogSettings, get_settings
+
+# SQLAlchemy renders IN (...) with one placeholder per value; fold them so
+# every list length shares a fingerprint.
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+# Callers are looked up this many frames above the cursor hook at most
+_MAX_CALLER_DEPTH = 40
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    """One executed statement."""
+
+    finished_at: float
+    fingerprint: str
+    caller: str
+    params_hash: str
+    rows: int | None
+    duration_ms: float
+
+
+def normalize_statement(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def calling_fetch_function() -> str:
+    """Name of the nearest ``fetch_*`` function on the stack, or ``"other"``."""
+
+    frame = sys._getframe(1)
+    for _ in range(_MAX_CALLER_DEPTH):
+        if frame is None:
+            break
+        name = frame.f_code.co_name
+        if name.startswith(("fetch_", "_fetch_")):
+            module = frame.f_globals.get("__name__", "")
+            return f"{module}.{name}" if module != "queries" else name
+        frame = frame.f_back
+    return "other"
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class QueryLog:
+    """Thread-safe ring buffer of ``QueryRecord`` plus the slow-query file."""
+
+    def __init__(self, settings: QueryLogSettings) -> None:
+        self._settings = settings
+        self._records: deque[QueryRecord] = deque(maxlen=max(settings.max_entries, 1))
+        self._statements: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._slow_logger = self._build_slow_logger(settings.slow_log_path)
+
+    @property
+    def enabled(self) -> bool:
+        return self._settings.max_entries > 0
+
+    @staticmethod
+    def _build_slow_logger(path: str) -> logging.Logger | None:
+        if not path:
+            return None
+        slow_logger = logging.getLogger("slow_queries")
+        slow_logger.setLevel(logging.INFO)
+        slow_logger.propagate = False
+        if not slow_logger.handlers:
+            handler = logging.FileHandler(path, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            slow_logger.addHandler(handler)
+        return slow_logger
+
+    def record(self, statement: str, parameters: Any, rows: int | None, duration: float, caller: str) -> None:
+        normalized = normalize_statement(statement)
+        fingerprint = _digest(normalized)
+        record = QueryRecord(
+            finished_at=time.time(),
+            fingerprint=fingerprint,
+            caller=caller,
+            params_hash=_digest(repr(parameters)),
+            rows=rows if rows is not None and rows >= 0 else None,
+            duration_ms=duration * 1000,
+        )
+        with self._lock:
+            self._records.append(record)
+            self._statements.setdefault(fingerprint, normalized)
+        if self._slow_logger is not None and record.duration_ms >= self._settings.slow_ms:
+            # Parameters can hold user input (title searches), so only their hash is logged.
+            self._slow_logger.info(
+                "%.1f ms caller=%s fingerprint=%s params=%s rows=%s sql=%s",
+                record.duration_ms, caller, fingerprint, record.params_hash, record.rows, normalized,
+            )
+
+    def records(self) -> list[QueryRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def statement(self, fingerprint: str) -> str:
+        with self._lock:
+            return self._statements.get(fingerprint, "")
+
+    def summary(self) -> pd.DataFrame:
+        """Latency percentiles per fetch function over the buffered statements."""
+
+        durations: dict[str, list[float]] = {}
+        for record in self.records():
+            durations.setdefault(record.caller, []).append(record.duration_ms)
+        rows = []
+        for caller, values in durations.items():
+            ordered = sorted(values)
+            rows.append({
+                "fetch_function": caller,
+                "statements": len(ordered),
+                "p50_ms": _percentile(ordered, 0.50),
+                "p95_ms": _percentile(ordered, 0.95),
+                "p99_ms": _percentile(ordered, 0.99),
+                "max_ms": ordered[-1],
+                "total_ms": sum(ordered),
+                "slow": sum(value >= self._settings.slow_ms for value in ordered),
+            })
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).sort_values("p95_ms", ascending=False, ignore_index=True)
+
+    def slowest(self, limit: int = 20) -> pd.DataFrame:
+        records = sorted(self.records(), key=lambda record: record.duration_ms, reverse=True)[:limit]
+        return pd.DataFrame([
+            {
+                "duration_ms": record.duration_ms,
+                "fetch_function": record.caller,
+                "rows": record.rows,
+                "fingerprint": record.fingerprint,
+                "params_hash": record.params_hash,
+                "sql": self.statement(record.fingerprint),
+            }
+            for record in records
+        ])
+
+    @property
+    def slow_ms(self) -> float:
+        return self._settings.slow_ms
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._statements.clear()
+
+
+_LOG: QueryLog | None = None
+_LOG_LOCK = threading.Lock()
+
+
+def get_query_log() -> QueryLog:
+    global _LOG
+    if _LOG is None:
+        with _LOG_LOCK:
+            if _LOG is None:
+                _LOG = QueryLog(get_settings().query_log)
+    return _LOG
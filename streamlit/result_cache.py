@@ -0,0 +1,193 @@
+"""Process-wide LRU cache for query results shared by every Streamlit session."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from config import QueryCacheSettings, get_settings
+from filters import FilterState
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters for the result cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes_used: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+def _estimate_size(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in vars(value).values())
+    return sys.getsizeof(value)
+
+
+def _copy_value(value: Any) -> Any:
+    # Callers are free to mutate the frames they receive (e.g. adding share columns).
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return value
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by entry count, memory budget and TTL."""
+
+    def __init__(self, settings: QueryCacheSettings) -> None:
+        self._settings = settings
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._settings.max_entries > 0 and self._settings.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, _copy_value(entry.value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = _estimate_size(value)
+        if size > self._settings.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(
+                value=_copy_value(value),
+                size=size,
+                expires_at=time.monotonic() + self._settings.ttl_seconds,
+            )
+            self._bytes_used += size
+            while self._entries and (
+                len(self._entries) > self._settings.max_entries
+                or self._bytes_used > self._settings.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes_used = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes_used=self._bytes_used,
+                max_bytes=self._settings.max_bytes,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes_used -= entry.size
+
+
+_CACHE: ResultCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = ResultCache(get_settings().query_cache)
+    return _CACHE
+
+
+def _normalize_argument(value: Any) -> Hashable:
+    if isinstance(value, FilterState):
+        return value.normalized()
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def cached_query(func: Callable) -> Callable:
+    """Memoize a ``fetch_*`` function on (name, normalized FilterState, extra args)."""
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_result_cache()
+        if not cache.enabled:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            func.__qualname__,
+            tuple((name, _normalize_argument(value)) for name, value in bound.arguments.items()),
+        )
+
+        hit, value = cache.get(key)
+        if hit:
+            return value
+
+        value = func(*args, **kwargs)
+        cache.put(key, value)
+        return value
+
+    return wrapper
+
+
+def cache_stats() -> CacheStats:
+    return get_result_cache().stats()
+
+
+def clear_result_cache() -> None:
+    get_result_cache().clear()
@@ -0,0 +1,49 @@
+"""SQL expressions whose spelling differs between the supported backends.
+
+The dashboard runs against MySQL or, with ``DB_BACKEND=sqlite``, a local
+SQLite file. The constructs here compile to each dialect's own functions, so
+``queries.py`` builds one statement for both.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import distinct, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import String
+
+
+class month_start(FunctionElement):
+    """First day of a date's month, as ``'YYYY-MM-01'`` text."""
+
+    type = String()
+    name = "month_start"
+    inherit_cache = True
+
+
+@compiles(month_start)
+def _month_start_mysql(element, compiler, **kw):
+    (value,) = element.clauses
+    return compiler.process(func.date_format(value, "%Y-%m-01"), **kw)
+
+
+@compiles(month_start, "sqlite")
+def _month_start_sqlite(element, compiler, **kw):
+    (value,) = element.clauses
+    return compiler.process(func.strftime("%Y-%m-01", value), **kw)
+
+
+class distinct_list(FunctionElement):
+    """Comma-separated distinct values of a column within each group."""
+
+    type = String()
+    name = "distinct_list"
+    inherit_cache = True
+
+
+@compiles(distinct_list)
+def _distinct_list(element, compiler, **kw):
+    # MySQL and SQLite both spell it GROUP_CONCAT(DISTINCT ...); SQLite only
+    # allows DISTINCT with the default ',' separator, which MySQL uses too.
+    (value,) = element.clauses
+    return compiler.process(func.group_concat(distinct(value)), **kw)
@@ -0,0 +1,201 @@
+"""Trigram inverted index for substring title search.
+
+``ILIKE '%term%'`` cannot use a B-tree index, so every keystroke in the title
+search box used to scan ``title``. Instead, each casefolded
+``global_title_name`` / ``original_title`` is split into trigrams and the
+posting lists of a search term's trigrams are intersected to get candidate
+titles. The candidates are then checked against the real substring, so
+results match the old ILIKE filter (extended to ``original_title``). Terms
+shorter than a trigram, or matching too many titles to bind, still use ILIKE.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+from sqlalchemy import or_, select, true
+from sqlalchemy.exc import DBAPIError
+
+from bitmap_index import TitleIdSet, id_match_condition
+from config import get_settings
+from db import get_session
+from models import Title
+
+logger = logging.getLogger(__name__)
+
+_NGRAM = 3
+_RESOLVED_CACHE_SIZE = 256
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[index : index + _NGRAM] for index in range(len(text) - _NGRAM + 1)}
+
+
+class TitleSearchIndex:
+    """In-memory trigram index over title names."""
+
+    def __init__(self, title_ids: np.ndarray, names: list[str], original_names: list[str]) -> None:
+        self.title_ids = title_ids
+        self.names = names
+        self.original_names = original_names
+        self._haystacks = [
+            (name.casefold(), original.casefold()) for name, original in zip(names, original_names)
+        ]
+
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for position, (name, original) in enumerate(self._haystacks):
+            for gram in _trigrams(name) | _trigrams(original):
+                postings[gram].append(position)
+        self._postings = {gram: np.asarray(positions, dtype=np.int32) for gram, positions in postings.items()}
+
+        self._resolved: OrderedDict[str, TitleIdSet] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> "TitleSearchIndex":
+        with get_session() as session:
+            rows = session.execute(
+                select(Title.title_id, Title.global_title_name, Title.original_title).order_by(Title.title_id)
+            ).all()
+        return cls(
+            title_ids=np.asarray([row.title_id for row in rows], dtype=np.int64),
+            names=[row.global_title_name or "" for row in rows],
+            original_names=[row.original_title or "" for row in rows],
+        )
+
+    def _candidates(self, term: str) -> np.ndarray:
+        grams = _trigrams(term)
+        if not grams:
+            # Terms shorter than a trigram have no postings to intersect.
+            return np.arange(len(self.title_ids))
+
+        lists = sorted((self._postings.get(gram) for gram in grams), key=lambda p: 0 if p is None else len(p))
+        if lists[0] is None:
+            return np.empty(0, dtype=np.int32)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if candidates.size == 0:
+                break
+        return candidates
+
+    def _matching_positions(self, term: str) -> np.ndarray:
+        return np.asarray(
+            [
+                position
+                for position in self._candidates(term).tolist()
+                if term in self._haystacks[position][0] or term in self._haystacks[position][1]
+            ],
+            dtype=np.int64,
+        )
+
+    def search(self, term: str) -> TitleIdSet:
+        """Resolve a substring search to the matching title ids."""
+
+        term = term.strip().casefold()
+        with self._lock:
+            cached = self._resolved.get(term)
+            if cached is not None:
+                self._resolved.move_to_end(term)
+                return cached
+
+        positions = self._matching_positions(term)
+        matched = np.zeros(len(self.title_ids), dtype=bool)
+        matched[positions] = True
+        resolved = TitleIdSet.shorter_side(
+            len(self.title_ids),
+            len(positions),
+            lambda: tuple(self.title_ids[matched].tolist()),
+            lambda: tuple(self.title_ids[~matched].tolist()),
+        )
+        with self._lock:
+            self._resolved[term] = resolved
+            while len(self._resolved) > _RESOLVED_CACHE_SIZE:
+                self._resolved.popitem(last=False)
+        return resolved
+
+    def ranked_matches(self, term: str, limit: int = 10) -> list[tuple[int, str]]:
+        """Return ``(title_id, name)`` pairs, best matches first.
+
+        Exact names rank first, then names starting with the term, then names
+        with a word starting with the term, then any other substring match;
+        shorter names win ties.
+        """
+
+        term = term.strip().casefold()
+        if not term:
+            return []
+
+        def rank(position: int) -> tuple:
+            name = self._haystacks[position][0]
+            if name == term:
+                tier = 0
+            elif name.startswith(term):
+                tier = 1
+            elif f" {term}" in name:
+                tier = 2
+            else:
+                tier = 3
+            return tier, len(name), name
+
+        best = sorted(self._matching_positions(term).tolist(), key=rank)[:limit]
+        return [(int(self.title_ids[position]), self.names[position]) for position in best]
+
+
+_INDEX: TitleSearchIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_title_search_index() -> TitleSearchIndex:
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = TitleSearchIndex.load()
+    return _INDEX
+
+
+def reset_title_search_index() -> None:
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def title_search_index_enabled() -> bool:
+    return get_settings().title_search_index
+
+
+def title_search_match(term: str) -> tuple[str, object]:
+    """How ``term`` restricts titles: a ``TitleIdSet.match`` from the index, or ``("pattern", "%term%")``."""
+
+    # Shorter terms have no trigrams to intersect: the index would scan every
+    # title and memoize a near-full id list per keystroke, so let the database scan.
+    if title_search_index_enabled() and len(term.strip().casefold()) >= _NGRAM:
+        try:
+            resolved = get_title_search_index().search(term)
+        except DBAPIError:
+            logger.warning("Title search index unavailable; falling back to ILIKE.", exc_info=True)
+        else:
+            # Common terms ("the") match too many titles to bind; ILIKE scans faster.
+            if resolved.bounded:
+                return resolved.match
+    return "pattern", f"%{term.strip()}%"
+
+
+def title_match_condition(kind: str, value, title_entity=Title):
+    """SQL predicate for a ``title_search_match`` result; ``value`` may be a ``bindparam``."""
+
+    if kind == "pattern":
+        return or_(title_entity.global_title_name.ilike(value), title_entity.original_title.ilike(value))
+    condition = id_match_condition(kind, title_entity.title_id, value)
+    return condition if condition is not None else true()
+
+
+def title_search_condition(term: str, title_entity=Title):
+    """SQL predicate restricting ``title_entity`` to titles matching ``term``."""
+
+    kind, value = title_search_match(term)
+    return title_match_condition(kind, value, title_entity)
@@ -15,6 +15,9 @@ from auth import (
     toggle_user_active,
     update_user_role,
 )
+from db import pool_stats
+from query_log import get_query_log
+from result_cache import cache_stats, clear_result_cache
 
 
 def render() -> None:
@@ -126,4 +129,64 @@ def render() -> None:
     else:
         st.dataframe(audits_df, width='stretch')
 
+    _render_query_cache_stats()
+    _render_connection_pool_stats()
+    _render_query_timings()
+
     st.success(f"Admin privileges verified for {user.username}.")
+
+
+def _render_query_cache_stats() -> None:
+    st.subheader("Query result cache")
+    stats = cache_stats()
+    hits_col, misses_col, rate_col, size_col = st.columns(4)
+    hits_col.metric("Hits", f"{stats.hits:,}")
+    misses_col.metric("Misses", f"{stats.misses:,}")
+    rate_col.metric("Hit rate", f"{stats.hit_rate:.1%}")
+    size_col.metric(
+        "Memory",
+        f"{stats.bytes_used / 1_048_576:.1f} / {stats.max_bytes / 1_048_576:.0f} MB",
+    )
+    st.caption(
+        f"{stats.entries} cached results, {stats.evictions} evicted, {stats.expirations} expired."
+    )
+    if st.button("Clear query cache"):
+        clear_result_cache()
+        st.rerun()
+
+
+def _render_connection_pool_stats() -> None:
+    st.subheader("Database connection pool")
+    stats = pool_stats()
+    out_col, idle_col, overflow_col, waiting_col = st.columns(4)
+    out_col.metric("Checked out", f"{stats.checked_out} / {stats.size + stats.max_overflow}")
+    idle_col.metric("Idle", stats.idle)
+    overflow_col.metric("Overflow", f"{stats.overflow} / {stats.max_overflow}")
+    waiting_col.metric("Waiting", stats.waiting)
+    st.caption(
+        f"{stats.checkouts:,} checkouts; wait avg {stats.wait_avg_ms:.1f} ms, "
+        f"p95 {stats.wait_p95_ms:.1f} ms, max {stats.wait_max_ms:.1f} ms; "
+        f"{stats.timeouts} timed out. Pool size {stats.size}."
+    )
+
+
+def _render_query_timings() -> None:
+    st.subheader("SQL timings")
+    query_log = get_query_log()
+    if not query_log.enabled:
+        st.info("SQL timing is off (QUERY_LOG_ENTRIES=0).")
+        return
+    summary = query_log.summary()
+    if summary.empty:
+        st.info("No statements recorded yet.")
+        return
+    st.caption(
+        f"Statement latency per fetch function over the last {int(summary['statements'].sum()):,} statements; "
+        f"'slow' counts statements over {query_log.slow_ms:.0f} ms."
+    )
+    st.dataframe(summary.round(1), width='stretch', hide_index=True)
+    with st.expander("Slowest recent statements"):
+        st.dataframe(query_log.slowest().round(1), width='stretch', hide_index=True)
+    if st.button("Clear SQL timings"):
+        query_log.clear()
+        st.rerun()
@@ -8,6 +8,7 @@ import plotly.express as px
 import streamlit as st
 
 from access import require_user
+from filter_metadata import get_filter_options
 from filters import FilterState
 import queries
 
@@ -18,7 +19,7 @@ def render() -> None:
     st.title("Advanced Filtering & Analytics")
     st.caption("Granular controls for analysts exploring multi-genre and ingestion trends.")
 
-    options = queries.fetch_filter_options()
+    options = get_filter_options()
 
     with st.expander("Advanced Filters", expanded=True):
         services = st.multiselect(
@@ -106,7 +107,7 @@ def render() -> None:
         st.plotly_chart(fig_trend, width='stretch')
 
     st.subheader("Recent catalog entries")
-    table_df = queries.fetch_titles_table(filters, limit=100)
+    table_df = queries.fetch_titles_page(filters, page_size=100).rows
     st.dataframe(table_df, width='stretch')
 
     st.success(f"Analyst workspace unlocked for {user.username}.")
@@ -6,13 +6,110 @@ import streamlit as st
 
 from filters import FilterState
 import queries
+from views.section_data import SectionData, ensure_data, section_result
 
-def render(filters: FilterState | None) -> None:
+SORT_KEY = "catalog_sort"
+PAGE_SIZE_KEY = "catalog_page_size"
+CURSOR_KEY = "catalog_cursor"
+PAGE_NUMBER_KEY = "catalog_page_number"
+VIEW_KEY = "catalog_view"
+PAGE_SIZES = (25, 50, 100, 250)
+DEFAULT_PAGE_SIZE = 50
+
+
+def _sort() -> str:
+    return str(st.session_state.get(SORT_KEY, "newest"))
+
+
+def _page_size() -> int:
+    return int(st.session_state.get(PAGE_SIZE_KEY, DEFAULT_PAGE_SIZE))
+
+
+def _reset_paging() -> None:
+    st.session_state[CURSOR_KEY] = None
+    st.session_state[PAGE_NUMBER_KEY] = 1
+
+
+def _current_cursor(filters: FilterState | None) -> tuple[str, queries.CatalogCursor] | None:
+    # A cursor only makes sense for the filters, sort and page size it came from.
+    view = (filters.normalized() if filters else None, _sort(), _page_size())
+    if st.session_state.get(VIEW_KEY) != view:
+        st.session_state[VIEW_KEY] = view
+        _reset_paging()
+    return st.session_state.get(CURSOR_KEY)
+
+
+def _go(direction: str, cursor: queries.CatalogCursor, step: int) -> None:
+    st.session_state[CURSOR_KEY] = (direction, cursor)
+    st.session_state[PAGE_NUMBER_KEY] = max(1, st.session_state.get(PAGE_NUMBER_KEY, 1) + step)
+
+
+def data_tasks(filters: FilterState | None) -> dict:
+    # Read through session state so the page can prefetch before the controls are drawn.
+    position = _current_cursor(filters)
+    sort, page_size = _sort(), _page_size()
+    after = before = None
+    if position is not None:
+        direction, cursor = position
+        if direction == "before":
+            before = cursor
+        else:
+            after = cursor
+    return {
+        "titles_page": lambda: queries.fetch_titles_page(
+            filters, sort=sort, page_size=page_size, after=after, before=before
+        )
+    }
+
+
+def render(filters: FilterState | None, data: SectionData | None = None) -> None:
     st.subheader("Filtered Title Catalog")
-    limit = st.slider("Max rows", min_value=50, max_value=500, value=250, step=50)
-    table_df = queries.fetch_titles_table(filters, limit)
-    if table_df.empty:
+    sort_col, size_col = st.columns(2)
+    with sort_col:
+        st.selectbox(
+            "Sort by",
+            options=list(queries.CATALOG_SORTS),
+            format_func=queries.CATALOG_SORTS.get,
+            key=SORT_KEY,
+        )
+    with size_col:
+        st.selectbox("Rows per page", options=PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key=PAGE_SIZE_KEY)
+
+    data = ensure_data(data, data_tasks(filters))
+    page = section_result(data, "titles_page", "title catalog")
+    if page is None:
+        return
+    if page.rows.empty:
         st.info("No titles match the current filters.")
+        if st.session_state.get(CURSOR_KEY) is not None:
+            st.button("First page", on_click=_reset_paging, key="catalog_first_empty")
         return
 
-    st.dataframe(table_df, width='stretch')
+    st.dataframe(page.rows, width='stretch')
+
+    first_col, prev_col, page_col, next_col = st.columns([1, 1, 2, 1])
+    with first_col:
+        st.button(
+            "First",
+            on_click=_reset_paging,
+            disabled=page.previous_cursor is None,
+            key="catalog_first",
+        )
+    with prev_col:
+        st.button(
+            "Previous",
+            on_click=_go,
+            args=("before", page.previous_cursor, -1),
+            disabled=page.previous_cursor is None,
+            key="catalog_previous",
+        )
+    with page_col:
+        st.caption(f"Page {st.session_state.get(PAGE_NUMBER_KEY, 1)}")
+    with next_col:
+        st.button(
+            "Next",
+            on_click=_go,
+            args=("after", page.next_cursor, 1),
+            disabled=page.next_cursor is None,
+            key="catalog_next",
+        )
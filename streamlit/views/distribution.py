@@ -7,30 +7,42 @@ import streamlit as st
 
 from filters import FilterState
 import queries
+from views.section_data import SectionData, ensure_data, section_result
 
 
-def render(filters: FilterState | None) -> None:
+def data_tasks(filters: FilterState | None) -> dict:
+    return {
+        "genre_distribution": lambda: queries.fetch_genre_distribution(filters),
+        "country_distribution": lambda: queries.fetch_country_distribution(filters),
+    }
+
+
+def render(filters: FilterState | None, data: SectionData | None = None) -> None:
+    data = ensure_data(data, data_tasks(filters))
     st.subheader("Top Genres Across Platforms")
-    genre_df = queries.fetch_genre_distribution(filters)
-    if genre_df.empty:
-        st.info("No genre data for the selected filters.")
-    else:
-        name_col = "genre_name" if "genre_name" in genre_df.columns else "genre_category"
-        genre_summary = (
-            genre_df.groupby(name_col, as_index=False)["title_count"].sum().sort_values("title_count", ascending=False).head(12)
-        )
-        fig, ax = plt.subplots(figsize=(8, 5))
-        ax.barh(genre_summary[name_col], genre_summary["title_count"], color="#4C78A8")
-        ax.set_xlabel("Titles")
-        ax.invert_yaxis()
-        ax.grid(axis="x", linestyle="--", alpha=0.4)
-        fig.tight_layout()
-        st.pyplot(fig)
+    genre_df = section_result(data, "genre_distribution", "genre distribution")
+    if genre_df is not None:
+        if genre_df.empty:
+            st.info("No genre data for the selected filters.")
+        else:
+            name_col = "genre_name" if "genre_name" in genre_df.columns else "genre_category"
+            genre_summary = (
+                genre_df.groupby(name_col, as_index=False)["title_count"].sum().sort_values("title_count", ascending=False).head(12)
+            )
+            fig, ax = plt.subplots(figsize=(8, 5))
+            ax.barh(genre_summary[name_col], genre_summary["title_count"], color="#4C78A8")
+            ax.set_xlabel("Titles")
+            ax.invert_yaxis()
+            ax.grid(axis="x", linestyle="--", alpha=0.4)
+            fig.tight_layout()
+            st.pyplot(fig)
 
     st.divider()
 
     st.subheader("Production Country Spread")
-    country_df = queries.fetch_country_distribution(filters)
+    country_df = section_result(data, "country_distribution", "country distribution")
+    if country_df is None:
+        return
     if country_df.empty:
         st.info("No country data for the selected filters.")
     else:
@@ -9,22 +9,20 @@ import plotly.express as px
 
 from access import require_user
 from config import get_settings
+from filter_metadata import get_filter_options
 from filters import FilterState, render_sidebar_filters
+from prefetch import prefetch
 import queries
 from views import catalog, distribution, overview, recommendations, trends
+from views.section_data import SectionData, section_result
 
 logger = logging.getLogger(__name__)
 
 
-@st.cache_data(show_spinner=False)
-def _load_filter_options():
-    return queries.fetch_filter_options()
-
-
 def _render_sidebar() -> FilterState | None:
     st.sidebar.title("Filters")
     try:
-        filter_options = _load_filter_options()
+        filter_options = get_filter_options()
     except Exception as exc:  # pragma: no cover - bubbled to UI
         st.sidebar.error("Unable to load filter metadata.")
         raise
@@ -32,10 +30,21 @@ def _render_sidebar() -> FilterState | None:
     return render_sidebar_filters(filter_options)
 
 
-def _render_stored_procedure_preview(filters: FilterState | None) -> None:
+def _load_page_data(filters: FilterState | None) -> SectionData:
+    """Fire every section's queries at once; the section renderers only draw."""
+
+    tasks = {"stored_procedure": lambda: queries.fetch_titles_via_stored_procedure(filters)}
+    for section in (overview, distribution, trends, recommendations, catalog):
+        tasks.update(section.data_tasks(filters))
+    return prefetch(tasks, timeout=get_settings().query_timeout_seconds)
+
+
+def _render_stored_procedure_preview(data: SectionData) -> None:
     st.subheader("Stored Procedure Preview")
 
-    proc_df = queries.fetch_titles_via_stored_procedure(filters)
+    proc_df = section_result(data, "stored_procedure", "stored procedure preview")
+    if proc_df is None:
+        return
     if proc_df.empty:
         st.info("Stored procedure returned no rows for the selected filters.")
         return
@@ -99,11 +108,14 @@ def render() -> None:
     with status_col:
         st.success(f"Logged in as {user.username} ({user.role}).")
 
-    _render_stored_procedure_preview(filters)
+    with st.spinner("Loading analytics..."):
+        data = _load_page_data(filters)
+
+    _render_stored_procedure_preview(data)
     st.divider()
 
-    overview.render(filters)
-    distribution.render(filters)
-    trends.render(filters)
-    recommendations.render(filters)
-    catalog.render(filters)
+    overview.render(filters, data)
+    distribution.render(filters, data)
+    trends.render(filters, data)
+    recommendations.render(filters, data)
+    catalog.render(filters, data)
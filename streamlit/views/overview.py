@@ -7,11 +7,22 @@ import plotly.express as px
 
 from filters import FilterState
 import queries
+from views.section_data import SectionData, ensure_data, section_result
 
 
-def render(filters: FilterState | None) -> None:
-    metrics_df = queries.fetch_overview_metrics(filters)
-    if metrics_df.empty:
+def data_tasks(filters: FilterState | None) -> dict:
+    return {
+        "overview_metrics": lambda: queries.fetch_overview_metrics(filters),
+        "platform_breakdown": lambda: queries.fetch_platform_breakdown(filters),
+    }
+
+
+def render(filters: FilterState | None, data: SectionData | None = None) -> None:
+    data = ensure_data(data, data_tasks(filters))
+    metrics_df = section_result(data, "overview_metrics", "catalog metrics")
+    if metrics_df is None:
+        return
+    if metrics_df.empty or not int(metrics_df.iloc[0]["total_titles"]):
         st.info("No titles match the selected filters.")
         return
 
@@ -23,7 +34,9 @@ def render(filters: FilterState | None) -> None:
     metric_columns[2].metric("TV Shows", f"{int(metrics['tv_show_count']):,}")
     metric_columns[3].metric("Genres", f"{int(metrics['distinct_genres']):,}")
 
-    platform_df = queries.fetch_platform_breakdown(filters)
+    platform_df = section_result(data, "platform_breakdown", "platform breakdown")
+    if platform_df is None:
+        return
     if platform_df.empty:
         st.warning("No platform data available for the current filters.")
         return
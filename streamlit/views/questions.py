@@ -7,6 +7,9 @@ import plotly.express as px
 import streamlit as st
 
 import queries
+from config import get_settings
+from prefetch import prefetch
+from views.section_data import section_result
 
 Q1_SQL = """
 SELECT
@@ -472,26 +475,39 @@ By contrast, Hulu and Netflix are clearly maturity-skewed. Hulu has 2,252 classi
 
 
 def render_all() -> None:
-    _render_q1()
-    st.divider()
-    _render_q2()
-    st.divider()
-    _render_q3()
-    st.divider()
-    _render_q4()
-    st.divider()
-    _render_q5()
-    st.divider()
-    _render_q6()
-    st.divider()
-    _render_q7()
-    st.divider()
-    _render_q8()
-
-
-def _render_q1() -> None:
+    # Q1 and Q2 share the platform breakdown, so each query is dispatched once.
+    data = prefetch(
+        {
+            "platform_breakdown": lambda: queries.fetch_platform_breakdown(None),
+            "country_diversity": queries.fetch_country_diversity_by_service,
+            "country_distribution": lambda: queries.fetch_country_distribution(None),
+            "genre_distribution": lambda: queries.fetch_genre_distribution(None),
+            "genre_uniqueness": queries.fetch_genre_uniqueness,
+            "rating_distribution": queries.fetch_rating_distribution,
+            "maturity_mix": queries.fetch_maturity_mix,
+        },
+        timeout=get_settings().query_timeout_seconds,
+    )
+
+    sections = [
+        ("platform_breakdown", "platform breakdown", _render_q1),
+        ("platform_breakdown", "platform breakdown", _render_q2),
+        ("country_diversity", "country diversity", _render_q3),
+        ("country_distribution", "country distribution", _render_q4),
+        ("genre_distribution", "genre distribution", _render_q5),
+        ("genre_uniqueness", "genre uniqueness", _render_q6),
+        ("rating_distribution", "rating distribution", _render_q7),
+        ("maturity_mix", "maturity mix", _render_q8),
+    ]
+    for position, (key, label, render_question) in enumerate(sections):
+        if position:
+            st.divider()
+        df = section_result(data, key, label)
+        if df is not None:
+            render_question(df)
+
+def _render_q1(df: pd.DataFrame) -> None:
     st.header("Q1. How many titles does each streaming service offer?")
-    df = queries.fetch_platform_breakdown(None)
     if df.empty:
         st.warning("No catalog data is available.")
         return
@@ -545,9 +561,8 @@ def _render_q1() -> None:
 
 
 
-def _render_q2() -> None:
+def _render_q2(df: pd.DataFrame) -> None:
     st.header("Q2. How does the movie/TV show ratio differ across platforms?")
-    df = queries.fetch_platform_breakdown(None)
     if df.empty:
         st.warning("No catalog data is available.")
         return
@@ -591,9 +606,8 @@ def _render_q2() -> None:
         st.markdown(f"## Static Analysis:\n{Q2_TEXT}")
 
 
-def _render_q3() -> None:
+def _render_q3(df: pd.DataFrame) -> None:
     st.header("Q3. How many countries are represented per service?")
-    df = queries.fetch_country_diversity_by_service()
     if df.empty:
         st.warning("No country diversity data is available.")
         return
@@ -630,9 +644,8 @@ def _render_q3() -> None:
         st.markdown(f"## Static Analysis:\n{Q3_TEXT}")
 
 
-def _render_q4() -> None:
+def _render_q4(df: pd.DataFrame) -> None:
     st.header("Q4. Which countries contribute the most titles across all platforms?")
-    df = queries.fetch_country_distribution(None)
     if df.empty:
         st.warning("No country contribution data is available.")
         return
@@ -661,9 +674,8 @@ def _render_q4() -> None:
 
 
 
-def _render_q5() -> None:
+def _render_q5(df: pd.DataFrame) -> None:
     st.header("Q5. What are the most common genres overall?")
-    df = queries.fetch_genre_distribution(None)
     if df.empty:
         st.warning("No genre information is available.")
         return
@@ -693,9 +705,8 @@ def _render_q5() -> None:
         st.markdown(f"## Static Analysis:\n{Q5_TEXT}")
 
 
-def _render_q6() -> None:
+def _render_q6(df: pd.DataFrame) -> None:
     st.header("Q6. Which genres are most unique or exclusive to individual platforms?")
-    df = queries.fetch_genre_uniqueness()
     if df.empty:
         st.warning("No genre uniqueness data is available.")
         return
@@ -786,9 +797,8 @@ def _render_q6() -> None:
         st.markdown(f"## Static Analysis:\n{Q6_TEXT}")
 
 
-def _render_q7() -> None:
+def _render_q7(df: pd.DataFrame) -> None:
     st.header("Q7. How do the streaming services differ in the distribution of maturity ratings?")
-    df = queries.fetch_rating_distribution()
     if df.empty:
         st.warning("No maturity rating data is available.")
         return
@@ -836,11 +846,10 @@ def _render_q7() -> None:
 
 
 
-def _render_q8() -> None:
+def _render_q8(df: pd.DataFrame) -> None:
     st.header(
         "Q8. How do the relative shares of family (G/PG) versus mature (PG-13+/R) titles differ across services?"
     )
-    df = queries.fetch_maturity_mix()
     if df.empty:
         st.warning("No maturity breakdown data is available.")
         return
@@ -3,20 +3,54 @@
 from __future__ import annotations
 
 import streamlit as st
+from sqlalchemy.exc import DBAPIError
 
 from filters import FilterState
 import queries
+from title_search import get_title_search_index, title_search_index_enabled
+from views.section_data import SectionData, ensure_data, section_result
 
+ANCHOR_KEY = "recommendations_anchor"
 
-def render(filters: FilterState | None) -> None:
+
+def _anchor_term() -> str:
+    # Read through session state so the page can prefetch before the widget is drawn.
+    return str(st.session_state.get(ANCHOR_KEY, "")).strip()
+
+
+def _anchor_preview(search_term: str) -> list[str]:
+    if not title_search_index_enabled():
+        return []
+    try:
+        return [name for _, name in get_title_search_index().ranked_matches(search_term, limit=5)]
+    except DBAPIError:
+        return []
+
+
+def data_tasks(filters: FilterState | None) -> dict:
+    search_term = _anchor_term()
+    if not search_term:
+        return {}
+    return {"similarity_candidates": lambda: queries.fetch_similarity_candidates(filters, search_term)}
+
+
+def render(filters: FilterState | None, data: SectionData | None = None) -> None:
     st.subheader("Find Similar Titles")
-    search_term = st.text_input("Anchor title keyword", placeholder="e.g. marvel").strip()
+    st.text_input("Anchor title keyword", placeholder="e.g. marvel", key=ANCHOR_KEY)
+    search_term = _anchor_term()
 
     if not search_term:
         st.caption("Enter a keyword to surface titles that share the most genres.")
         return
 
-    matches = queries.fetch_similarity_candidates(filters, search_term)
+    anchors = _anchor_preview(search_term)
+    if anchors:
+        st.caption("Anchor titles: " + ", ".join(anchors))
+
+    data = ensure_data(data, data_tasks(filters))
+    matches = section_result(data, "similarity_candidates", "similar titles")
+    if matches is None:
+        return
     if matches.empty:
         st.warning("No similar titles found for that keyword.")
         return
@@ -0,0 +1,39 @@
+"""Helpers for section renderers that draw from prefetched query results."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Mapping
+
+import streamlit as st
+
+from config import get_settings
+from prefetch import PrefetchResult, QueryTimeoutError, prefetch
+
+logger = logging.getLogger(__name__)
+
+SectionData = Mapping[str, PrefetchResult]
+
+
+def ensure_data(data: SectionData | None, tasks: Mapping[str, Callable[[], Any]]) -> SectionData:
+    """Return the page-level results, or fetch this section's queries on its own."""
+
+    if data is None:
+        return prefetch(tasks, timeout=get_settings().query_timeout_seconds)
+    return data
+
+
+def section_result(data: SectionData, key: str, label: str) -> Any | None:
+    """Unwrap one result, surfacing failures inline instead of aborting the page."""
+
+    result = data.get(key)
+    if result is None:
+        return None
+    if result.ok:
+        return result.value
+    if isinstance(result.error, QueryTimeoutError):
+        st.warning(f"{label} took too long to load. Try narrowing the filters.")
+    else:
+        logger.error("Failed to load %s", label, exc_info=result.error)
+        st.error(f"Unable to load {label}.")
+    return None
@@ -7,29 +7,41 @@ import plotly.express as px
 
 from filters import FilterState
 import queries
+from views.section_data import SectionData, ensure_data, section_result
 
 
-def render(filters: FilterState | None) -> None:
+def data_tasks(filters: FilterState | None) -> dict:
+    return {
+        "release_year_trend": lambda: queries.fetch_release_year_trend(filters),
+        "date_added_trend": lambda: queries.fetch_date_added_trend(filters),
+    }
+
+
+def render(filters: FilterState | None, data: SectionData | None = None) -> None:
+    data = ensure_data(data, data_tasks(filters))
     st.subheader("Release Year Momentum")
-    release_df = queries.fetch_release_year_trend(filters)
-    if release_df.empty:
-        st.info("No release year data for the selected filters.")
-    else:
-        fig_release = px.line(
-            release_df,
-            x="release_year",
-            y="title_count",
-            color="service_name",
-            markers=True,
-            labels={"release_year": "Release Year", "title_count": "Titles", "service_name": "Platform"},
-            title="Catalog growth by original release year",
-        )
-        st.plotly_chart(fig_release, width='stretch')
+    release_df = section_result(data, "release_year_trend", "release year trend")
+    if release_df is not None:
+        if release_df.empty:
+            st.info("No release year data for the selected filters.")
+        else:
+            fig_release = px.line(
+                release_df,
+                x="release_year",
+                y="title_count",
+                color="service_name",
+                markers=True,
+                labels={"release_year": "Release Year", "title_count": "Titles", "service_name": "Platform"},
+                title="Catalog growth by original release year",
+            )
+            st.plotly_chart(fig_release, width='stretch')
 
     st.divider()
 
     st.subheader("When Titles Hit Platforms")
-    added_df = queries.fetch_date_added_trend(filters)
+    added_df = section_result(data, "date_added_trend", "monthly additions")
+    if added_df is None:
+        return
     if added_df.empty:
         st.info("No ingestion timing data available.")
         return
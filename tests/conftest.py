@@ -0,0 +1,13 @@
+"""Make the dashboard and ETL modules importable the way their scripts import them."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+for directory in ("streamlit", "data_wrangling"):
+    path = str(_PROJECT_ROOT / directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)